@@ -0,0 +1 @@
+"""Performance suite for jsonq; run with ``python -m benchmarks.run``."""
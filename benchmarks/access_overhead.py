@@ -0,0 +1,74 @@
+"""Per-call cost of ``Q(doc).path(...).get()`` versus hand-written dict access.
+
+Usage: python -m benchmarks.access_overhead [calls]
+
+Each case runs ``calls`` times per repeat and reports the best repeat in
+nanoseconds per call, plus the ratio to the hand-written version of the same
+lookup (subscripts with a try/except default, as request handlers write it).
+"""
+from __future__ import annotations
+import sys
+import timeit
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from jsonq import Q
+
+# A typical 1-5 KB request payload.
+DOC = {
+    "request": {
+        "id": "req-7f3a",
+        "user": {"id": 7, "tags": ["a", "b", "c"], "profile": {"email": "x@example.com", "name": "Ada"}},
+        "items": [{"sku": f"sku-{i}", "qty": i, "price": 9.5 * i} for i in range(20)],
+    },
+    "meta": {"version": 3, "source": "api", "trace": "0" * 64},
+}
+
+
+def _by_hand(doc: Any) -> Any:
+    try:
+        return doc["request"]["user"]["profile"]["email"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _by_hand_index(doc: Any) -> Any:
+    try:
+        return doc["request"]["user"]["tags"][1]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _by_hand_miss(doc: Any) -> Any:
+    try:
+        return doc["request"]["session"]["id"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+# (name, jsonq call, hand-written equivalent)
+CASES: List[Tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+    ("path 4 keys", lambda: Q(DOC).path("request.user.profile.email").get(), lambda: _by_hand(DOC)),
+    ("path key+index", lambda: Q(DOC).path("request.user.tags[1]").get(), lambda: _by_hand_index(DOC)),
+    ("path miss", lambda: Q(DOC).path("request.session.id").get(), lambda: _by_hand_miss(DOC)),
+    ("[] x4", lambda: Q(DOC)["request"]["user"]["profile"]["email"].get(), lambda: _by_hand(DOC)),
+]
+
+
+def best_ns(fn: Callable[[], Any], calls: int, repeat: int = 7) -> float:
+    return min(timeit.repeat(fn, number=calls, repeat=repeat)) / calls * 1e9
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    calls = int(args[0]) if args else 100_000
+    print(f"{'case':<16} {'jsonq ns':>10} {'hand ns':>10} {'ratio':>7}")
+    for name, ours, hand in CASES:
+        if ours() != hand():
+            raise AssertionError(f"{name}: results differ")
+        q_ns, hand_ns = best_ns(ours, calls), best_ns(hand, calls)
+        print(f"{name:<16} {q_ns:>10.0f} {hand_ns:>10.0f} {q_ns / hand_ns:>6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
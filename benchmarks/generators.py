@@ -0,0 +1,61 @@
+"""Deterministic synthetic documents for the benchmark suite."""
+from __future__ import annotations
+import random
+from typing import Any, Callable, Dict, List
+
+LEVELS = ("debug", "info", "warn", "error")
+
+
+def records(n: int, *, seed: int = 0) -> List[Dict[str, Any]]:
+    """Uniform user-like records with a nested profile and a tag list."""
+
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "age": rng.randint(18, 90),
+            "score": rng.random() * 100,
+            "active": rng.random() < 0.5,
+            "level": LEVELS[i % len(LEVELS)],
+            "tags": [f"t{rng.randint(0, 20)}" for _ in range(3)],
+            "profile": {"email": f"user{i}@example.com", "city": f"c{rng.randint(0, 50)}"},
+        }
+        for i in range(n)
+    ]
+
+
+def sparse_records(n: int, *, missing_rate: float = 0.4, seed: int = 0) -> List[Any]:
+    """Heterogeneous records: keys dropped at ``missing_rate``, mixed value types, stray scalars."""
+
+    rng = random.Random(seed)
+    out: List[Any] = []
+    for rec in records(n, seed=seed):
+        if rng.random() < 0.02:
+            out.append(rng.choice([None, 0, "x", []]))
+            continue
+        kept = {k: v for k, v in rec.items() if k == "id" or rng.random() >= missing_rate}
+        if "score" in kept and rng.random() < 0.1:
+            kept["score"] = str(kept["score"])
+        out.append(kept)
+    return out
+
+
+def wide_dict(n_keys: int, *, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {f"k{i}": {"v": rng.randint(0, 1000), "s": f"s{i}"} for i in range(n_keys)}
+
+
+def deep(depth: int, *, fanout: int = 2) -> Dict[str, Any]:
+    """Nested dicts ``depth`` levels deep; every level has ``fanout`` children."""
+
+    node: Dict[str, Any] = {"leaf": 1}
+    for level in range(depth):
+        node = {f"c{j}": node for j in range(fanout)} | {"level": level}
+    return node
+
+
+SHAPES: Dict[str, Callable[[int], Any]] = {
+    "records": records,
+    "sparse": sparse_records,
+}
@@ -0,0 +1,183 @@
+"""Time every Q operation over synthetic shapes and compare against a baseline.
+
+Usage:
+    python -m benchmarks.run                          # 1K and 100K records
+    python -m benchmarks.run --sizes 1000,1000000,10000000 --only pluck,filter
+    python -m benchmarks.run --save benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.2
+
+Each case reports the best wall time of ``--repeat`` runs and the peak
+``tracemalloc`` allocation of one extra traced run. With ``--baseline`` the
+process exits non-zero when any case is slower (or allocates more) than the
+baseline by more than ``--threshold``.
+"""
+from __future__ import annotations
+import argparse
+import copy
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from jsonq import Q
+from jsonq.ops.diff import diff, patch
+from jsonq.ops.serialize import to_json
+
+from . import generators
+
+Thunk = Callable[[], Any]
+
+
+@dataclass
+class Case:
+    name: str
+    op: str
+    setup: Callable[[], Thunk]
+
+
+def _mutated(data: List[Any]) -> List[Any]:
+    out = copy.deepcopy(data)
+    step = max(1, len(out) // 20)
+    for i in range(0, len(out), step):
+        if isinstance(out[i], dict):
+            out[i]["age"] = -1
+    out.insert(len(out) // 2, {"id": -1})
+    if len(out) > 3:
+        del out[3]
+    return out
+
+
+def record_cases(shape: str, size: int) -> List[Case]:
+    cache: Dict[str, Any] = {}
+
+    def data() -> List[Any]:
+        if "data" not in cache:
+            cache["data"] = generators.SHAPES[shape](size)
+        return cache["data"]
+
+    def ops() -> Any:
+        if "ops" not in cache:
+            cache["b"] = _mutated(data())
+            cache["ops"] = diff(data(), cache["b"])
+        return cache["ops"]
+
+    def age(r: Any) -> Any:
+        return r.get("age", 0) if isinstance(r, dict) else 0
+
+    tag = f"{shape}/{size}"
+
+    def case(op: str, fn: Thunk, prepare: Callable[[], Any] = data) -> Case:
+        # Build inputs in setup so generation is never part of the timing.
+        return Case(f"{op}/{tag}", op, lambda: (prepare(), fn)[1])
+
+    cases = [
+        case("path", lambda: Q(data()).path("profile.email").list()),
+        case("pluck", lambda: Q(data()).pluck("name").list()),
+        case("filter", lambda: Q(data()).filter(lambda r: r["active"]).list()),
+        case("map", lambda: Q(data()).map(lambda r: r["age"] * 2).list()),
+        case("sort_by", lambda: Q(data()).sort_by(age).list()),
+        case("unique", lambda: Q(data()).unique(age).list()),
+        case("flat", lambda: Q(data()).map(lambda r: r["tags"]).flat().list()),
+        case("to_json", lambda: to_json(data())),
+    ]
+    if size <= 1_000_000:
+        cases += [
+            case("diff", lambda: diff(data(), cache["b"]), prepare=ops),
+            case("patch", lambda: patch(data(), cache["ops"]), prepare=ops),
+        ]
+    return cases
+
+
+def document_cases() -> List[Case]:
+    wide = generators.wide_dict(10_000)
+    nested = generators.deep(12)
+    deep_path = ".".join(["c1"] * 12) + ".leaf"
+
+    def repeat(fn: Thunk, n: int = 1000) -> Thunk:
+        def run() -> None:
+            for _ in range(n):
+                fn()
+
+        return run
+
+    wide_b = dict(wide, k5={"v": -1, "s": "x"})
+    return [
+        Case("path/wide_dict", "path", lambda: repeat(lambda: Q(wide).path("k5000.v").get())),
+        Case("path/deep", "path", lambda: repeat(lambda: Q(nested).path(deep_path).get())),
+        Case("to_json/wide_dict", "to_json", lambda: lambda: to_json(wide)),
+        Case("diff/wide_dict", "diff", lambda: lambda: diff(wide, wide_b)),
+    ]
+
+
+def measure(case: Case, repeat: int) -> Dict[str, float]:
+    fn = case.setup()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    regressions: List[str] = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if before[metric] and now[metric] > before[metric] * (1 + threshold):
+                ratio = now[metric] / before[metric]
+                regressions.append(f"{name}: {metric} {ratio:.2f}x baseline")
+    return regressions
+
+
+def select(cases: Iterable[Case], only: Optional[List[str]]) -> List[Case]:
+    return [c for c in cases if not only or c.op in only]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,100000", help="comma-separated record counts")
+    parser.add_argument("--shapes", default=",".join(generators.SHAPES), help="record shapes to run")
+    parser.add_argument("--only", default="", help="comma-separated ops (path,pluck,filter,...)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", help="JSON baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown ratio (0.25 = 25%%)")
+    parser.add_argument("--save", help="write results as a new baseline")
+    args = parser.parse_args(argv)
+
+    only = [op for op in args.only.split(",") if op] or None
+    cases: List[Case] = []
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        for shape in (s for s in args.shapes.split(",") if s):
+            cases += record_cases(shape, size)
+    cases += document_cases()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for case in select(cases, only):
+        results[case.name] = res = measure(case, args.repeat)
+        print(f"{case.name:<32} {res['seconds'] * 1000:>10.2f} ms {res['peak_bytes'] / 1e6:>10.2f} MB", flush=True)
+
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as fp:
+            regressions = compare(results, json.load(fp), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
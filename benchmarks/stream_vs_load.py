@@ -0,0 +1,70 @@
+"""Peak RSS of ``json.load`` versus ``Q.from_json_stream`` on one large array.
+
+Usage: python benchmarks/stream_vs_load.py [records]
+
+Each measurement runs in a fresh interpreter so ``ru_maxrss`` is not shared.
+"""
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD = """
+import json, sys
+with open(sys.argv[1], "rb") as fp:
+    doc = json.load(fp)
+print(sum(1 for r in doc["data"]["items"] if r["level"] == "error"))
+"""
+
+STREAM = """
+import sys
+from jsonq import Q
+q = Q.from_json_stream(sys.argv[1]).path("data.items").filter(lambda r: r["level"] == "error")
+print(sum(1 for _ in q))
+"""
+
+PEAK = """
+import resource, sys
+sys.argv = sys.argv[1:]
+exec(sys.argv[0])
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_document(path: str, records: int) -> None:
+    with open(path, "w") as fp:
+        fp.write('{"meta": {"source": "bench"}, "data": {"items": [')
+        for i in range(records):
+            if i:
+                fp.write(",")
+            level = "error" if i % 100 == 0 else "info"
+            fp.write(json.dumps({"id": i, "level": level, "msg": f"event {i}", "tags": ["a", "b"]}))
+        fp.write("]}}")
+
+
+def measure(script: str, path: str) -> tuple:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", PEAK, script, path], capture_output=True, text=True, env=env, check=True
+    ).stdout.split()
+    return int(out[0]), int(out[1])
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "doc.json")
+        write_document(path, records)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{records} records, {size_mb:.1f} MB")
+        for name, script in (("json.load", LOAD), ("from_json_stream", STREAM)):
+            matches, rss_kb = measure(script, path)
+            print(f"{name:>18}: matches={matches} peak_rss={rss_kb / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@
 
 Expose Q facade and key utilities. Internals live under jsonq.core / jsonq.ops.
 """
-from .api import Q, jx  # noqa: F401
+from .api import AsyncQ, Dataset, GroupBy, Indexed, LazyQ, MappedQ, Q, jx  # noqa: F401
+from .core.cache import ResultCache  # noqa: F401
 from .core.missing import MISSING, MissingMode  # noqa: F401
+from .ops.load import LoadStats  # noqa: F401
 
-__all__ = ["Q", "jx", "MISSING", "MissingMode"]
+__all__ = ["Q", "LazyQ", "AsyncQ", "Dataset", "GroupBy", "Indexed", "MappedQ", "ResultCache", "LoadStats", "jx", "MISSING", "MissingMode"]
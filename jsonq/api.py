@@ -1,71 +1,365 @@
 from __future__ import annotations
-from typing import Any, Callable, List, Optional
+import os
+from dataclasses import replace as _dataclass_replace
+from functools import lru_cache
+from typing import IO, Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from .core.value import JsonValue
 from .core.missing import MISSING, MissingMode
-from .core.path import tokenize_path
-from .core.access import apply_path
-from .ops.serialize import to_json as _to_json, pretty as _pretty
+from .core.aio import AnyIterable, AsyncFn, _close, adrop_missing, aexpand, afilter_iter, aiterate, amap_iter
+from .core.cache import ResultCache, step_key
+from .core.groupby import AggSpec, GroupKey, group_aggregate
+from .core.index import RecordIndex
+from .core.join import JoinKeys, hash_join
+from .core.order import SortSpec
+from .core.project import as_fields
+from .core.predicate import Where
+from .core.plan import ItemSource, Stage, execute as _execute, explain as _explain, item_runner
+from .core.path import Descend, Wildcard, is_plain, parse_path
+from .core.traverse import compile_matcher, compile_steps
+from .core.access import compile_path, get_raw
+from .ops.serialize import (
+    dump as _dump,
+    iter_json as _iter_json,
+    iter_json_array as _iter_json_array,
+    pretty as _pretty,
+    to_json as _to_json,
+)
+from .ops import dataset as _dataset
 from .ops.diff import diff as _diff, patch as _patch
+from .ops.load import LoadStats, load as _load
+from .ops.mapped import MappedDocument, Node, iter_materialized, materialize, select as _select
+from .ops.stream import ArrayStream, LineStream, Source as _StreamSource
 from .operators import JsonOperator
 from .operators import access as access_ops
 from .operators import seq as seq_ops
 from .operators import missing as missing_ops
+from .operators import profile as _profile
+from .operators.query import compile_query
+
+_active_profiler = _profile.ACTIVE.get
 
 
 class Q:
     """Thin public facade that delegates to modular internals."""
 
+    # The current raw value lives in ``_val``; ``_base`` carries the policy
+    # (and columns while the value is unchanged). The JsonValue for ``_val`` is
+    # only built when an operator needs it, so plain access chains allocate
+    # no wrappers besides the Q itself.
+    __slots__ = ("_base", "_val", "_ctx")
+
     def __init__(self, data: Any, *, mode: MissingMode = MissingMode.DROP, strict: bool = False):
-        if isinstance(data, JsonValue):
-            self._v = data
+        if data.__class__ is JsonValue:
+            self._base = data
+            self._val = data.value
         else:
-            self._v = JsonValue(data, mode=mode, strict=strict)
+            self._base = _DEFAULT_POLICY if mode is _DROP and not strict else _policy(mode, strict)
+            self._val = data
+        # (cache, document, token, plan so far) for chains built by Q.cached
+        self._ctx: Optional[Tuple[ResultCache, Any, Any, Tuple[Any, ...]]] = None
+
+    @property
+    def _v(self) -> JsonValue:
+        base = self._base
+        if self._val is not base.value:
+            base = self._base = base.replace(value=self._val)
+        return base
+
+    @staticmethod
+    def cached(
+        data: Any,
+        cache: ResultCache,
+        *,
+        version: Any = None,
+        mode: MissingMode = MissingMode.DROP,
+        strict: bool = False,
+    ) -> "Q":
+        """Q whose chain steps are memoized in ``cache`` per (document, version, step prefix)."""
+        q = Q(data, mode=mode, strict=strict)
+        q._ctx = (cache, data, (id(data), version, mode, strict), ())
+        return q
+
+    def _step(self, key: Tuple[Any, ...], operator: JsonOperator) -> "Q":
+        ctx = self._ctx
+        if ctx is None:
+            return self.apply(operator)
+        step = step_key(*key)
+        if step is None:
+            return self.apply(operator)
+        cache, doc, token, plan = ctx
+        plan = plan + (step,)
+        out = Q(cache.run(doc, token, plan, lambda: self.apply(operator)._v))
+        out._ctx = (cache, doc, token, plan)
+        return out
+
+    @staticmethod
+    def from_ndjson(
+        source: _StreamSource, *, mode: MissingMode = MissingMode.DROP, strict: bool = False
+    ) -> "LazyQ":
+        """Stream records from an NDJSON path or file object through a lazy chain."""
+        return LazyQ(JsonValue([], mode=mode, strict=strict), source=LineStream(source))
+
+    @staticmethod
+    def from_json_stream(
+        source: _StreamSource,
+        *,
+        chunk_size: int = 1 << 16,
+        mode: MissingMode = MissingMode.DROP,
+        strict: bool = False,
+    ) -> "LazyQ":
+        """Stream the elements of a large JSON array document through a lazy chain.
+
+        Leading ``path``/``pluck`` keys are resolved by the parser, so
+        ``Q.from_json_stream(f).path("data.items")`` only decodes one item at a time.
+        """
+        stream = ArrayStream(source, mode=mode, chunk_size=chunk_size)
+        return LazyQ(JsonValue([], mode=mode, strict=strict), source=stream)
+
+    @staticmethod
+    def from_async_iter(
+        source: AnyIterable, *, mode: MissingMode = MissingMode.DROP, strict: bool = False
+    ) -> "AsyncQ":
+        """Chain over an async (or sync) iterable, consumed with ``async for``."""
+        return AsyncQ(source, JsonValue([], mode=mode, strict=strict))
+
+    @staticmethod
+    def open(
+        path: str, *, mmap: bool = True, mode: MissingMode = MissingMode.DROP, strict: bool = False
+    ) -> "MappedQ":
+        """Open a JSON file for lazy access; only the nodes reached by access steps are decoded."""
+        return MappedQ(MappedDocument(path, use_mmap=mmap), JsonValue(None, mode=mode, strict=strict))
+
+    @staticmethod
+    def load(
+        source: _StreamSource,
+        *,
+        intern_keys: bool = True,
+        dedupe_values: Optional[str] = None,
+        max_subtree: int = 16,
+        ndjson: bool = False,
+        stats: Optional[LoadStats] = None,
+        mode: MissingMode = MissingMode.DROP,
+        strict: bool = False,
+    ) -> "Q":
+        """Load a JSON/NDJSON path or file object, sharing repeated keys (and optionally values).
+
+        ``dedupe_values="scalars"`` shares equal strings and numbers;
+        ``"subtrees"`` also shares small equal containers, which must then
+        not be mutated. Pass a ``LoadStats`` as ``stats`` to see what was shared.
+        """
+        value = _load(
+            source,
+            intern_keys=intern_keys,
+            dedupe_values=dedupe_values,
+            max_subtree=max_subtree,
+            ndjson=ndjson,
+            stats=stats,
+        )
+        return Q(value, mode=mode, strict=strict)
+
+    @staticmethod
+    def scan(
+        paths: _dataset.Paths,
+        *,
+        workers: Optional[int] = None,
+        executor: str = "process",
+        shard_bytes: int = 64 << 20,
+        mode: MissingMode = MissingMode.DROP,
+        strict: bool = False,
+    ) -> "Dataset":
+        """Chain over every JSON/NDJSON file matching ``paths``, run shard-by-shard on a pool.
+
+        NDJSON files (``.ndjson``/``.jsonl``) larger than ``shard_bytes`` are
+        split into byte ranges; other files are one shard each.
+        """
+        shards = _dataset.plan_shards(_dataset.expand(paths), shard_bytes)
+        return Dataset(shards, JsonValue([], mode=mode, strict=strict), workers=workers, executor=executor)
 
     def apply(self, operator: JsonOperator) -> "Q":
         """Return a new Q after running the supplied JsonValue operator."""
+        profiler = _active_profiler()
+        if profiler is not None:
+            return Q(profiler.run(_profile.stage_name(operator), operator, self._v))
         return Q(operator(self._v))
 
+    def query(self, text: str) -> "Q":
+        """Run a jq-style query, e.g. ``"users[] | select(.active) | .name"``.
+
+        The query is parsed, optimized and compiled once per distinct string.
+        """
+        return self._step(("query", text), compile_query(text))
+
+    @staticmethod
+    def profile(*, memory: bool = False) -> _profile.Profiler:
+        """Context manager recording per-operator stats for code run inside it."""
+        return _profile.Profiler(memory=memory)
+
+    def lazy(self) -> "LazyQ":
+        """Record subsequent steps as a plan that runs on extraction."""
+        return LazyQ(self._v)
+
     # ----- access -----
     def __getitem__(self, key: Any) -> "Q":
-        return self.apply(access_ops.getitem(key))
+        base, val = self._base, self._val
+        # Column-backed values pluck from their columns via the operator.
+        if self._ctx is None and _active_profiler() is None and (base.columns is None or val is not base.value):
+            out = val.get(key, MISSING) if key.__class__ is str and val.__class__ is dict else MISSING
+            if out is MISSING:
+                out = get_raw(val, key, base.mode)
+            q = _new_q(Q)
+            q._base = base if base.value is MISSING else _policy(base.mode, base.strict)
+            q._val = out
+            q._ctx = None
+            return q
+        return self._step(("[]", key), access_ops.getitem(key))
 
     def pluck(self, key: str) -> "Q":
         return self[key]
 
     def path(self, expr: str) -> "Q":
-        return self.apply(access_ops.path(expr))
+        # Hot path for small documents: paths never read columns, so only the
+        # cache and profiler need the operator route.
+        if self._ctx is None and _active_profiler() is None:
+            base = self._base
+            out = _new_q(Q)
+            # Share the valueless policy so the result never pins its parent's value.
+            out._base = base if base.value is MISSING else _policy(base.mode, base.strict)
+            out._val = compile_path(expr)(self._val, base.mode)
+            out._ctx = None
+            return out
+        return self._step(("path", expr), access_ops.path(expr))
 
     def exists(self, expr: str) -> bool:
-        toks = tokenize_path(expr)
-        v = apply_path(self._v, toks)
+        if not is_plain(parse_path(expr)):
+            # Stops at the first match instead of collecting them all.
+            return any(m is not MISSING for m in compile_matcher(expr)(self._val, self._base.mode))
+        v = compile_path(expr)(self._val, self._base.mode)
         return not JsonValue.is_missing(v)
 
     # ----- transforms -----
-    def map(self, fn: Callable[[Any], Any]) -> "Q":
-        return self.apply(seq_ops.map_items(fn))
+    def map(self, fn: Callable[[Any], Any], *, workers: Optional[int] = None, executor: str = "thread") -> "Q":
+        return self._step(("map", fn), seq_ops.map_items(fn, workers=workers, executor=executor))
 
-    def filter(self, pred: Callable[[Any], bool]) -> "Q":
-        return self.apply(seq_ops.filter_items(pred))
+    def filter(
+        self, pred: Callable[[Any], bool], *, workers: Optional[int] = None, executor: str = "thread"
+    ) -> "Q":
+        return self._step(("filter", pred), seq_ops.filter_items(pred, workers=workers, executor=executor))
 
     def reject(self, pred: Callable[[Any], bool]) -> "Q":
-        return self.apply(seq_ops.reject_items(pred))
+        return self._step(("reject", pred), seq_ops.reject_items(pred))
+
+    def where(self, path: str, op: str, value: Any) -> "Q":
+        """Keep items whose ``path`` compares ``op`` to ``value``, e.g. ``where("ms", ">", 500)``.
+
+        ``op`` is one of ``== != < <= > >= in``; a missing path never matches.
+        """
+        return self._step(("where", path, op, value), seq_ops.filter_items(Where(path, op, value)))
+
+    def _present(self) -> List[Any]:
+        xs = self.list()
+        if self._v.mode is MissingMode.DROP:
+            return [x for x in xs if not JsonValue.is_missing(x)]
+        return xs
+
+    async def amap(self, fn: AsyncFn, *, concurrency: int = 8, ordered: bool = True) -> "Q":
+        """Await ``fn`` per item with at most ``concurrency`` calls in flight."""
+        out = [x async for x in amap_iter(self._present(), fn, concurrency=concurrency, ordered=ordered)]
+        return Q(self._v.replace(value=out))
+
+    async def afilter(self, pred: AsyncFn, *, concurrency: int = 8, ordered: bool = True) -> "Q":
+        out = [x async for x in afilter_iter(self._present(), pred, concurrency=concurrency, ordered=ordered)]
+        return Q(self._v.replace(value=out))
+
+    def filter_by(self, key: str, pred: Callable[[Any], bool]) -> "Q":
+        return self._step(("filter_by", key, pred), seq_ops.filter_by(key, pred))
+
+    def sort_by(self, spec: SortSpec) -> "Q":
+        """Sort by a key callable, a path (``"-path"`` for descending) or a list of paths."""
+        return self._step(("sort_by", spec), seq_ops.sort_by(spec))
+
+    def top_k(self, n: int, key: SortSpec) -> "Q":
+        """The ``n`` largest items by ``key``, largest first (heap selection, no full sort)."""
+        return self._step(("top_k", n, key), seq_ops.top_k(n, key))
+
+    def bottom_k(self, n: int, key: SortSpec) -> "Q":
+        return self._step(("bottom_k", n, key), seq_ops.bottom_k(n, key))
+
+    def group_by(self, key: GroupKey) -> "GroupBy":
+        return GroupBy(self, key)
+
+    def join(
+        self, other: Any, on: JoinKeys, *, right_on: Optional[JoinKeys] = None, how: str = "inner"
+    ) -> "Q":
+        """Hash join with ``other`` (a Q, LazyQ or list) on one or more key paths.
 
-    def sort_by(self, keyfn: Callable[[Any], Any]) -> "Q":
-        return self.apply(seq_ops.sort_by(keyfn))
+        ``other`` is the build side; matches are merged as ``{**left, **right}``.
+        """
+        right = on if right_on is None else right_on
+        rows = hash_join(self.list(), _records(other), on, right, how=how, mode=self._v.mode)
+        return Q(self._v.replace(value=list(rows)))
+
+    def select(self, *paths: str, shape: str = "dict") -> "Q":
+        """Extract several paths per record in one pass; outputs are named by path.
+
+        ``shape`` is ``"dict"`` (one dict per record), ``"tuple"`` or
+        ``"columns"`` (one ``{path: [values]}`` dict).
+        """
+        return self.project(as_fields(paths), shape)
+
+    def project(self, fields: Mapping[str, str], shape: str = "dict") -> "Q":
+        """Like ``select`` with explicit output names: ``{"email": "profile.email"}``."""
+        return self._step(("project", dict(fields), shape), seq_ops.project(fields, shape))
+
+    def index_by(self, path: str, *, ordered: bool = False) -> "Indexed":
+        """Index the records by ``path`` for repeated ``lookup``/``where``/``between`` calls."""
+        return Indexed(self, path, ordered=ordered)
+
+    def columnar(self) -> "Q":
+        """Back a list of records with per-field columns for pluck/filter_by/sort_by."""
+        return self._step(("columnar",), seq_ops.columnar())
 
     def unique(self, keyfn: Optional[Callable[[Any], Any]] = None) -> "Q":
-        return self.apply(seq_ops.unique(keyfn))
+        return self._step(("unique", keyfn), seq_ops.unique(keyfn))
 
     def flat(self) -> "Q":
-        return self.apply(seq_ops.flat())
+        return self._step(("flat",), seq_ops.flat())
+
+    # ----- aggregation -----
+    def _agg(self, name: str, key: Optional[str], **options: Any) -> Any:
+        return self.apply(seq_ops.aggregate(name, key, **options))._v.value
+
+    def count(self, key: Optional[str] = None) -> int:
+        return self._agg("count", key)
+
+    def sum(self, key: Optional[str] = None) -> Any:
+        return self._agg("sum", key)
+
+    def mean(self, key: Optional[str] = None) -> Any:
+        return self._agg("mean", key)
+
+    def min(self, key: Optional[str] = None) -> Any:
+        return self._agg("min", key)
+
+    def max(self, key: Optional[str] = None) -> Any:
+        return self._agg("max", key)
+
+    def percentile(self, q: Any = 50, key: Optional[str] = None) -> Any:
+        return self._agg("percentile", key, q=q)
+
+    def histogram(self, bins: int = 10, key: Optional[str] = None) -> Any:
+        return self._agg("histogram", key, bins=bins)
 
     # ----- extraction -----
     def get(self, default: Any = None) -> Any:
-        return self._v.get(default)
+        val = self._val
+        return default if val is MISSING else val
 
     def list(self) -> List[Any]:
-        return self._v.as_list()
+        val = self._val
+        if val is MISSING:
+            return []
+        return val if isinstance(val, list) else [val]
 
     def first(self, default: Any = None) -> Any:
         xs = self.list()
@@ -73,28 +367,35 @@ class Q:
 
     # ----- serialization -----
     def to_json(self, indent: Optional[int] = None) -> str:
-        return _to_json(self._v.unwrap(), indent=indent)
+        return _to_json(self._val, indent=indent)
 
     def pretty(self, indent: int = 2) -> None:
-        _pretty(self._v.unwrap(), indent=indent)
+        _pretty(self._val, indent=indent)
+
+    def iter_json(self, indent: Optional[int] = None) -> Iterator[str]:
+        """Yield the JSON text in chunks instead of building one string."""
+        return _iter_json(self._val, indent=indent)
+
+    def dump(self, fp: IO[str], indent: Optional[int] = None) -> None:
+        _dump(self._val, fp, indent=indent)
 
     # ----- missing policy -----
     def keep_missing(self) -> "Q":
-        return self.apply(missing_ops.keep())
+        return self._step(("keep_missing",), missing_ops.keep())
 
     def drop_missing(self) -> "Q":
-        return self.apply(missing_ops.drop())
+        return self._step(("drop_missing",), missing_ops.drop())
 
     def assert_present(self) -> "Q":
         self._v.assert_present()
         return self
 
     def fill_missing(self, value: Any) -> "Q":
-        return self.apply(missing_ops.fill(value))
+        return self._step(("fill_missing", value), missing_ops.fill(value))
 
     def coalesce(self, *paths: str, default: Any = None) -> Any:
         for p in paths:
-            value = self.path(p).get(MISSING)
+            value = compile_path(p)(self._v.value, self._v.mode)
             if not JsonValue.is_missing(value):
                 return value
         return default
@@ -109,6 +410,512 @@ class Q:
         return _patch(a, ops)
 
 
+_new_q = object.__new__
+
+
+@lru_cache(maxsize=None)
+def _policy(mode: MissingMode, strict: bool) -> JsonValue:
+    """Shared valueless JsonValue carrying a (mode, strict) policy."""
+    return JsonValue(MISSING, mode=mode, strict=strict)
+
+
+_DROP = MissingMode.DROP
+_DEFAULT_POLICY = _policy(_DROP, False)
+
+
+class LazyQ:
+    """Deferred Q: records a chain and executes it in fused passes on extraction."""
+
+    def __init__(
+        self,
+        v: JsonValue,
+        *,
+        source: Optional[ItemSource] = None,
+        stages: Tuple[Stage, ...] = (),
+    ):
+        self._v = v
+        self._source = source
+        self._stages = stages
+
+    def _then(self, kind: str, arg: Any = None) -> "LazyQ":
+        return LazyQ(self._v, source=self._source, stages=self._stages + (Stage(kind, arg),))
+
+    def _run(self):
+        return _execute(self._v, self._stages, self._source)
+
+    @property
+    def plan(self) -> Tuple[Stage, ...]:
+        return self._stages
+
+    def explain(self) -> str:
+        return _explain(self._stages)
+
+    def apply(self, operator: JsonOperator) -> "LazyQ":
+        return self._then("apply", operator)
+
+    def query(self, text: str) -> "LazyQ":
+        return self._then("apply", compile_query(text))
+
+    # ----- access -----
+    def __getitem__(self, key: Any) -> "LazyQ":
+        if isinstance(key, str) and not self._stages and isinstance(self._source, ArrayStream):
+            return LazyQ(self._v, source=self._source.descend(key))
+        return self._then("pluck" if isinstance(key, str) else "index", key)
+
+    def pluck(self, key: str) -> "LazyQ":
+        return self[key]
+
+    def path(self, expr: str) -> "LazyQ":
+        tokens = parse_path(expr)
+        if not is_plain(tokens):
+            # Matches stream out of the traversal, so ``first()`` stops early.
+            return self._then("match", compile_steps(tokens))
+        out = self
+        for token in tokens:
+            out = out[token]
+        return out
+
+    # ----- transforms -----
+    def map(self, fn: Callable[[Any], Any]) -> "LazyQ":
+        return self._then("map", fn)
+
+    def filter(self, pred: Callable[[Any], bool]) -> "LazyQ":
+        return self._then("filter", pred)
+
+    def reject(self, pred: Callable[[Any], bool]) -> "LazyQ":
+        return self._then("reject", pred)
+
+    def where(self, path: str, op: str, value: Any) -> "LazyQ":
+        """Declarative ``filter``; at the head of a ``Q.from_ndjson`` chain it runs on raw lines."""
+        pred = Where(path, op, value)
+        if not self._stages and isinstance(self._source, LineStream):
+            return LazyQ(self._v, source=self._source.filtered(pred))
+        return self._then("filter", pred)
+
+    def sort_by(self, spec: SortSpec) -> "LazyQ":
+        return self._then("sort_by", spec)
+
+    def top_k(self, n: int, key: SortSpec) -> "LazyQ":
+        """Heap selection over the stream: O(n) memory however long the input is."""
+        return self._then("top_k", (n, key, True))
+
+    def bottom_k(self, n: int, key: SortSpec) -> "LazyQ":
+        return self._then("top_k", (n, key, False))
+
+    def unique(self, keyfn: Optional[Callable[[Any], Any]] = None) -> "LazyQ":
+        return self._then("unique", keyfn)
+
+    def flat(self) -> "LazyQ":
+        return self._then("flat")
+
+    def select(self, *paths: str, shape: str = "dict") -> "LazyQ":
+        return self.project(as_fields(paths), shape)
+
+    def project(self, fields: Mapping[str, str], shape: str = "dict") -> "LazyQ":
+        if shape == "columns":
+            return self.apply(seq_ops.project(fields, shape))
+        if shape not in ("dict", "tuple"):
+            raise ValueError(f"Unsupported projection shape: {shape!r}")
+        return self._then("project", (dict(fields), shape))
+
+    def group_by(self, key: GroupKey) -> "GroupBy":
+        return GroupBy(self, key)
+
+    def join(
+        self, other: Any, on: JoinKeys, *, right_on: Optional[JoinKeys] = None, how: str = "inner"
+    ) -> "LazyQ":
+        """Streaming hash join: ``other`` is hashed on first pull, this chain is probed lazily."""
+        right = on if right_on is None else right_on
+
+        def joined() -> Iterator[Any]:
+            items, v = self._stream()
+            return hash_join(items, _records(other), on, right, how=how, mode=v.mode)
+
+        # Later stages run under the mode this chain ends with.
+        mode = next((s.arg for s in reversed(self._stages) if s.kind == "mode"), self._v.mode)
+        return LazyQ(self._v.with_mode(mode), source=joined)
+
+    # ----- missing policy -----
+    def keep_missing(self) -> "LazyQ":
+        return self._then("mode", MissingMode.KEEP)
+
+    def drop_missing(self) -> "LazyQ":
+        return self._then("mode", MissingMode.DROP)
+
+    def fill_missing(self, value: Any) -> "LazyQ":
+        return self._then("fill", value)
+
+    # ----- extraction -----
+    def collect(self) -> Q:
+        v, stream = self._run()
+        if stream is not None:
+            v = v.replace(value=list(stream))
+        return Q(v)
+
+    def _stream(self) -> Tuple[Iterator[Any], JsonValue]:
+        v, stream = self._run()
+        return (stream if stream is not None else iter(v.as_list())), v
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._stream()[0]
+
+    def get(self, default: Any = None) -> Any:
+        return self.collect().get(default)
+
+    def list(self) -> List[Any]:
+        return self.collect().list()
+
+    def first(self, default: Any = None) -> Any:
+        if self._stages and self._stages[-1].kind == "sort_by":
+            # Only the minimum is needed, so select it instead of sorting.
+            head = LazyQ(self._v, source=self._source, stages=self._stages[:-1]).bottom_k(1, self._stages[-1].arg)
+            return next(iter(head), default)
+        return next(iter(self), default)
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return self.collect().to_json(indent=indent)
+
+    def iter_json(self, indent: Optional[int] = None) -> Iterator[str]:
+        """Encode results as they are produced; streamed items are never collected."""
+        v, stream = self._run()
+        if stream is None:
+            return _iter_json(v.unwrap(), indent=indent)
+        return _iter_json_array(stream, indent=indent)
+
+    def dump(self, fp: IO[str], indent: Optional[int] = None) -> None:
+        for chunk in self.iter_json(indent=indent):
+            fp.write(chunk)
+
+
+class AsyncQ:
+    """Chain over an async source, consumed with ``async for`` or ``await q.list()``.
+
+    Adjacent sync steps run fused per item as in LazyQ; ``amap``/``afilter``
+    keep up to ``concurrency`` awaits in flight.
+    """
+
+    def __init__(self, source: AnyIterable, v: JsonValue, ops: Tuple[Tuple[str, Any], ...] = ()):
+        self._source = source
+        self._v = v
+        self._ops = ops
+
+    def _then(self, kind: str, arg: Any) -> "AsyncQ":
+        return AsyncQ(self._source, self._v, self._ops + ((kind, arg),))
+
+    def map(self, fn: Callable[[Any], Any]) -> "AsyncQ":
+        return self._then("stage", Stage("map", fn))
+
+    def filter(self, pred: Callable[[Any], bool]) -> "AsyncQ":
+        return self._then("stage", Stage("filter", pred))
+
+    def reject(self, pred: Callable[[Any], bool]) -> "AsyncQ":
+        return self._then("stage", Stage("reject", pred))
+
+    def where(self, path: str, op: str, value: Any) -> "AsyncQ":
+        return self.filter(Where(path, op, value))
+
+    def pluck(self, key: str) -> "AsyncQ":
+        return self._then("stage", Stage("pluck", key))
+
+    def unique(self, keyfn: Optional[Callable[[Any], Any]] = None) -> "AsyncQ":
+        return self._then("stage", Stage("unique", keyfn))
+
+    def flat(self) -> "AsyncQ":
+        return self._then("stage", Stage("flat"))
+
+    def amap(self, fn: AsyncFn, *, concurrency: int = 8, ordered: bool = True) -> "AsyncQ":
+        return self._then("amap", (fn, concurrency, ordered))
+
+    def afilter(self, pred: AsyncFn, *, concurrency: int = 8, ordered: bool = True) -> "AsyncQ":
+        return self._then("afilter", (pred, concurrency, ordered))
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        stream = aiterate(self._source)
+        stages: List[Stage] = []
+        # Async steps follow the same DROP rule as fused ones: MISSING inputs
+        # are skipped, and a trailing amap's failures do not reach the output.
+        drop = self._v.mode is MissingMode.DROP
+        kind = ""
+        for kind, arg in self._ops:
+            if kind == "stage":
+                stages.append(arg)
+                continue
+            if stages:
+                stream, stages = aexpand(stream, item_runner(stages, self._v.mode)), []
+            if drop:
+                stream = adrop_missing(stream)
+            fn, concurrency, ordered = arg
+            run = amap_iter if kind == "amap" else afilter_iter
+            stream = run(stream, fn, concurrency=concurrency, ordered=ordered)
+        if stages:
+            stream = aexpand(stream, item_runner(stages, self._v.mode))
+        elif drop and kind == "amap":
+            stream = adrop_missing(stream)
+        return stream
+
+    async def list(self) -> List[Any]:
+        return [x async for x in self]
+
+    async def collect(self) -> Q:
+        return Q(self._v.replace(value=await self.list()))
+
+    async def first(self, default: Any = None) -> Any:
+        stream = self.__aiter__()
+        try:
+            async for x in stream:
+                return x
+            return default
+        finally:
+            await _close(stream)
+
+
+class MappedQ:
+    """Access chain over a file opened with ``Q.open``.
+
+    ``[]``/``pluck``/``path`` walk the file's structure by offset; values are
+    decoded by ``get``/``list``/``collect`` (or item by item via ``lazy()``).
+    Use ``collect()`` to continue with the full Q API.
+    """
+
+    def __init__(self, doc: MappedDocument, v: JsonValue, sel: Any = None):
+        self._doc = doc
+        self._v = v
+        self._sel = doc.root if sel is None else sel
+
+    def __getitem__(self, key: Any) -> "MappedQ":
+        return MappedQ(self._doc, self._v, _select(self._sel, key, self._v.mode))
+
+    def pluck(self, key: str) -> "MappedQ":
+        return self[key]
+
+    def path(self, expr: str) -> "MappedQ":
+        tokens = parse_path(expr)
+        if not is_plain(tokens):
+            raise ValueError(f"'*' and '..' paths are not supported on mapped documents: {expr}")
+        out = self
+        for token in tokens:
+            out = out[token]
+        return out
+
+    def keys(self) -> List[str]:
+        sel = self._sel
+        return sel.keys() if isinstance(sel, Node) and sel.kind == "object" else []
+
+    def collect(self) -> Q:
+        return Q(self._v.replace(value=materialize(self._sel)))
+
+    def lazy(self) -> LazyQ:
+        """Lazy chain over the selected items, decoding one at a time."""
+        return LazyQ(self._v.replace(value=[]), source=lambda: iter_materialized(self._sel))
+
+    def get(self, default: Any = None) -> Any:
+        return self.collect().get(default)
+
+    def list(self) -> List[Any]:
+        return self.collect().list()
+
+    def first(self, default: Any = None) -> Any:
+        return self.lazy().first(default)
+
+    def close(self) -> None:
+        self._doc.close()
+
+    def __enter__(self) -> "MappedQ":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class Dataset:
+    """Chain over many files, run per shard on a process pool by ``Q.scan``.
+
+    Steps run item by item within each shard; ``list``, ``count``, ``sum``,
+    ``top_k``/``bottom_k`` and ``group_by(...).agg`` reduce every shard
+    separately and combine the partials. With the default process executor,
+    step callables must be picklable (module-level functions, not lambdas).
+    """
+
+    def __init__(
+        self,
+        shards: List[_dataset.Shard],
+        v: JsonValue,
+        stages: Tuple[Stage, ...] = (),
+        *,
+        workers: Optional[int] = None,
+        executor: str = "process",
+    ):
+        self._shards = shards
+        self._v = v
+        self._stages = stages
+        self._workers = workers
+        self._executor = executor
+
+    def _then(self, kind: str, arg: Any = None) -> "Dataset":
+        stages = self._stages + (Stage(kind, arg),)
+        return Dataset(self._shards, self._v, stages, workers=self._workers, executor=self._executor)
+
+    def _run(self, reducer: _dataset.Reducer) -> Any:
+        workers = self._workers or os.cpu_count() or 1
+        return _dataset.run(self._shards, self._stages, self._v, reducer, workers=workers, executor=self._executor)
+
+    @property
+    def shards(self) -> List[_dataset.Shard]:
+        return list(self._shards)
+
+    def explain(self) -> str:
+        return f"{len(self._shards)} shards => {_explain(self._stages)}"
+
+    # ----- item-wise steps -----
+    def __getitem__(self, key: str) -> "Dataset":
+        if not isinstance(key, str):
+            raise TypeError("Dataset steps run per item; collect before indexing")
+        return self._then("pluck", key)
+
+    def pluck(self, key: str) -> "Dataset":
+        return self[key]
+
+    def path(self, expr: str) -> "Dataset":
+        tokens = parse_path(expr)
+        if not is_plain(tokens) and isinstance(tokens[0], (str, Wildcard, Descend)):
+            return self._then("match", compile_steps(tokens))
+        out = self
+        for token in tokens:
+            out = out[token]
+        return out
+
+    def map(self, fn: Callable[[Any], Any]) -> "Dataset":
+        return self._then("map", fn)
+
+    def filter(self, pred: Callable[[Any], bool]) -> "Dataset":
+        return self._then("filter", pred)
+
+    def reject(self, pred: Callable[[Any], bool]) -> "Dataset":
+        return self._then("reject", pred)
+
+    def where(self, path: str, op: str, value: Any) -> "Dataset":
+        """Declarative ``filter``; at the head of the chain NDJSON shards run it on raw lines."""
+        pred = Where(path, op, value)
+        if self._stages:
+            return self._then("filter", pred)
+        shards = [_dataclass_replace(shard, where=shard.where + (pred,)) for shard in self._shards]
+        return Dataset(shards, self._v, workers=self._workers, executor=self._executor)
+
+    def flat(self) -> "Dataset":
+        return self._then("flat")
+
+    def select(self, *paths: str, shape: str = "dict") -> "Dataset":
+        return self.project(as_fields(paths), shape)
+
+    def project(self, fields: Mapping[str, str], shape: str = "dict") -> "Dataset":
+        if shape not in ("dict", "tuple"):
+            raise ValueError(f"Unsupported projection shape: {shape!r}")
+        return self._then("project", (dict(fields), shape))
+
+    def keep_missing(self) -> "Dataset":
+        return self._then("mode", MissingMode.KEEP)
+
+    def drop_missing(self) -> "Dataset":
+        return self._then("mode", MissingMode.DROP)
+
+    # ----- combinable reductions -----
+    def collect(self) -> Q:
+        return Q(self._v.replace(value=self._run(("concat",))))
+
+    def list(self) -> List[Any]:
+        return self.collect().list()
+
+    def count(self, key: Optional[str] = None) -> int:
+        return self._run(("count", key))
+
+    def sum(self, key: Optional[str] = None) -> Any:
+        return self._run(("sum", key))
+
+    def top_k(self, n: int, key: SortSpec) -> Q:
+        return Q(self._v.replace(value=self._run(("top_k", n, key, True))))
+
+    def bottom_k(self, n: int, key: SortSpec) -> Q:
+        return Q(self._v.replace(value=self._run(("top_k", n, key, False))))
+
+    def group_by(self, key: GroupKey) -> "GroupBy":
+        return GroupBy(self, key)
+
+
+class GroupBy:
+    """Pending ``group_by``; finish with ``agg()`` or ``groups()``.
+
+    Specs are ``name="count"`` or ``name=(path, aggregate[, options])`` where
+    aggregate is count/sum/mean/min/max/percentile/histogram/list.
+    """
+
+    def __init__(self, q: Any, key: GroupKey):
+        self._q = q
+        self._key = key
+
+    def agg(self, **specs: AggSpec) -> Q:
+        if isinstance(self._q, Dataset):
+            return Q(self._q._v.replace(value=self._q._run(("group", self._key, specs))))
+        if isinstance(self._q, LazyQ):
+            items, v = self._q._stream()
+            return Q(v.replace(value=group_aggregate(items, self._key, specs, v.mode)))
+        return self._q.apply(seq_ops.group_by(self._key, **specs))
+
+    def count(self) -> Q:
+        return self.agg(count="count")
+
+    def groups(self) -> Q:
+        """Materialize each group's members under ``items``."""
+        return self.agg(items="list")
+
+
+class Indexed:
+    """Records with hash indexes for O(1) equality and O(log n) range lookups.
+
+    The primary index is built up front; ``where``/``between`` on other paths
+    build an index for that path on first use and reuse it afterwards.
+    """
+
+    def __init__(self, q: Q, path: str, *, ordered: bool = False):
+        self._v = q._v
+        self._records = q.list()
+        self._path = path
+        self._indexes: Dict[str, RecordIndex] = {}
+        self.index(path, ordered=ordered)
+
+    def index(self, path: str, *, ordered: bool = False) -> RecordIndex:
+        idx = self._indexes.get(path)
+        if idx is None:
+            idx = self._indexes[path] = RecordIndex(self._records, path, self._v.mode, ordered=ordered)
+        return idx
+
+    def _q(self, records: List[Any]) -> Q:
+        return Q(self._v.replace(value=records))
+
+    def lookup(self, key: Any) -> Q:
+        return self._q(self._indexes[self._path].lookup(key))
+
+    def one(self, key: Any, default: Any = None) -> Any:
+        """First record with ``key`` on the primary path, without wrapping it in Q."""
+        return self._indexes[self._path].first(key, default)
+
+    def where(self, path: str, value: Any) -> Q:
+        return self._q(self.index(path).lookup(value))
+
+    def between(self, path: str, lo: Any, hi: Any) -> Q:
+        """Records with ``lo <= path <= hi`` in key order; ``None`` leaves a bound open."""
+        return self._q(self.index(path).between(lo, hi))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._indexes[self._path]
+
+    def list(self) -> List[Any]:
+        return self._records
+
+
+def _records(x: Any) -> Any:
+    return x.list() if isinstance(x, (Q, LazyQ)) else x
+
+
 class jx:
     """Functional helpers for pipeline composition (minimal for MVP)."""
 
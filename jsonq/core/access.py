@@ -1,7 +1,10 @@
 from __future__ import annotations
-from typing import Any, Iterable, List, Sequence, Union
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Union
 
 from .missing import MISSING, MissingMode, is_missing
+from .path import Token, is_plain, parse_path
+from .traverse import compile_steps, iter_matches
 from .value import JsonValue
 
 
@@ -20,8 +23,13 @@ def _flatten_once(seq: Iterable[Any], *, drop_missing: bool) -> List[Any]:
 def get_item(v: JsonValue, key: Union[str, int, slice]) -> Any:
     """Vectorized safe item access based on current MissingMode."""
 
-    val = v.unwrap()
-    mode = v.mode  # internal access is intentional
+    if v.columns is not None and isinstance(key, str):
+        return v.columns.pluck(key, v.mode)
+    return get_raw(v.unwrap(), key, v.mode)
+
+
+def get_raw(val: Any, key: Union[str, int, slice], mode: MissingMode) -> Any:
+    """``get_item`` on an unwrapped value, for callers that skip JsonValue."""
 
     def handle_missing(exc: Exception | None = None):
         if mode is MissingMode.RAISE:
@@ -39,17 +47,23 @@ def get_item(v: JsonValue, key: Union[str, int, slice]) -> Any:
         if isinstance(key, str):
             out: List[Any] = []
             missing_seen = False
+            nested = False
             for el in val:
                 if isinstance(el, dict):
                     result = el.get(key, MISSING)
                 else:
                     result = MISSING
-                if is_missing(result):
+                if result is MISSING:
                     missing_seen = True
+                elif isinstance(result, list):
+                    nested = True
                 out.append(result)
             if missing_seen and mode is MissingMode.RAISE:
                 raise KeyError(key)
             drop = mode is MissingMode.DROP
+            # Without nested lists or missing values to drop, ``out`` is final.
+            if not nested and not (drop and missing_seen):
+                return out
             return _flatten_once(out, drop_missing=drop)
         return handle_missing()
 
@@ -64,12 +78,109 @@ def get_item(v: JsonValue, key: Union[str, int, slice]) -> Any:
 
 
 def apply_path(v: JsonValue, tokens: Sequence[Union[str, int]]) -> Any:
-    cur: Any = v
+    return _walk(v.unwrap(), tuple(tokens), v.mode)
+
+
+# ----- compiled paths -----
+
+PathAccessor = Callable[[Any, MissingMode], Any]
+
+
+@lru_cache(maxsize=1024)
+def compile_path(expr: str) -> PathAccessor:
+    """Return a cached ``(value, mode) -> result`` accessor for ``expr``.
+
+    The accessor works on unwrapped values and gives the same result as
+    ``apply_path``; plain dict keys and list indices are walked directly and
+    only vectorized or missing steps go through ``get_raw``. Paths with
+    ``*`` or ``..`` return the list of their matches (see ``compile_matcher``).
+    """
+
+    return _compile_tokens(parse_path(expr))
+
+
+def _compile_tokens(tokens: Tuple[Token, ...]) -> PathAccessor:
+    if not tokens:
+        return lambda val, mode: val
+    if not is_plain(tokens):
+        steps = compile_steps(tokens)
+        return lambda val, mode: list(iter_matches(val, steps, mode))
+    if len(tokens) == 1 and isinstance(tokens[0], str):
+        key = tokens[0]
+
+        def access_key(val: Any, mode: MissingMode) -> Any:
+            if val.__class__ is dict:
+                out = val.get(key, MISSING)
+                if out is not MISSING:
+                    return out
+            return get_raw(val, key, mode)
+
+        return access_key
+
+    if all(token.__class__ is str for token in tokens):
+        return _key_chain(tokens)
+
+    def access(val: Any, mode: MissingMode) -> Any:
+        return _walk(val, tokens, mode)
+
+    return access
+
+
+def _key_chain(tokens: Tuple[str, ...]) -> PathAccessor:
+    """Accessor for a chain of dict keys as chained ``get`` calls.
+
+    ``get`` (unlike subscripts) ignores ``__missing__`` on dict subclasses.
+    A non-dict step or a miss falls back to ``_walk``, which applies
+    vectorization and the missing policy.
+    """
+
+    if len(tokens) == 2:
+        a, b = tokens
+
+        def get2(val: Any, mode: MissingMode) -> Any:
+            try:
+                out = val.get(a, MISSING).get(b, MISSING)
+            except AttributeError:
+                return _walk(val, tokens, mode)
+            return _walk(val, tokens, mode) if out is MISSING else out
+
+        return get2
+    if len(tokens) == 3:
+        a, b, c = tokens
+
+        def get3(val: Any, mode: MissingMode) -> Any:
+            try:
+                out = val.get(a, MISSING).get(b, MISSING).get(c, MISSING)
+            except AttributeError:
+                return _walk(val, tokens, mode)
+            return _walk(val, tokens, mode) if out is MISSING else out
+
+        return get3
+
+    def get(val: Any, mode: MissingMode) -> Any:
+        cur = val
+        try:
+            for key in tokens:
+                cur = cur.get(key, MISSING)
+        except AttributeError:
+            return _walk(val, tokens, mode)
+        return _walk(val, tokens, mode) if cur is MISSING else cur
+
+    return get
+
+
+def _walk(cur: Any, tokens: Tuple[Token, ...], mode: MissingMode) -> Any:
     for token in tokens:
-        if isinstance(cur, JsonValue):
-            cur = get_item(cur, token)
-        else:
-            cur = get_item(v.replace(value=cur), token)
+        cls = cur.__class__
+        if cls is dict and token.__class__ is str:
+            nxt = cur.get(token, MISSING)
+            if nxt is not MISSING:
+                cur = nxt
+                continue
+        elif cls is list and token.__class__ is int and -len(cur) <= token < len(cur):
+            cur = cur[token]
+            continue
+        cur = get_raw(cur, token, mode)
         if is_missing(cur):
             break
     return cur
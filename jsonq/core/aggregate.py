@@ -0,0 +1,158 @@
+from __future__ import annotations
+import math
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .missing import MISSING, MissingMode, is_missing
+
+try:  # optional acceleration
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+Values = Union[List[Any], array]
+Percentile = Union[float, Sequence[float]]
+
+
+def present_values(values: Values, mode: MissingMode) -> Any:
+    """Apply the missing policy to aggregation inputs.
+
+    DROP skips missing values, KEEP returns MISSING if any are present (so the
+    aggregate propagates it) and RAISE raises ValueError.
+    """
+
+    if isinstance(values, array) or not any(is_missing(x) for x in values):
+        return values
+    if mode is MissingMode.DROP:
+        return [x for x in values if not is_missing(x)]
+    if mode is MissingMode.RAISE:
+        raise ValueError("Missing values present; fill or drop before aggregating")
+    return MISSING
+
+
+def aggregate(name: str, values: Values, mode: MissingMode, **options: Any) -> Any:
+    if name not in AGGREGATES:
+        raise ValueError(f"Unknown aggregate {name!r}; expected one of {sorted(AGGREGATES)}")
+    xs = present_values(values, mode)
+    if is_missing(xs):
+        return MISSING
+    return AGGREGATES[name](xs, **options)
+
+
+def agg_count(xs: Values) -> int:
+    return len(xs)
+
+
+def agg_sum(xs: Values) -> Any:
+    arr = _as_ndarray(xs, ints=False)
+    if arr is not None:
+        return arr.sum().item()
+    return sum(xs)
+
+
+def agg_mean(xs: Values) -> Optional[float]:
+    if not len(xs):
+        return None
+    arr = _as_ndarray(xs)
+    if arr is not None:
+        return float(arr.mean())
+    return math.fsum(xs) / len(xs)
+
+
+def agg_min(xs: Values) -> Any:
+    if not len(xs):
+        return None
+    arr = _as_ndarray(xs)
+    if arr is not None:
+        return arr.min().item()
+    return min(xs)
+
+
+def agg_max(xs: Values) -> Any:
+    if not len(xs):
+        return None
+    arr = _as_ndarray(xs)
+    if arr is not None:
+        return arr.max().item()
+    return max(xs)
+
+
+def agg_percentile(xs: Values, q: Percentile = 50) -> Any:
+    """Linearly interpolated percentile(s), ``q`` in [0, 100]."""
+
+    qs = [q] if isinstance(q, (int, float)) else list(q)
+    if any(not 0 <= p <= 100 for p in qs):
+        raise ValueError("percentile must be within [0, 100]")
+    if not len(xs):
+        out: List[Any] = [None] * len(qs)
+    else:
+        arr = _as_ndarray(xs)
+        if arr is not None:
+            out = [float(v) for v in np.percentile(arr, qs)]
+        else:
+            ordered = sorted(xs)
+            out = [_interpolate(ordered, p) for p in qs]
+    return out[0] if isinstance(q, (int, float)) else out
+
+
+def agg_histogram(xs: Values, bins: int = 10) -> Dict[str, List[Any]]:
+    """Equal-width histogram as ``{"edges": [...], "counts": [...]}``."""
+
+    if bins < 1:
+        raise ValueError("bins must be >= 1")
+    if not len(xs):
+        return {"edges": [], "counts": []}
+    arr = _as_ndarray(xs)
+    if arr is not None:
+        counts, edges = np.histogram(arr, bins=bins)
+        return {"edges": [float(e) for e in edges], "counts": [int(c) for c in counts]}
+    lo, hi = min(xs), max(xs)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    width = (hi - lo) / bins
+    edges = [lo + i * width for i in range(bins)] + [float(hi)]
+    hist = [0] * bins
+    for x in xs:
+        hist[min(int((x - lo) / width), bins - 1)] += 1
+    return {"edges": [float(e) for e in edges], "counts": hist}
+
+
+AGGREGATES: Dict[str, Callable[..., Any]] = {
+    "count": agg_count,
+    "sum": agg_sum,
+    "mean": agg_mean,
+    "min": agg_min,
+    "max": agg_max,
+    "percentile": agg_percentile,
+    "histogram": agg_histogram,
+}
+
+
+def _interpolate(ordered: List[Any], p: float) -> float:
+    rank = (len(ordered) - 1) * p / 100
+    lo = math.floor(rank)
+    hi = min(lo + 1, len(ordered) - 1)
+    return float(ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo))
+
+
+def _as_ndarray(xs: Values, *, ints: bool = True) -> Any:
+    """ndarray view of numeric ``xs`` when NumPy is available, else None.
+
+    With ``ints=False`` integer inputs are left to Python so sums stay exact.
+    """
+
+    if np is None:
+        return None
+    if isinstance(xs, array):
+        if xs.typecode == "q" and not ints:
+            return None
+        return np.frombuffer(xs, dtype=np.float64 if xs.typecode == "d" else np.int64)
+    kinds = set(map(type, xs))
+    if kinds == {float} or kinds == {int, float}:
+        return np.fromiter(xs, dtype=np.float64, count=len(xs))
+    if kinds == {int} and ints:
+        try:
+            return np.array(xs, dtype=np.int64)
+        except OverflowError:
+            return None
+    return None
@@ -0,0 +1,131 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Iterable, Set, Union
+
+from .missing import MISSING
+
+AsyncFn = Callable[[Any], Awaitable[Any]]
+AnyIterable = Union[Iterable[Any], AsyncIterable[Any]]
+
+_DROPPED = object()
+
+
+async def _safe_aapply(fn: AsyncFn, value: Any) -> Any:
+    try:
+        return await fn(value)
+    except Exception:
+        return MISSING
+
+
+async def _safe_apred(pred: AsyncFn, value: Any) -> Any:
+    try:
+        keep = bool(await pred(value))
+    except Exception:
+        keep = False
+    return value if keep else _DROPPED
+
+
+def aiterate(items: AnyIterable) -> AsyncIterator[Any]:
+    """Async iterator over either a sync or an async iterable."""
+
+    if hasattr(items, "__aiter__"):
+        return items.__aiter__()  # type: ignore[union-attr]
+    return _from_sync(items)  # type: ignore[arg-type]
+
+
+async def _from_sync(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def _close(stream: AsyncIterator[Any]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def adrop_missing(items: AnyIterable) -> AsyncIterator[Any]:
+    """Skip MISSING items, as DROP-mode steps do with their inputs."""
+
+    source = aiterate(items)
+    try:
+        async for item in source:
+            if item is not MISSING:
+                yield item
+    finally:
+        await _close(source)
+
+
+async def aexpand(items: AnyIterable, run: Callable[[Any], Iterable[Any]]) -> AsyncIterator[Any]:
+    """Yield everything ``run(item)`` produces for each item (sync fused steps)."""
+
+    source = aiterate(items)
+    try:
+        async for item in source:
+            for out in run(item):
+                yield out
+    finally:
+        await _close(source)
+
+
+def amap_iter(items: AnyIterable, fn: AsyncFn, *, concurrency: int = 8, ordered: bool = True) -> AsyncIterator[Any]:
+    """Await ``fn`` over ``items`` with at most ``concurrency`` calls in flight.
+
+    Exceptions become MISSING, as with the sync ``map``. With ``ordered=False``
+    results are yielded as they complete.
+    """
+
+    return _bounded(items, lambda item: _safe_aapply(fn, item), concurrency, ordered)
+
+
+async def afilter_iter(
+    items: AnyIterable, pred: AsyncFn, *, concurrency: int = 8, ordered: bool = True
+) -> AsyncIterator[Any]:
+    """Keep items whose awaited ``pred`` is truthy; exceptions count as False."""
+
+    results = _bounded(items, lambda item: _safe_apred(pred, item), concurrency, ordered)
+    try:
+        async for item in results:
+            if item is not _DROPPED:
+                yield item
+    finally:
+        await results.aclose()
+
+
+async def _bounded(
+    items: AnyIterable, call: Callable[[Any], Awaitable[Any]], concurrency: int, ordered: bool
+) -> AsyncIterator[Any]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    source = aiterate(items)
+    if ordered:
+        window: Deque[asyncio.Task] = deque()
+        try:
+            async for item in source:
+                window.append(asyncio.ensure_future(call(item)))
+                if len(window) >= concurrency:
+                    yield await window.popleft()
+            while window:
+                yield await window.popleft()
+        finally:
+            for task in window:
+                task.cancel()
+            await _close(source)
+        return
+    pending: Set[asyncio.Task] = set()
+    try:
+        async for item in source:
+            pending.add(asyncio.ensure_future(call(item)))
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await _close(source)
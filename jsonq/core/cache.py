@@ -0,0 +1,125 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .value import JsonValue
+
+Plan = Tuple[Hashable, ...]
+CacheKey = Tuple[Hashable, Plan]
+
+
+class ResultCache:
+    """LRU cache of intermediate chain results, keyed by (document, plan prefix).
+
+    Chains started with ``Q.cached(doc, cache)`` look up every step's result
+    under the steps taken so far, so chains that share a prefix compute it
+    once. ``max_weight`` bounds the total size of cached results, counted as
+    one per scalar and ``len`` per list/dict at every nesting level. Cached values are shared between
+    chains and must not be mutated. Call ``invalidate(doc)`` after changing a
+    document, or pass a new ``version`` when binding it.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_weight: int = 1_000_000):
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[JsonValue, int]]" = OrderedDict()
+        self._weight = 0
+        # id(doc) -> [doc, live entries]; the reference keeps ids from being
+        # reused while entries for the document exist.
+        self._docs: Dict[int, list] = {}
+
+    def run(self, doc: Any, token: Hashable, plan: Plan, compute: Callable[[], JsonValue]) -> JsonValue:
+        key = (token, plan)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = compute()
+        self._put(doc, key, value)
+        return value
+
+    def _put(self, doc: Any, key: CacheKey, value: JsonValue) -> None:
+        weight = _weight(value.value)
+        if weight > self.max_weight or self.max_entries <= 0:
+            return
+        self._entries[key] = (value, weight)
+        self._weight += weight
+        ref = self._docs.setdefault(id(doc), [doc, 0])
+        ref[1] += 1
+        while len(self._entries) > self.max_entries or self._weight > self.max_weight:
+            self._evict(*self._entries.popitem(last=False))
+
+    def _evict(self, key: CacheKey, entry: Tuple[JsonValue, int]) -> None:
+        self._weight -= entry[1]
+        doc_id = key[0][0]
+        ref = self._docs.get(doc_id)
+        if ref is not None:
+            ref[1] -= 1
+            if ref[1] <= 0:
+                del self._docs[doc_id]
+
+    def invalidate(self, doc: Any = None) -> None:
+        """Drop every entry for ``doc`` (all versions), or everything."""
+
+        if doc is None:
+            self._entries.clear()
+            self._docs.clear()
+            self._weight = 0
+            return
+        stale = [key for key in self._entries if key[0][0] == id(doc)]
+        for key in stale:
+            self._evict(key, self._entries.pop(key))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "weight": self._weight, "hits": self.hits, "misses": self.misses}
+
+
+def step_key(*parts: Any) -> Optional[Hashable]:
+    """Hashable key for one chain step, or None when a part cannot be hashed."""
+
+    key = tuple(_freeze(p) for p in parts)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze(x: Any) -> Any:
+    # Every part carries its type, so equal-but-distinct arguments such as
+    # 0 / 0.0 / False or [1] / (1,) get different keys.
+    cls = x.__class__
+    if cls is list or cls is tuple:
+        return (cls, tuple(_freeze(v) for v in x))
+    if cls is dict:
+        return (cls, tuple((_freeze(k), _freeze(v)) for k, v in x.items()))
+    if cls is frozenset:
+        return (cls, frozenset(_freeze(v) for v in x))
+    if cls is slice:
+        return (cls, _freeze(x.start), _freeze(x.stop), _freeze(x.step))
+    return (cls, x)
+
+
+def _weight(value: Any) -> int:
+    """1 per scalar plus ``len`` + 1 per list/dict, over the whole nested value."""
+
+    total = 0
+    stack = [value]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        total += 1
+        if isinstance(node, dict):
+            total += len(node)
+            extend(node.values())
+        elif isinstance(node, list):
+            total += len(node)
+            extend(node)
+    return total
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .access import _flatten_once
+from .missing import MISSING, MissingMode
+from .seqview import _safe_pred
+
+ColumnValues = Union[array, List[Any]]
+
+
+class Column:
+    """One field across all rows; ``present`` is a 0/1 bitmap, or None if dense."""
+
+    __slots__ = ("values", "present", "nested")
+
+    def __init__(self, values: ColumnValues, present: Optional[bytearray], nested: bool):
+        self.values = values
+        self.present = present
+        self.nested = nested
+
+    def take(self, indices: Sequence[int]) -> Column:
+        src = self.values
+        values: ColumnValues
+        if isinstance(src, array):
+            values = array(src.typecode, [src[i] for i in indices])
+        else:
+            values = [src[i] for i in indices]
+        present = None
+        if self.present is not None:
+            present = bytearray(self.present[i] for i in indices)
+            if present.count(0) == 0:
+                present = None
+        return Column(values, present, self.nested)
+
+
+class ColumnStore:
+    """Struct-of-arrays view of a list of records, built in one pass.
+
+    Integer and float columns are stored as ``array('q')`` / ``array('d')``;
+    everything else as a list. Rows that are not dicts, or lack a key, are
+    marked absent in that column's bitmap.
+    """
+
+    def __init__(self, rows: List[Any], columns: Dict[str, Column]):
+        self.rows = rows
+        self.columns = columns
+
+    @classmethod
+    def build(cls, rows: List[Any]) -> ColumnStore:
+        raw: Dict[str, List[Any]] = {}
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict):
+                continue
+            for key, value in row.items():
+                col = raw.get(key)
+                if col is None:
+                    col = raw[key] = []
+                if len(col) < i:
+                    col.extend([MISSING] * (i - len(col)))
+                col.append(value)
+        n = len(rows)
+        columns: Dict[str, Column] = {}
+        for key, col in raw.items():
+            if len(col) < n:
+                col.extend([MISSING] * (n - len(col)))
+            columns[key] = _pack(col)
+        return cls(rows, columns)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def pluck(self, key: str, mode: MissingMode) -> List[Any]:
+        """Same result as vectorized ``get_item`` over the rows."""
+
+        n = len(self.rows)
+        col = self.columns.get(key)
+        if col is None:
+            if n and mode is MissingMode.RAISE:
+                raise KeyError(key)
+            return [] if mode is MissingMode.DROP else [MISSING] * n
+        if col.present is None:
+            out = list(col.values)
+        else:
+            if mode is MissingMode.RAISE:
+                raise KeyError(key)
+            if mode is MissingMode.DROP and not col.nested:
+                return [v for v, p in zip(col.values, col.present) if p]
+            out = [v if p else MISSING for v, p in zip(col.values, col.present)]
+        if col.nested:
+            return _flatten_once(out, drop_missing=mode is MissingMode.DROP)
+        return out
+
+    def numeric(self, key: str) -> Optional[array]:
+        """The packed array for ``key`` if it is numeric and present in every row."""
+
+        col = self.columns.get(key)
+        if col is None or col.present is not None or not isinstance(col.values, array):
+            return None
+        return col.values
+
+    def select(self, key: str, pred: Callable[[Any], bool]) -> List[int]:
+        """Row indices whose ``key`` is present and satisfies ``pred``."""
+
+        col = self.columns.get(key)
+        if col is None:
+            return []
+        if col.present is None:
+            return [i for i, v in enumerate(col.values) if _safe_pred(pred, v)]
+        return [i for i, (v, p) in enumerate(zip(col.values, col.present)) if p and _safe_pred(pred, v)]
+
+    def argsort(self, key: str, *, skip_missing_rows: bool = False) -> List[int]:
+        """Stable row order by ``key``; rows without the key go last."""
+
+        col = self.columns.get(key)
+        rows = self.rows
+        if col is None:
+            present: List[int] = []
+            absent = list(range(len(rows)))
+        elif col.present is None:
+            present, absent = list(range(len(rows))), []
+        else:
+            present = [i for i, p in enumerate(col.present) if p]
+            absent = [i for i, p in enumerate(col.present) if not p]
+        present.sort(key=col.values.__getitem__ if col is not None else None)
+        if skip_missing_rows:
+            absent = [i for i in absent if rows[i] is not MISSING]
+        return present + absent
+
+    def take(self, indices: Sequence[int]) -> ColumnStore:
+        rows = self.rows
+        return ColumnStore(
+            [rows[i] for i in indices],
+            {key: col.take(indices) for key, col in self.columns.items()},
+        )
+
+
+def _pack(values: List[Any]) -> Column:
+    present = bytearray(0 if v is MISSING else 1 for v in values)
+    dense = present.count(0) == 0
+    kinds = {type(v) for v, p in zip(values, present) if p}
+    if kinds == {int} or kinds == {float}:
+        code = "q" if kinds == {int} else "d"
+        try:
+            packed = array(code, [v if p else 0 for v, p in zip(values, present)])
+        except OverflowError:
+            pass
+        else:
+            return Column(packed, None if dense else present, False)
+    return Column(values, None if dense else present, list in kinds)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .access import compile_path
+from .aggregate import AGGREGATES
+from .missing import MISSING, MissingMode, is_missing
+from .seqview import _safe_apply
+
+GroupKey = Union[str, Callable[[Any], Any]]
+# "count" | (path, name) | (path, name, options); a path of None means the item.
+AggSpec = Union[str, Tuple[Optional[str], str], Tuple[Optional[str], str, Dict[str, Any]]]
+
+
+class _Acc(ABC):
+    """Streaming accumulator; ``missing`` poisons the result under KEEP."""
+
+    __slots__ = ("missing",)
+
+    def __init__(self) -> None:
+        self.missing = False
+
+    @abstractmethod
+    def add(self, x: Any) -> None: ...
+
+    @abstractmethod
+    def result(self) -> Any: ...
+
+    @abstractmethod
+    def merge(self, other: "_Acc") -> None:
+        """Fold in a partial accumulated over other items (e.g. another shard)."""
+
+    def finish(self) -> Any:
+        return MISSING if self.missing else self.result()
+
+
+class _Count(_Acc):
+    __slots__ = ("n",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.n = 0
+
+    def add(self, x: Any) -> None:
+        self.n += 1
+
+    def merge(self, other: "_Acc") -> None:
+        self.missing |= other.missing
+        self.n += other.n
+
+    def result(self) -> Any:
+        return self.n
+
+
+class _Sum(_Acc):
+    __slots__ = ("total",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.total: Any = 0
+
+    def add(self, x: Any) -> None:
+        self.total += x
+
+    def merge(self, other: "_Acc") -> None:
+        self.missing |= other.missing
+        self.total += other.total
+
+    def result(self) -> Any:
+        return self.total
+
+
+class _Mean(_Sum):
+    __slots__ = ("n",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.n = 0
+
+    def add(self, x: Any) -> None:
+        self.total += x
+        self.n += 1
+
+    def merge(self, other: "_Acc") -> None:
+        self.missing |= other.missing
+        self.total += other.total
+        self.n += other.n
+
+    def result(self) -> Any:
+        return self.total / self.n if self.n else None
+
+
+class _Extreme(_Acc):
+    __slots__ = ("best", "wants_max")
+
+    def __init__(self, wants_max: bool) -> None:
+        super().__init__()
+        self.best: Any = MISSING
+        self.wants_max = wants_max
+
+    def add(self, x: Any) -> None:
+        if self.best is MISSING or (x > self.best if self.wants_max else x < self.best):
+            self.best = x
+
+    def merge(self, other: "_Acc") -> None:
+        self.missing |= other.missing
+        if other.best is not MISSING:
+            self.add(other.best)
+
+    def result(self) -> Any:
+        return None if self.best is MISSING else self.best
+
+
+class _Collect(_Acc):
+    """Keeps the values; only used for aggregates that need all of them."""
+
+    __slots__ = ("values", "name", "options")
+
+    def __init__(self, name: str, options: Dict[str, Any]) -> None:
+        super().__init__()
+        self.values: List[Any] = []
+        self.name = name
+        self.options = options
+
+    def add(self, x: Any) -> None:
+        self.values.append(x)
+
+    def merge(self, other: "_Acc") -> None:
+        self.missing |= other.missing
+        self.values.extend(other.values)
+
+    def result(self) -> Any:
+        if self.name == "list":
+            return self.values
+        return AGGREGATES[self.name](self.values, **self.options)
+
+
+def _factory(name: str, options: Dict[str, Any]) -> Callable[[], _Acc]:
+    if name == "count":
+        return _Count
+    if name == "sum":
+        return _Sum
+    if name == "mean":
+        return _Mean
+    if name in ("min", "max"):
+        return lambda: _Extreme(name == "max")
+    if name in ("percentile", "histogram", "list"):
+        return lambda: _Collect(name, options)
+    raise ValueError(f"Unknown aggregate {name!r}; expected one of {sorted(AGGREGATES) + ['list']}")
+
+
+def _parse_spec(spec: AggSpec) -> Tuple[Optional[Callable[[Any, MissingMode], Any]], Callable[[], _Acc]]:
+    if isinstance(spec, str):
+        return None, _factory(spec, {})
+    path, name, *rest = spec
+    options = rest[0] if rest else {}
+    return (compile_path(path) if path else None), _factory(name, options)
+
+
+def _key_accessor(key: GroupKey) -> Callable[[Any, MissingMode], Any]:
+    if callable(key):
+        return lambda item, mode: _safe_apply(key, item)
+    return compile_path(key)
+
+
+def group_aggregate(
+    items: Iterable[Any],
+    key: GroupKey,
+    specs: Dict[str, AggSpec],
+    mode: MissingMode,
+) -> List[Dict[str, Any]]:
+    """One-pass hash aggregation; memory is O(groups) unless a spec collects values.
+
+    Returns ``[{"key": k, <name>: <result>, ...}]`` in first-seen key order.
+    Items whose key is missing are skipped (DROP), grouped under MISSING (KEEP)
+    or raise KeyError (RAISE); missing aggregate inputs follow ``present_values``.
+    """
+
+    return finish_groups(group_partials(items, key, specs, mode), specs)
+
+
+Partials = Dict[Any, List[_Acc]]
+
+
+def group_partials(items: Iterable[Any], key: GroupKey, specs: Dict[str, AggSpec], mode: MissingMode) -> Partials:
+    """Per-group accumulators for ``items``; combine several with ``merge_partials``."""
+
+    get_key = _key_accessor(key)
+    parsed = [(name, *_parse_spec(spec)) for name, spec in specs.items()]
+    groups: Dict[Any, List[_Acc]] = {}
+    drop = mode is MissingMode.DROP
+    for item in items:
+        if drop and is_missing(item):
+            continue
+        k = get_key(item, mode)
+        if is_missing(k):
+            if drop:
+                continue
+            if mode is MissingMode.RAISE:
+                raise KeyError(f"group key missing for {item!r}")
+        accs = groups.get(k)
+        if accs is None:
+            accs = groups[k] = [make() for _, _, make in parsed]
+        for acc, (_, access, _) in zip(accs, parsed):
+            value = item if access is None else access(item, mode)
+            if is_missing(value):
+                if drop:
+                    continue
+                if mode is MissingMode.RAISE:
+                    raise ValueError("Missing values present; fill or drop before aggregating")
+                acc.missing = True
+                continue
+            acc.add(value)
+    return groups
+
+
+def merge_partials(parts: Iterable[Partials]) -> Partials:
+    """Combine partials in order; group order stays first-seen across ``parts``."""
+
+    merged: Partials = {}
+    for part in parts:
+        for k, accs in part.items():
+            mine = merged.get(k)
+            if mine is None:
+                merged[k] = accs
+                continue
+            for acc, other in zip(mine, accs):
+                acc.merge(other)
+    return merged
+
+
+def finish_groups(groups: Partials, specs: Dict[str, AggSpec]) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for k, accs in groups.items():
+        row: Dict[str, Any] = {"key": k}
+        for acc, name in zip(accs, specs):
+            row[name] = acc.finish()
+        out.append(row)
+    return out
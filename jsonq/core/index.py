@@ -0,0 +1,112 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .access import compile_path
+from .missing import MISSING, MissingMode, is_missing
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+class RecordIndex:
+    """Hash index (plus optional sorted index) of records keyed by one path.
+
+    A record whose key is a list is indexed under each element, so
+    ``RecordIndex(users, "tags")`` finds users by any of their tags. Records
+    without the key are skipped under DROP, indexed under ``MISSING`` under
+    KEEP, and raise KeyError under RAISE. Buckets hold record positions in
+    input order.
+    """
+
+    def __init__(self, records: Sequence[Any], path: str, mode: MissingMode, *, ordered: bool = False):
+        self.records = records
+        self.path = path
+        self.mode = mode
+        self._buckets: Dict[Any, List[int]] = {}
+        self._keys: Optional[List[Any]] = None
+        self._positions: List[int] = []
+        access = compile_path(path)
+        buckets = self._buckets
+        keep = MissingMode.KEEP
+        for pos, record in enumerate(records):
+            value = access(record, keep)
+            if value.__class__ in _SCALARS:
+                bucket = buckets.get(value)
+                if bucket is None:
+                    buckets[value] = [pos]
+                else:
+                    bucket.append(pos)
+                continue
+            for key in self._keys_of(value):
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [pos]
+                elif bucket[-1] != pos:
+                    bucket.append(pos)
+        if ordered:
+            self._build_sorted()
+
+    def _keys_of(self, value: Any) -> Iterator[Any]:
+        values = value if isinstance(value, list) else (value,)
+        for key in values:
+            if is_missing(key):
+                if self.mode is MissingMode.RAISE:
+                    raise KeyError(self.path)
+                if self.mode is MissingMode.DROP:
+                    continue
+                key = MISSING
+            try:
+                hash(key)
+            except TypeError:
+                raise TypeError(f"Unhashable index key at {self.path!r}: {type(key).__name__}") from None
+            yield key
+
+    def _build_sorted(self) -> None:
+        pairs: List[Tuple[Any, int]] = [
+            (key, pos)
+            for key, bucket in self._buckets.items()
+            if key is not None and not is_missing(key)
+            for pos in bucket
+        ]
+        try:
+            pairs.sort(key=lambda p: p[0])
+        except TypeError:
+            raise ValueError(f"Sorted index on {self.path!r} needs mutually comparable keys") from None
+        self._keys = [key for key, _ in pairs]
+        self._positions = [pos for _, pos in pairs]
+
+    @property
+    def ordered(self) -> bool:
+        return self._keys is not None
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._buckets
+
+    def lookup(self, key: Any) -> List[Any]:
+        """Records whose key equals ``key``, in input order."""
+
+        records = self.records
+        return [records[pos] for pos in self._buckets.get(key, ())]
+
+    def first(self, key: Any, default: Any = None) -> Any:
+        bucket = self._buckets.get(key)
+        return self.records[bucket[0]] if bucket else default
+
+    def between(self, lo: Any, hi: Any) -> List[Any]:
+        """Records with ``lo <= key <= hi`` in key order (sorted index, built on first use)."""
+
+        if self._keys is None:
+            self._build_sorted()
+        keys = self._keys
+        start = bisect_left(keys, lo) if lo is not None else 0
+        stop = bisect_right(keys, hi) if hi is not None else len(keys)
+        seen = set()
+        out: List[Any] = []
+        for pos in self._positions[start:stop]:
+            if pos not in seen:
+                seen.add(pos)
+                out.append(self.records[pos])
+        return out
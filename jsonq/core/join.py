@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from .access import compile_path
+from .missing import MISSING, MissingMode, is_missing
+
+JoinKeys = Union[str, Sequence[str]]
+
+_JOINS = ("inner", "left")
+
+
+def hash_join(
+    probe: Iterable[Any],
+    build: Iterable[Any],
+    left_on: JoinKeys,
+    right_on: JoinKeys,
+    *,
+    how: str = "inner",
+    mode: MissingMode = MissingMode.DROP,
+) -> Iterator[Dict[str, Any]]:
+    """Join two record streams on key paths; ``build`` is hashed, ``probe`` streamed.
+
+    Matches are emitted as ``{**left, **right}`` (right wins on shared keys)
+    in probe order, one per matching build record. A record whose join key is
+    missing never matches: under DROP it is skipped on both sides, under KEEP
+    a left join still emits it unmatched, and under RAISE it raises KeyError.
+    """
+
+    if how not in _JOINS:
+        raise ValueError(f"Unsupported join: {how!r} (expected one of {', '.join(_JOINS)})")
+    if len(_paths(left_on)) != len(_paths(right_on)):
+        raise ValueError("Join key lists must have the same length")
+    left_key = _key_fn(left_on)
+    right_key = _key_fn(right_on)
+
+    table: Dict[Any, List[Dict[str, Any]]] = {}
+    for record in build:
+        key = right_key(record)
+        if key is MISSING:
+            if mode is MissingMode.RAISE:
+                raise KeyError(right_on)
+            continue
+        table.setdefault(key, []).append(record)
+
+    return _probe(probe, table, left_key, left_on, how == "left", mode)
+
+
+def _probe(
+    probe: Iterable[Any],
+    table: Dict[Any, List[Dict[str, Any]]],
+    left_key: Callable[[Any], Any],
+    left_on: JoinKeys,
+    outer: bool,
+    mode: MissingMode,
+) -> Iterator[Dict[str, Any]]:
+    keep_unkeyed = outer and mode is MissingMode.KEEP
+    for record in probe:
+        key = left_key(record)
+        if key is MISSING:
+            if mode is MissingMode.RAISE:
+                raise KeyError(left_on)
+            if keep_unkeyed:
+                yield record
+            continue
+        matches = table.get(key)
+        if matches:
+            for other in matches:
+                yield {**record, **other}
+        elif outer:
+            yield record
+
+
+def _paths(on: JoinKeys) -> Tuple[str, ...]:
+    return (on,) if isinstance(on, str) else tuple(on)
+
+
+def _key_fn(on: JoinKeys) -> Callable[[Any], Any]:
+    """Record -> hashable join key, or MISSING when any part is absent."""
+
+    accessors = [compile_path(p) for p in _paths(on)]
+    if len(accessors) == 1:
+        access = accessors[0]
+
+        def single(record: Any) -> Any:
+            value = access(record, MissingMode.KEEP)
+            return MISSING if is_missing(value) else _hashable(value)
+
+        return single
+
+    def composite(record: Any) -> Any:
+        parts = []
+        for access in accessors:
+            value = access(record, MissingMode.KEEP)
+            if is_missing(value):
+                return MISSING
+            parts.append(_hashable(value))
+        return tuple(parts)
+
+    return composite
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
@@ -22,6 +22,10 @@ class _MissingType:
     def __repr__(self) -> str:  # pragma: no cover - trivial
         return "<MISSING>"
 
+    def __reduce__(self) -> str:
+        # Unpickle to the module singleton so ``is MISSING`` holds across processes.
+        return "MISSING"
+
 
 MISSING = _MissingType()
 
@@ -0,0 +1,141 @@
+from __future__ import annotations
+import heapq
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Union
+
+from .access import compile_path
+from .missing import MissingMode, is_missing
+
+# A path ("age", "stats.score"), "-path" for descending, a list of those for
+# multi-key order, or a key callable.
+SortSpec = Union[str, Sequence[str], Callable[[Any], Any]]
+
+_FIELD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+class _Desc:
+    """Inverts ordering of a key component for descending sort specs."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Desc") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Desc) and self.value == other.value
+
+
+def is_plain_field(spec: SortSpec) -> bool:
+    """True for a single ascending top-level key, which has a columnar fast path."""
+
+    return isinstance(spec, str) and bool(_FIELD.match(spec))
+
+
+def sort_key(spec: SortSpec) -> Callable[[Any], Any]:
+    """Key function for ``spec``; records missing a key sort after the others."""
+
+    if callable(spec):
+        return spec
+    return _compiled_key(_fields(spec))
+
+
+def sort_items(items: Iterable[Any], spec: SortSpec) -> List[Any]:
+    if callable(spec):
+        return sorted(items, key=spec)
+    # One stable pass per key, last key first; ``reverse=True`` keeps ties
+    # stable, so descending keys need no wrapper objects.
+    out = list(items)
+    keep = MissingMode.KEEP
+    for field in reversed(_fields(spec)):
+        desc = field.startswith("-")
+        access = compile_path(field[1:] if desc else field)
+        present: List[Tuple[Any, Any]] = []
+        absent: List[Any] = []
+        for item in out:
+            value = access(item, keep)
+            if is_missing(value):
+                absent.append(item)
+            else:
+                present.append((value, item))
+        present.sort(key=_first, reverse=desc)
+        out = [item for _, item in present]
+        out += absent
+    return out
+
+
+def _first(pair: Tuple[Any, Any]) -> Any:
+    return pair[0]
+
+
+def select_k(items: Iterable[Any], n: int, spec: SortSpec, *, largest: bool = False) -> List[Any]:
+    """First ``n`` items of ``sort_items(items, spec)`` (reversed spec when ``largest``).
+
+    Uses a bounded heap, so ``items`` may be a stream and memory is O(n).
+    Ties keep input order, matching a stable full sort.
+    """
+
+    if n <= 0:
+        return []
+    if callable(spec):
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return select(n, items, key=spec)
+    fields = _fields(spec)
+    if largest:
+        fields = tuple(f[1:] if f.startswith("-") else "-" + f for f in fields)
+    if len(fields) == 1 and fields[0].startswith("-"):
+        # Single descending key: nlargest on a plain key avoids _Desc wrappers.
+        return heapq.nlargest(n, items, key=_rank_key(fields[0][1:]))
+    return heapq.nsmallest(n, items, key=_compiled_key(fields))
+
+
+def _fields(spec: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+    fields = (spec,) if isinstance(spec, str) else tuple(spec)
+    if not fields:
+        raise ValueError("Sort spec needs at least one key")
+    return fields
+
+
+@lru_cache(maxsize=256)
+def _rank_key(path: str) -> Callable[[Any], Tuple[int, Any]]:
+    """Key under which missing values rank lowest (for ``nlargest``)."""
+
+    access = compile_path(path)
+    keep = MissingMode.KEEP
+
+    def key(item: Any) -> Tuple[int, Any]:
+        value = access(item, keep)
+        return (0, None) if is_missing(value) else (1, value)
+
+    return key
+
+
+@lru_cache(maxsize=256)
+def _compiled_key(fields: Tuple[str, ...]) -> Callable[[Any], Any]:
+    parts = [(compile_path(f[1:] if f.startswith("-") else f), f.startswith("-")) for f in fields]
+    keep = MissingMode.KEEP
+    if len(parts) == 1:
+        access, desc = parts[0]
+
+        def single(item: Any) -> Tuple[int, Any]:
+            value = access(item, keep)
+            if is_missing(value):
+                return (1, None)
+            return (0, _Desc(value) if desc else value)
+
+        return single
+
+    def composite(item: Any) -> Tuple[Any, ...]:
+        out: List[Any] = []
+        for access, desc in parts:
+            value = access(item, keep)
+            if is_missing(value):
+                out += (1, None)
+            else:
+                out += (0, _Desc(value) if desc else value)
+        return tuple(out)
+
+    return composite
@@ -0,0 +1,76 @@
+from __future__ import annotations
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+from .seqview import _safe_apply, _safe_pred
+
+EXECUTORS = ("thread", "process")
+
+
+def parallel_map(
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+    *,
+    workers: int,
+    executor: str = "thread",
+    chunksize: Optional[int] = None,
+) -> List[Any]:
+    """Ordered ``_safe_apply`` of ``fn`` over ``items`` on a worker pool."""
+
+    out: List[Any] = []
+    for part in _run_chunks(_map_chunk, fn, items, workers, executor, chunksize):
+        out.extend(part)
+    return out
+
+
+def parallel_mask(
+    pred: Callable[[Any], bool],
+    items: Sequence[Any],
+    *,
+    workers: int,
+    executor: str = "thread",
+    chunksize: Optional[int] = None,
+) -> List[bool]:
+    """Ordered ``_safe_pred`` results of ``pred`` over ``items`` on a worker pool."""
+
+    out: List[bool] = []
+    for part in _run_chunks(_mask_chunk, pred, items, workers, executor, chunksize):
+        out.extend(part)
+    return out
+
+
+def _run_chunks(
+    task: Callable[[Callable[[Any], Any], Sequence[Any]], List[Any]],
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+    workers: int,
+    executor: str,
+    chunksize: Optional[int],
+) -> List[List[Any]]:
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if not items:
+        return []
+    size = chunksize or max(1, -(-len(items) // (workers * 4)))
+    chunks = [items[i : i + size] for i in range(0, len(items), size)]
+    if workers == 1 or len(chunks) == 1:
+        return [task(fn, chunk) for chunk in chunks]
+    pool: Executor
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    with pool:
+        return list(pool.map(task, [fn] * len(chunks), chunks))
+
+
+# Module-level so the process pool can pickle them. MISSING results come back
+# as the same singleton (see ``_MissingType.__reduce__``), so ``is MISSING`` holds.
+def _map_chunk(fn: Callable[[Any], Any], chunk: Sequence[Any]) -> List[Any]:
+    return [_safe_apply(fn, item) for item in chunk]
+
+
+def _mask_chunk(pred: Callable[[Any], bool], chunk: Sequence[Any]) -> List[bool]:
+    return [_safe_pred(pred, item) for item in chunk]
@@ -1,13 +1,51 @@
 from __future__ import annotations
+import json
 import re
-from typing import List, Union
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple, Union
 
-Token = Union[str, int]
 _IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_INT_RE = re.compile(r"-?\d+\Z")
+_DQ_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_SQ_RE = re.compile(r"'(?:[^'\\]|\\.)*'", re.S)
+
+
+class Wildcard:
+    """``*`` / ``[*]``: every element of a list or value of a dict."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "*"
+
+    def __reduce__(self) -> str:
+        return "WILDCARD"
+
+
+WILDCARD = Wildcard()
+
+
+@dataclass(frozen=True, slots=True)
+class Descend:
+    """``..key`` (or ``..*``): matches at any depth below the current value."""
+
+    key: Union[str, Wildcard]
+
+    def __repr__(self) -> str:
+        return f"..{self.key!r}"
+
+
+Token = Union[str, int, slice, Wildcard, Descend]
 
 
 def tokenize_path(expr: str) -> List[Token]:
-    """Turn ``a.b[0].c`` into tokens like ``[\"a\", \"b\", 0, \"c\"]``."""
+    """Turn a path into tokens: ``a.b[0].c`` -> ``["a", "b", 0, "c"]``.
+
+    Beyond keys and indices, ``[-1]`` counts from the end, ``[2:5]`` slices,
+    ``["content-type"]`` quotes keys that are not identifiers, ``*``/``[*]``
+    selects every child and ``..key`` / ``..*`` searches all depths.
+    """
 
     if not expr:
         return []
@@ -16,21 +54,34 @@ def tokenize_path(expr: str) -> List[Token]:
     n = len(expr)
     while i < n:
         ch = expr[i]
+        if expr.startswith("..", i):
+            i += 2
+            if expr.startswith("*", i):
+                tokens.append(Descend(WILDCARD))
+                i += 1
+                continue
+            if expr.startswith("[", i):
+                key, i = _bracket(expr, i)
+                if not isinstance(key, (str, Wildcard)):
+                    raise ValueError(f"Recursive descent needs a key or '*' in path: {expr}")
+                tokens.append(Descend(key))
+                continue
+            match = _IDENT_RE.match(expr, i)
+            if not match:
+                raise ValueError(f"Expected a key after '..' at: {expr[i:]} in {expr}")
+            tokens.append(Descend(match.group()))
+            i = match.end()
+            continue
         if ch == ".":
             i += 1
             continue
         if ch == "[":
-            end = expr.find("]", i + 1)
-            if end == -1:
-                raise ValueError(f"Unclosed '[' in path: {expr}")
-            raw = expr[i + 1 : end].strip()
-            if not raw:
-                raise ValueError(f"Empty index in path: {expr}")
-            try:
-                tokens.append(int(raw))
-            except ValueError as exc:
-                raise ValueError(f"Invalid index '{raw}' in path: {expr}") from exc
-            i = end + 1
+            token, i = _bracket(expr, i)
+            tokens.append(token)
+            continue
+        if ch == "*":
+            tokens.append(WILDCARD)
+            i += 1
             continue
         match = _IDENT_RE.match(expr, i)
         if not match:
@@ -38,3 +89,53 @@ def tokenize_path(expr: str) -> List[Token]:
         tokens.append(match.group())
         i = match.end()
     return tokens
+
+
+def _bracket(expr: str, i: int) -> Tuple[Token, int]:
+    """Parse the ``[...]`` starting at ``expr[i]``; return the token and the index after ``]``."""
+
+    pos = i + 1
+    while pos < len(expr) and expr[pos] == " ":
+        pos += 1
+    quoted = _DQ_RE.match(expr, pos) or _SQ_RE.match(expr, pos)
+    if quoted:
+        raw = quoted.group()
+        if raw[0] == "'":
+            raw = '"' + raw[1:-1].replace("\\'", "'").replace('"', '\\"') + '"'
+        token: Token = json.loads(raw)
+        end = expr.find("]", quoted.end())
+        if end == -1 or expr[quoted.end() : end].strip():
+            raise ValueError(f"Expected ']' after quoted key in path: {expr}")
+        return token, end + 1
+    end = expr.find("]", pos)
+    if end == -1:
+        raise ValueError(f"Unclosed '[' in path: {expr}")
+    raw = expr[pos:end].strip()
+    if not raw:
+        raise ValueError(f"Empty index in path: {expr}")
+    if raw == "*":
+        return WILDCARD, end + 1
+    if ":" in raw:
+        parts = [p.strip() for p in raw.split(":")]
+        if len(parts) > 3 or not all(p == "" or _INT_RE.match(p) for p in parts):
+            raise ValueError(f"Invalid slice '{raw}' in path: {expr}")
+        bounds = [int(p) if p else None for p in parts]
+        if len(bounds) == 3 and bounds[2] == 0:
+            raise ValueError(f"Slice step cannot be zero in path: {expr}")
+        return slice(*bounds), end + 1
+    if not _INT_RE.match(raw):
+        raise ValueError(f"Invalid index '{raw}' in path: {expr}")
+    return int(raw), end + 1
+
+
+def is_plain(tokens: Tuple[Token, ...]) -> bool:
+    """True when ``tokens`` has no ``*`` or ``..`` step (a single-value, vectorized path)."""
+
+    return not any(isinstance(t, (Wildcard, Descend)) for t in tokens)
+
+
+@lru_cache(maxsize=1024)
+def parse_path(expr: str) -> Tuple[Token, ...]:
+    """Cached, immutable form of :func:`tokenize_path`."""
+
+    return tuple(tokenize_path(expr))
@@ -0,0 +1,320 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .access import get_item
+from .missing import MISSING, MissingMode
+from .order import select_k
+from .project import projector
+from .seqview import SeqView, _safe_apply, _safe_pred
+from .traverse import iter_matches, iter_stream_matches
+from .value import JsonValue
+
+ItemSource = Callable[[], Iterable[Any]]
+
+# Stages that consume one item at a time; adjacent ones run as a single pass.
+_ELEMENTWISE = frozenset({"map", "filter", "reject", "pluck", "get", "flat", "unique", "project", "mode"})
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """One recorded step of a lazy plan."""
+
+    kind: str
+    arg: Any = None
+
+    def describe(self) -> str:
+        if self.kind in ("pluck", "get", "index", "mode", "fill"):
+            return f"{self.kind}({self.arg!r})"
+        return self.kind
+
+
+def execute(
+    v: JsonValue,
+    stages: Sequence[Stage],
+    source: Optional[ItemSource] = None,
+) -> Tuple[JsonValue, Optional[Iterator[Any]]]:
+    """Run ``stages`` and return ``(value, stream)``.
+
+    When ``stream`` is not None the result is a list whose items are produced
+    lazily by the iterator, and ``value.value`` must be ignored.
+    """
+
+    stream: Optional[Iterator[Any]] = iter(source()) if source is not None else None
+    i, n = 0, len(stages)
+    while i < n:
+        stage = stages[i]
+        if stage.kind == "mode":
+            v = v.with_mode(stage.arg)
+            i += 1
+            continue
+        if stage.kind in _ELEMENTWISE:
+            if stream is None and stage.kind == "pluck" and not isinstance(v.value, list):
+                v = v.replace(value=get_item(v, stage.arg))
+                i += 1
+                continue
+            steps: List[Callable[[Any], Any]] = []
+            mode = v.mode
+            while i < n and stages[i].kind in _ELEMENTWISE:
+                if stages[i].kind == "mode":
+                    mode = stages[i].arg
+                else:
+                    steps.append(_STEP_FACTORIES[stages[i].kind](stages[i].arg, mode))
+                i += 1
+            v = v.with_mode(mode)
+            items = stream if stream is not None else v.as_list()
+            stream = _drive(items, steps, 0)
+            continue
+        if stage.kind == "match":
+            # Wildcard/descent paths: matches are generated lazily.
+            if stream is None:
+                stream = iter_matches(v.value, stage.arg, v.mode)
+            else:
+                stream = iter_stream_matches(stream, stage.arg, v.mode)
+            i += 1
+            continue
+        if stage.kind == "top_k":
+            count, spec, largest = stage.arg
+            items = stream if stream is not None else SeqView(v)._iter()
+            v, stream = v.replace(value=select_k(items, count, spec, largest=largest)), None
+        elif stage.kind == "sort_by" and i + 1 < n and _heap_index(stages[i + 1]):
+            # sort_by(...)[k] only needs the k+1 smallest items: heap-select them.
+            items = stream if stream is not None else SeqView(v)._iter()
+            v, stream = v.replace(value=select_k(items, stages[i + 1].arg + 1, stage.arg)), None
+        elif stage.kind == "index" and stream is not None:
+            v, stream = _index_stream(v, stream, stage.arg), None
+        elif stage.kind == "fill":
+            if stream is None:
+                v = v.fill_missing(stage.arg)
+        else:
+            if stream is not None:
+                v, stream = v.replace(value=list(stream)), None
+            v = _BARRIERS[stage.kind](v, stage.arg)
+        i += 1
+    return v, stream
+
+
+def explain(stages: Sequence[Stage]) -> str:
+    """Render a plan, bracketing the stages that run as one fused pass."""
+
+    parts: List[str] = []
+    run: List[str] = []
+    for stage in stages:
+        if stage.kind in _ELEMENTWISE:
+            run.append(stage.describe())
+            continue
+        if run:
+            parts.append("fused[" + " -> ".join(run) + "]")
+            run = []
+        parts.append(stage.describe())
+    if run:
+        parts.append("fused[" + " -> ".join(run) + "]")
+    return " => ".join(parts) if parts else "source"
+
+
+def pluck_items(items: Iterable[Any], keys: Sequence[str], mode: MissingMode) -> Iterator[Any]:
+    """Vectorized pluck of ``keys`` in turn over a stream of items."""
+
+    return _drive(items, [_pluck_step(key, mode) for key in keys], 0)
+
+
+def item_runner(stages: Sequence[Stage], mode: MissingMode) -> Callable[[Any], Iterator[Any]]:
+    """Fused elementwise ``stages`` as ``item -> outputs``, for push-style callers."""
+
+    steps = [_STEP_FACTORIES[stage.kind](stage.arg, mode) for stage in stages]
+
+    def run(item: Any) -> Iterator[Any]:
+        return _drive((item,), steps, 0)
+
+    return run
+
+
+# ----- fused elementwise execution -----
+
+_SKIP = object()
+
+
+class _Spread:
+    """Step result that fans out into several items for the remaining steps."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+
+
+def _drive(items: Iterable[Any], steps: Sequence[Callable[[Any], Any]], start: int) -> Iterator[Any]:
+    n = len(steps)
+    for item in items:
+        for i in range(start, n):
+            item = steps[i](item)
+            if item is _SKIP:
+                break
+            if item.__class__ is _Spread:
+                yield from _drive(item.items, steps, i + 1)
+                break
+        else:
+            yield item
+
+
+def _map_step(fn: Callable[[Any], Any], mode: MissingMode) -> Callable[[Any], Any]:
+    drop = mode is MissingMode.DROP
+
+    def step(item: Any) -> Any:
+        if drop and item is MISSING:
+            return _SKIP
+        return _safe_apply(fn, item)
+
+    return step
+
+
+def _filter_step(pred: Callable[[Any], bool], mode: MissingMode) -> Callable[[Any], Any]:
+    drop = mode is MissingMode.DROP
+
+    def step(item: Any) -> Any:
+        if drop and item is MISSING:
+            return _SKIP
+        return item if _safe_pred(pred, item) else _SKIP
+
+    return step
+
+
+def _reject_step(pred: Callable[[Any], bool], mode: MissingMode) -> Callable[[Any], Any]:
+    drop = mode is MissingMode.DROP
+
+    def step(item: Any) -> Any:
+        if drop and item is MISSING:
+            return _SKIP
+        return _SKIP if _safe_pred(pred, item) else item
+
+    return step
+
+
+def _pluck_step(key: str, mode: MissingMode) -> Callable[[Any], Any]:
+    def step(item: Any) -> Any:
+        result = item.get(key, MISSING) if isinstance(item, dict) else MISSING
+        if result is MISSING:
+            if mode is MissingMode.RAISE:
+                raise KeyError(key)
+            return _SKIP if mode is MissingMode.DROP else MISSING
+        if isinstance(result, list):
+            return _Spread(result)
+        return result
+
+    return step
+
+
+def _get_step(tokens: Tuple[Any, ...], mode: MissingMode) -> Callable[[Any], Any]:
+    # Per-item path: unlike ``pluck``, lists found along the way stay whole.
+    def step(item: Any) -> Any:
+        for token in tokens:
+            if isinstance(token, str):
+                item = item.get(token, MISSING) if isinstance(item, dict) else MISSING
+            elif isinstance(item, list) and -len(item) <= token < len(item):
+                item = item[token]
+            else:
+                item = MISSING
+            if item is MISSING:
+                if mode is MissingMode.RAISE:
+                    raise KeyError(token)
+                return _SKIP if mode is MissingMode.DROP else MISSING
+        return item
+
+    return step
+
+
+def _flat_step(_: Any, mode: MissingMode) -> Callable[[Any], Any]:
+    drop = mode is MissingMode.DROP
+
+    def step(item: Any) -> Any:
+        if drop and item is MISSING:
+            return _SKIP
+        if isinstance(item, list):
+            return _Spread(item)
+        return item
+
+    return step
+
+
+def _unique_step(keyfn: Optional[Callable[[Any], Any]], mode: MissingMode) -> Callable[[Any], Any]:
+    drop = mode is MissingMode.DROP
+    seen = set()
+
+    def step(item: Any) -> Any:
+        if drop and item is MISSING:
+            return _SKIP
+        marker = keyfn(item) if keyfn else item
+        if marker in seen:
+            return _SKIP
+        seen.add(marker)
+        return item
+
+    return step
+
+
+def _project_step(arg: Tuple[Mapping[str, str], str], mode: MissingMode) -> Callable[[Any], Any]:
+    row = projector(arg[0], mode, arg[1])
+    drop = mode is MissingMode.DROP
+
+    def step(item: Any) -> Any:
+        if drop and item is MISSING:
+            return _SKIP
+        return row(item)
+
+    return step
+
+
+_STEP_FACTORIES = {
+    "map": _map_step,
+    "filter": _filter_step,
+    "reject": _reject_step,
+    "pluck": _pluck_step,
+    "get": _get_step,
+    "flat": _flat_step,
+    "unique": _unique_step,
+    "project": _project_step,
+}
+
+
+# ----- barriers (need the whole input) -----
+
+_HEAP_LIMIT = 1024
+
+
+def _heap_index(stage: Stage) -> bool:
+    return stage.kind == "index" and isinstance(stage.arg, int) and 0 <= stage.arg < _HEAP_LIMIT
+
+
+_END = object()
+
+
+def _index_stream(v: JsonValue, stream: Iterator[Any], key: Any) -> JsonValue:
+    if isinstance(key, int) and key >= 0:
+        value = next(islice(stream, key, None), _END)
+        if value is _END:
+            if v.mode is MissingMode.RAISE:
+                raise IndexError("list index out of range")
+            value = MISSING
+        return v.replace(value=value)
+    v = v.replace(value=list(stream))
+    return v.replace(value=get_item(v, key))
+
+
+def _index(v: JsonValue, key: Any) -> JsonValue:
+    return v.replace(value=get_item(v, key))
+
+
+def _sort_by(v: JsonValue, keyfn: Callable[[Any], Any]) -> JsonValue:
+    return SeqView(v).sort_by(keyfn).to_value()
+
+
+def _apply(v: JsonValue, operator: Callable[[JsonValue], JsonValue]) -> JsonValue:
+    return operator(v)
+
+
+_BARRIERS = {
+    "index": _index,
+    "sort_by": _sort_by,
+    "apply": _apply,
+}
@@ -0,0 +1,188 @@
+from __future__ import annotations
+import json
+import operator
+import re
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .access import compile_path
+from .missing import MISSING, MissingMode
+from .path import is_plain, parse_path
+
+OPS = ("==", "!=", "<", "<=", ">", ">=", "in")
+
+_ORDER = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+# A JSON number token, as it follows ``"key":`` in raw text.
+_NUMBER = rb"(-?[0-9][0-9.eE+-]*)"
+_COLON = rb"[ \t\r\n]*:[ \t\r\n]*"
+# Keys and strings made of these characters have exactly one escape-free JSON spelling.
+_UNSAFE_RE = re.compile(r'["\\/\x00-\x1f\x7f]')
+
+RawTest = Callable[[Union[str, bytes]], bool]
+
+
+class Where:
+    """Declarative ``path op value`` test on one record, e.g. ``Where("status", "==", "error")``.
+
+    A missing path never matches, not even ``!=``. ``==``/``!=``/``in``
+    compare like Python but keep booleans apart from numbers; ordering
+    operators only compare numbers with numbers and strings with strings.
+    Because the test is data rather than code, NDJSON sources can run
+    ``raw_test`` on the undecoded line first and skip most non-matching records.
+    """
+
+    __slots__ = ("path", "op", "value", "_get", "_test")
+
+    def __init__(self, path: str, op: str, value: Any):
+        if op not in OPS:
+            raise ValueError(f"op must be one of {OPS}, got {op!r}")
+        tokens = parse_path(path)
+        if not is_plain(tokens):
+            raise ValueError(f"where() needs a path without '*' or '..': {path!r}")
+        if op == "in":
+            if isinstance(value, (str, bytes, dict)) or not isinstance(value, Iterable):
+                raise TypeError("'in' needs a list, tuple or set of values")
+            value = tuple(value)
+        self.path = path
+        self.op = op
+        self.value = value
+        self._get = compile_path(path)
+        self._test = _tester(op, value)
+
+    def __call__(self, item: Any) -> bool:
+        found = self._get(item, MissingMode.DROP)
+        return found is not MISSING and self._test(found)
+
+    def __repr__(self) -> str:
+        return f"where({self.path!r} {self.op} {self.value!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Where, (self.path, self.op, self.value))
+
+    def raw_patterns(self) -> Optional[List[Tuple[bytes, Optional["re.Pattern[bytes]"], Callable[[bytes], bool]]]]:
+        """Necessary conditions on the raw text of a matching record, or None if there are none.
+
+        Each entry is ``(needle, pattern, check)``: a matching record
+        contains ``needle``, and when ``pattern`` is set one of its matches
+        passes ``check``. Only the last key of the path is looked for, and
+        its value only when the path ends in that key (not in an index).
+        """
+
+        if self.op == "!=":
+            return None
+        tokens = parse_path(self.path)
+        keys = [t for t in tokens if isinstance(t, str)]
+        if not keys or _UNSAFE_RE.search(keys[-1]):
+            return None
+        key = json.dumps(keys[-1], ensure_ascii=False).encode("utf-8")
+        if not isinstance(tokens[-1], str):
+            return [(key, None, _always)]
+        head = re.escape(key) + _COLON
+        values = self.value if self.op == "in" else (self.value,)
+        if self.op in ("==", "in") and all(_literal(v) is not None for v in values):
+            spelled = b"|".join(re.escape(_literal(v)) for v in values)  # type: ignore[arg-type]
+            return [(key, re.compile(head + b"(?:" + spelled + b")"), _always)]
+        if all(_is_number(v) for v in values):
+            return [(key, re.compile(head + _NUMBER), lambda tok: self._test(_number(tok)))]
+        return [(key, None, _always)]
+
+
+def raw_test(preds: Sequence[Where]) -> Optional[RawTest]:
+    """``line -> bool`` that is False only for lines none of ``preds``' records could match.
+
+    Lines containing a ``\\u`` escape always pass, since keys and strings
+    may be spelled differently there; they are decided after decoding.
+    """
+
+    checks: List[Tuple[bytes, Optional["re.Pattern[bytes]"], Callable[[bytes], bool]]] = []
+    for pred in preds:
+        checks.extend(pred.raw_patterns() or ())
+    if not checks:
+        return None
+    text_checks = [(needle.decode("utf-8"), _text_pattern(pattern), check) for needle, pattern, check in checks]
+
+    def test(line: Union[str, bytes]) -> bool:
+        if line.__class__ is bytes:
+            if b"\\u" in line:
+                return True
+            todo = checks
+        else:
+            if "\\u" in line:
+                return True
+            todo = text_checks  # type: ignore[assignment]
+        for needle, pattern, check in todo:
+            if needle not in line:
+                return False
+            if pattern is not None and not any(map(check, _tokens(pattern, line))):
+                return False
+        return True
+
+    return test
+
+
+# ----- comparisons -----
+
+
+def _is_number(v: Any) -> bool:
+    return v.__class__ in (int, float)
+
+
+def _same(a: Any, b: Any) -> bool:
+    if (a.__class__ is bool) is not (b.__class__ is bool):
+        return False
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _tester(op: str, value: Any) -> Callable[[Any], bool]:
+    if op == "==":
+        return lambda found: _same(found, value)
+    if op == "!=":
+        return lambda found: not _same(found, value)
+    if op == "in":
+        return lambda found: any(_same(found, v) for v in value)
+    compare = _ORDER[op]
+    if _is_number(value):
+        return lambda found: _is_number(found) and compare(found, value)
+    if isinstance(value, str):
+        return lambda found: isinstance(found, str) and compare(found, value)
+    raise TypeError(f"{op!r} needs a number or string, got {value!r}")
+
+
+# ----- raw text -----
+
+
+def _always(tok: Any) -> bool:
+    return True
+
+
+def _literal(v: Any) -> Optional[bytes]:
+    """The only JSON spelling of ``v`` in escape-free text, if it has just one."""
+
+    if v is None or v.__class__ is bool:
+        return json.dumps(v).encode()
+    if isinstance(v, str) and not _UNSAFE_RE.search(v):
+        return json.dumps(v, ensure_ascii=False).encode("utf-8")
+    return None
+
+
+def _number(tok: Union[str, bytes]) -> Any:
+    # Integers stay ints so large values compare exactly.
+    try:
+        return int(tok)
+    except ValueError:
+        try:
+            return float(tok)
+        except ValueError:
+            return MISSING
+
+
+def _text_pattern(pattern: Optional["re.Pattern[bytes]"]) -> Optional["re.Pattern[str]"]:
+    return None if pattern is None else re.compile(pattern.pattern.decode("utf-8"))
+
+
+def _tokens(pattern: "re.Pattern[Any]", line: Any) -> Iterable[Any]:
+    if pattern.groups:
+        return pattern.findall(line)
+    return (True,) if pattern.search(line) else ()
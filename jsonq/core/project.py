@@ -0,0 +1,141 @@
+from __future__ import annotations
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .access import compile_path
+from .path import parse_path
+from .missing import MISSING, MissingMode
+
+SHAPES = ("dict", "tuple", "columns")
+
+
+def projector(
+    fields: Mapping[str, str], mode: MissingMode, shape: str = "dict"
+) -> Callable[[Any], Any]:
+    """``record -> row`` extracting every ``name: path`` of ``fields`` in one visit.
+
+    A missing path is left out of dict rows and becomes None in tuple rows
+    under DROP, is MISSING under KEEP, and raises KeyError under RAISE.
+    """
+
+    if shape not in ("dict", "tuple"):
+        raise ValueError(f"Unsupported row shape: {shape!r}")
+    names = tuple(fields)
+    paths = tuple(fields.values())
+    fast = _strict_row(paths)
+    getters = [_getter(p) for p in paths]
+    drop = mode is MissingMode.DROP
+    filler = None if drop else MISSING
+
+    def read(record: Any) -> List[Any]:
+        values = [get(record) for get in getters]
+        if mode is MissingMode.RAISE:
+            for path, value in zip(paths, values):
+                if value is MISSING:
+                    raise KeyError(path)
+        return values
+
+    if shape == "dict":
+
+        def to_dict(record: Any) -> Dict[str, Any]:
+            if fast is not None:
+                try:
+                    return dict(zip(names, fast(record)))
+                except (LookupError, TypeError):
+                    pass
+            values = read(record)
+            if drop:
+                return {n: v for n, v in zip(names, values) if v is not MISSING}
+            return dict(zip(names, values))
+
+        return to_dict
+
+    def to_tuple(record: Any) -> Tuple[Any, ...]:
+        if fast is not None:
+            try:
+                return fast(record)
+            except (LookupError, TypeError):
+                pass
+        return tuple([filler if v is MISSING else v for v in read(record)])
+
+    return to_tuple
+
+
+def project_columns(items: Iterable[Any], fields: Mapping[str, str], mode: MissingMode) -> Dict[str, List[Any]]:
+    """Column dict ``{name: [value per record]}`` built in a single pass."""
+
+    row = projector(fields, mode, "tuple")
+    rows = [row(record) for record in items]
+    # Records are read once; splitting the row tuples is a cheap list pass.
+    return {name: [r[i] for r in rows] for i, name in enumerate(fields)}
+
+
+def as_fields(paths: Sequence[str]) -> Dict[str, str]:
+    """``select`` names each output after its path."""
+
+    return {p: p for p in paths}
+
+
+def _strict_row(paths: Sequence[str]) -> Optional[Callable[[Any], Tuple[Any, ...]]]:
+    """Tuple of all paths via plain subscripts, raising on any miss.
+
+    Only built when every path is a chain of string keys, so any non-dict
+    step raises TypeError; callers then fall back to the MISSING-aware getters.
+    """
+
+    chains = [parse_path(p) for p in paths]
+    if not all(chain and all(isinstance(t, str) for t in chain) for chain in chains):
+        return None
+    if all(len(chain) == 1 for chain in chains):
+        get = itemgetter(*(chain[0] for chain in chains))
+        if len(chains) == 1:
+            return lambda record: (get(record),)
+        return get
+    getters = [_strict_chain(chain) for chain in chains]
+    return lambda record: tuple([get(record) for get in getters])
+
+
+def _strict_chain(chain: Tuple[str, ...]) -> Callable[[Any], Any]:
+    if len(chain) == 1:
+        return itemgetter(chain[0])
+    if len(chain) == 2:
+        a, b = chain
+        return lambda record: record[a][b]
+
+    def get(record: Any) -> Any:
+        for key in chain:
+            record = record[key]
+        return record
+
+    return get
+
+
+def _getter(path: str) -> Callable[[Any], Any]:
+    """Raw accessor for ``path``; chains of dict keys skip the generic walk."""
+
+    access = compile_path(path)
+    tokens = parse_path(path)
+    if not all(isinstance(t, str) for t in tokens):
+        return lambda record: access(record, MissingMode.KEEP)
+    if len(tokens) == 1:
+        key = tokens[0]
+
+        def get_key(record: Any) -> Any:
+            if record.__class__ is dict:
+                return record.get(key, MISSING)
+            return access(record, MissingMode.KEEP)
+
+        return get_key
+
+    def get_keys(record: Any) -> Any:
+        cur = record
+        for key in tokens:
+            if cur.__class__ is not dict:
+                # Lists (vectorized steps) and other values take the full path.
+                return access(record, MissingMode.KEEP)
+            cur = cur.get(key, MISSING)
+            if cur is MISSING:
+                return MISSING
+        return cur
+
+    return get_keys
@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import Any, Callable, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Mapping, Optional
 
 from .value import JsonValue
 from .missing import MISSING, MissingMode, is_missing
+from .order import SortSpec, is_plain_field, select_k, sort_items
+from .project import project_columns, projector
 
 
 class SeqView:
@@ -18,11 +20,34 @@ class SeqView:
                 continue
             yield item
 
-    def map(self, fn: Callable[[Any], Any]) -> SeqView:
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        *,
+        workers: Optional[int] = None,
+        executor: str = "thread",
+    ) -> SeqView:
+        if workers is not None:
+            from .parallel import parallel_map
+
+            out = parallel_map(fn, list(self._iter()), workers=workers, executor=executor)
+            return _wrap_seq(self._v, out)
         out = [_safe_apply(fn, item) for item in self._iter()]
         return _wrap_seq(self._v, out)
 
-    def filter(self, pred: Callable[[Any], bool]) -> SeqView:
+    def filter(
+        self,
+        pred: Callable[[Any], bool],
+        *,
+        workers: Optional[int] = None,
+        executor: str = "thread",
+    ) -> SeqView:
+        if workers is not None:
+            from .parallel import parallel_mask
+
+            items = list(self._iter())
+            mask = parallel_mask(pred, items, workers=workers, executor=executor)
+            return _wrap_seq(self._v, [item for item, keep in zip(items, mask) if keep])
         out = [item for item in self._iter() if _safe_pred(pred, item)]
         return _wrap_seq(self._v, out)
 
@@ -30,10 +55,47 @@ class SeqView:
         out = [item for item in self._iter() if not _safe_pred(pred, item)]
         return _wrap_seq(self._v, out)
 
-    def sort_by(self, keyfn: Callable[[Any], Any]) -> SeqView:
-        out = sorted(list(self._iter()), key=keyfn)
+    def filter_by(self, key: str, pred: Callable[[Any], bool]) -> SeqView:
+        """Keep records whose field ``key`` is present and satisfies ``pred``."""
+
+        store = self._v.columns
+        if store is not None:
+            return _wrap_columns(self._v, store.take(store.select(key, pred)))
+        out = [
+            item
+            for item in self._iter()
+            if isinstance(item, dict)
+            and not is_missing(item.get(key, MISSING))
+            and _safe_pred(pred, item[key])
+        ]
         return _wrap_seq(self._v, out)
 
+    def sort_by(self, spec: SortSpec) -> SeqView:
+        if is_plain_field(spec):
+            return self._sort_field(spec)
+        return _wrap_seq(self._v, sort_items(self._iter(), spec))
+
+    def top_k(self, n: int, spec: SortSpec) -> SeqView:
+        """The ``n`` largest items by ``spec``, largest first, via a bounded heap."""
+        return _wrap_seq(self._v, select_k(self._iter(), n, spec, largest=True))
+
+    def bottom_k(self, n: int, spec: SortSpec) -> SeqView:
+        return _wrap_seq(self._v, select_k(self._iter(), n, spec))
+
+    def _sort_field(self, key: str) -> SeqView:
+        # Records lacking the field keep their order after the sorted ones.
+        store = self._v.columns
+        if store is not None:
+            drop = self._v.mode is MissingMode.DROP
+            return _wrap_columns(self._v, store.take(store.argsort(key, skip_missing_rows=drop)))
+        present: List[Any] = []
+        absent: List[Any] = []
+        for item in self._iter():
+            has = isinstance(item, dict) and not is_missing(item.get(key, MISSING))
+            (present if has else absent).append(item)
+        present.sort(key=lambda item: item[key])
+        return _wrap_seq(self._v, present + absent)
+
     def unique(self, keyfn: Optional[Callable[[Any], Any]] = None) -> SeqView:
         seen = set()
         out = []
@@ -53,6 +115,13 @@ class SeqView:
                 out.append(item)
         return _wrap_seq(self._v, out)
 
+    def project(self, fields: Mapping[str, str], shape: str = "dict") -> SeqView:
+        """One row (dict or tuple) per item, or a column dict for ``shape="columns"``."""
+        if shape == "columns":
+            return _wrap_seq(self._v, project_columns(self._iter(), fields, self._v.mode))
+        row = projector(fields, self._v.mode, shape)
+        return _wrap_seq(self._v, [row(item) for item in self._iter()])
+
     def unwrap(self) -> Any:
         return self._v.unwrap()
 
@@ -77,3 +146,7 @@ def _safe_apply(fn: Callable[[Any], Any], value: Any) -> Any:
 
 def _wrap_seq(v: JsonValue, out: List[Any]) -> SeqView:
     return SeqView(v.replace(value=out))
+
+
+def _wrap_columns(v: JsonValue, store: Any) -> SeqView:
+    return SeqView(v.replace(value=store.rows, columns=store))
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+from .missing import MISSING, MissingMode
+from .path import Descend, Token, Wildcard, parse_path
+
+# Step kinds; a compiled path is a tuple of (kind, arg).
+_KEY, _INDEX, _SLICE, _ALL, _DESCEND = range(5)
+
+Step = Tuple[int, Any]
+Matcher = Callable[[Any, MissingMode], Iterator[Any]]
+
+_END = object()
+
+
+def compile_steps(tokens: Tuple[Token, ...]) -> Tuple[Step, ...]:
+    steps: List[Step] = []
+    for token in tokens:
+        if isinstance(token, str):
+            steps.append((_KEY, token))
+        elif isinstance(token, int):
+            steps.append((_INDEX, token))
+        elif isinstance(token, slice):
+            steps.append((_SLICE, token))
+        elif isinstance(token, Wildcard):
+            steps.append((_ALL, None))
+        elif isinstance(token, Descend):
+            steps.append((_DESCEND, None if isinstance(token.key, Wildcard) else token.key))
+        else:
+            raise TypeError(f"Unsupported path token: {token!r}")
+    return tuple(steps)
+
+
+@lru_cache(maxsize=1024)
+def compile_matcher(expr: str) -> Matcher:
+    """Cached ``(value, mode) -> iterator of matches`` for ``expr``.
+
+    Matches are produced lazily by an explicit-stack walk, so taking the
+    first one stops the traversal. After ``*``, a slice or ``..key``, each
+    later step applies to every match separately (a key step on a list
+    applies to each element). A key or index a match lacks is skipped under
+    DROP, yields MISSING under KEEP and raises under RAISE; ``*`` and
+    ``..key`` simply find nothing below scalars.
+    """
+
+    steps = compile_steps(parse_path(expr))
+    return lambda value, mode: iter_matches(value, steps, mode)
+
+
+def iter_matches(value: Any, steps: Tuple[Step, ...], mode: MissingMode) -> Iterator[Any]:
+    return _traverse(iter((value,)), 0, steps, mode)
+
+
+def iter_stream_matches(items: Iterable[Any], steps: Tuple[Step, ...], mode: MissingMode) -> Iterator[Any]:
+    """``iter_matches`` over a list given as a stream of its items, without collecting it."""
+
+    if not steps:
+        return iter(items)
+    kind = steps[0][0]
+    if kind == _ALL:
+        return _traverse(iter(items), 1, steps, mode)
+    if kind in (_INDEX, _SLICE):
+        return iter_matches(list(items), steps, mode)
+    # Key and descent steps on a list apply to each element.
+    return _traverse(iter(items), 0, steps, mode)
+
+
+def _traverse(nodes: Iterator[Any], start: int, steps: Tuple[Step, ...], mode: MissingMode) -> Iterator[Any]:
+    n = len(steps)
+    raise_missing = mode is MissingMode.RAISE
+    keep_missing = mode is MissingMode.KEEP
+    # Each frame is (pending nodes, index of the step to apply to them).
+    stack: List[Tuple[Iterator[Any], int]] = [(nodes, start)]
+    while stack:
+        it, i = stack[-1]
+        node = next(it, _END)
+        if node is _END:
+            stack.pop()
+            continue
+        while i < n:
+            kind, arg = steps[i]
+            if kind == _KEY:
+                if isinstance(node, dict):
+                    nxt = node.get(arg, MISSING)
+                    if nxt is not MISSING:
+                        node = nxt
+                        i += 1
+                        continue
+                elif isinstance(node, list):
+                    stack.append((iter(node), i))
+                    break
+                if raise_missing:
+                    raise KeyError(arg)
+            elif kind == _INDEX:
+                if isinstance(node, list) and -len(node) <= arg < len(node):
+                    node = node[arg]
+                    i += 1
+                    continue
+                if raise_missing:
+                    raise IndexError("list index out of range")
+            elif kind == _ALL:
+                if isinstance(node, dict):
+                    stack.append((iter(node.values()), i + 1))
+                elif isinstance(node, list):
+                    stack.append((iter(node), i + 1))
+                break
+            elif kind == _SLICE:
+                if isinstance(node, list):
+                    stack.append((map(node.__getitem__, range(len(node))[arg]), i + 1))
+                break
+            else:
+                stack.append((_descend(node, arg), i + 1))
+                break
+            # A key or index this match lacks.
+            if keep_missing:
+                yield MISSING
+            break
+        else:
+            yield node
+
+
+def _descend(root: Any, key: Any) -> Iterator[Any]:
+    """Pre-order values of ``key`` in every dict at or below ``root``.
+
+    With ``key=None`` (``..*``) every value below ``root`` is yielded instead.
+    """
+
+    if key is None:
+        return _descendants(root)
+    return _key_descend(root, key)
+
+
+_CONTAINERS = (dict, list)
+
+
+def _key_descend(root: Any, key: str) -> Iterator[Any]:
+    # A stack of nodes rather than iterators: only containers are pushed,
+    # and scalars are filtered out by one comprehension per container.
+    stack = [root] if isinstance(root, _CONTAINERS) else []
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        if isinstance(node, dict):
+            found = node.get(key, _END)
+            if found is not _END:
+                yield found
+            extend([v for v in reversed(node.values()) if isinstance(v, _CONTAINERS)])
+        else:
+            extend([v for v in reversed(node) if isinstance(v, _CONTAINERS)])
+
+
+def _descendants(root: Any) -> Iterator[Any]:
+    stack = _children(root)
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        yield node
+        if isinstance(node, _CONTAINERS):
+            extend(_children(node))
+
+
+def _children(node: Any) -> List[Any]:
+    """Children of ``node`` in reverse, ready to be popped in order."""
+
+    if isinstance(node, dict):
+        return list(reversed(node.values()))
+    if isinstance(node, list):
+        return list(reversed(node))
+    return []
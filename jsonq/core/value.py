@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, List
 
 from .missing import MISSING, MissingMode, is_missing
@@ -12,6 +12,8 @@ class JsonValue:
     value: Any
     mode: MissingMode
     strict: bool = False
+    # Optional ColumnStore over ``value`` (a list of records); dropped when value changes.
+    columns: Any = field(default=None, compare=False, repr=False)
 
     _SAME = object()
 
@@ -27,13 +29,23 @@ class JsonValue:
         value: Any | object = _SAME,
         mode: MissingMode | object = _SAME,
         strict: bool | object = _SAME,
+        columns: Any = _SAME,
     ) -> JsonValue:
         new_value = self.value if value is JsonValue._SAME else value
         new_mode = self.mode if mode is JsonValue._SAME else mode
         new_strict = self.strict if strict is JsonValue._SAME else strict
-        if new_value is self.value and new_mode is self.mode and new_strict is self.strict:
+        if columns is not JsonValue._SAME:
+            new_columns = columns
+        else:
+            new_columns = self.columns if new_value is self.value else None
+        if (
+            new_value is self.value
+            and new_mode is self.mode
+            and new_strict is self.strict
+            and new_columns is self.columns
+        ):
             return self
-        return JsonValue(new_value, mode=new_mode, strict=new_strict)  # type: ignore[arg-type]
+        return JsonValue(new_value, mode=new_mode, strict=new_strict, columns=new_columns)  # type: ignore[arg-type]
 
     @staticmethod
     def is_missing(x: Any) -> bool:
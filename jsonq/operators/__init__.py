@@ -1,5 +1,6 @@
 from .base import JsonOperator, identity, pipe
-from . import access, seq, missing
+from . import access, seq, missing, profile
+from .profile import Profiler
 
 __all__ = [
     "JsonOperator",
@@ -8,4 +9,6 @@ __all__ = [
     "access",
     "seq",
     "missing",
+    "profile",
+    "Profiler",
 ]
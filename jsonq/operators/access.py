@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ..core.access import apply_path, get_item
-from ..core.path import tokenize_path
+from ..core.access import compile_path, get_item
 from ..core.value import JsonValue
 from .base import JsonOperator
 
@@ -16,9 +15,9 @@ def getitem(key: Any) -> JsonOperator:
 
 
 def path(expr: str) -> JsonOperator:
-    tokens = tuple(tokenize_path(expr))
+    access = compile_path(expr)
 
     def op(value: JsonValue) -> JsonValue:
-        return value.replace(value=apply_path(value, tokens))
+        return value.replace(value=access(value.value, value.mode))
 
     return op
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Callable, Protocol
 
 from ..core.value import JsonValue
+from . import profile
 
 
 class JsonOperator(Protocol):
@@ -14,9 +15,14 @@ def pipe(*ops: JsonOperator) -> JsonOperator:
     """Compose multiple JsonOperators into one pipeline."""
 
     def composed(value: JsonValue) -> JsonValue:
+        profiler = profile.ACTIVE.get()
         out = value
-        for op in ops:
-            out = op(out)
+        if profiler is None:
+            for op in ops:
+                out = op(out)
+            return out
+        for i, op in enumerate(ops):
+            out = profiler.run(f"pipe[{i}]:{profile.stage_name(op)}", op, out)
         return out
 
     return composed
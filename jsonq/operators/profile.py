@@ -0,0 +1,117 @@
+from __future__ import annotations
+import time
+import tracemalloc
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.missing import is_missing
+from ..core.value import JsonValue
+
+# The profiler collecting in the current thread / async task, if any. ``pipe``
+# and ``Q.apply`` only read this, so instrumentation costs nothing while it is None.
+ACTIVE: ContextVar[Optional["Profiler"]] = ContextVar("jsonq_profiler", default=None)
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+    alloc_bytes: int = 0
+
+
+class Profiler:
+    """Collect per-operator timings while active.
+
+    ``with Profiler() as prof:`` (or ``Q.profile()``) records every operator
+    run through ``pipe`` or ``Q.apply``: call count, wall time, input/output
+    cardinality and, with ``memory=True``, peak bytes allocated per stage via
+    ``tracemalloc`` (a stage's peak includes the stages nested inside it).
+    Activation is per thread and per async task, so concurrent code profiled
+    separately does not mix.
+    """
+
+    def __init__(self, *, memory: bool = False):
+        self.memory = memory
+        self.stats: Dict[str, StageStats] = {}
+        self._tokens: List[Token[Optional[Profiler]]] = []
+        # [base bytes, peak bytes seen so far] of each stage still running, outermost first.
+        self._frames: List[List[int]] = []
+        self._started_tracing = False
+
+    def __enter__(self) -> Profiler:
+        self._tokens.append(ACTIVE.set(self))
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        ACTIVE.reset(self._tokens.pop())
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def run(self, name: str, op: Callable[[JsonValue], JsonValue], value: JsonValue) -> JsonValue:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = StageStats()
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._frames:
+                # reset_peak below would lose the enclosing stage's peak so far.
+                outer = self._frames[-1]
+                outer[1] = max(outer[1], peak)
+            frame = [current, current]
+            self._frames.append(frame)
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            out = op(value)
+        finally:
+            stats.seconds += time.perf_counter() - start
+            if self.memory:
+                self._frames.pop()
+                peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+                stats.alloc_bytes += max(0, peak - frame[0])
+                if self._frames:
+                    outer = self._frames[-1]
+                    outer[1] = max(outer[1], peak)
+        stats.calls += 1
+        stats.items_in += _cardinality(value)
+        stats.items_out += _cardinality(out)
+        return out
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: vars(stats).copy() for name, stats in self.stats.items()}
+
+    def table(self) -> str:
+        header = f"{'stage':<32} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'in':>10} {'out':>10}"
+        if self.memory:
+            header += f" {'alloc KB':>10}"
+        lines: List[str] = [header, "-" * len(header)]
+        for name, s in sorted(self.stats.items(), key=lambda kv: -kv[1].seconds):
+            ms = s.seconds * 1000
+            line = f"{name:<32} {s.calls:>7} {ms:>10.2f} {ms / s.calls:>9.3f} {s.items_in:>10} {s.items_out:>10}"
+            if self.memory:
+                line += f" {s.alloc_bytes / 1024:>10.1f}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.table()
+
+
+def stage_name(op: Any) -> str:
+    """``map_items.<locals>.op`` -> ``map_items``; plain callables keep their name."""
+
+    qualname = getattr(op, "__qualname__", None) or type(op).__name__
+    return qualname.split(".<locals>", 1)[0]
+
+
+def _cardinality(value: JsonValue) -> int:
+    if is_missing(value.value):
+        return 0
+    return len(value.value) if isinstance(value.value, list) else 1
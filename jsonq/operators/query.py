@@ -0,0 +1,546 @@
+from __future__ import annotations
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from ..core.access import _compile_tokens
+from ..core.missing import MISSING, MissingMode, is_missing
+from ..core.plan import Stage, execute
+from ..core.predicate import _same
+from ..core.value import JsonValue
+from .base import JsonOperator, identity, pipe
+
+# ----- AST -----
+
+Token = Union[str, int]
+
+
+@dataclass(frozen=True)
+class PathNode:
+    tokens: Tuple[Token, ...]
+
+
+@dataclass(frozen=True)
+class Iterate:
+    pass
+
+
+@dataclass(frozen=True)
+class Select:
+    cond: Any
+
+
+@dataclass(frozen=True)
+class MapNode:
+    body: Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class Builtin:
+    name: str
+    arg: Optional[PathNode] = None
+
+
+@dataclass(frozen=True)
+class Literal:
+    value: Any
+
+
+@dataclass(frozen=True)
+class Compare:
+    op: str
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True)
+class BoolOp:
+    op: str  # "and" | "or"
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: Any
+
+
+_NULLARY = {"length", "keys", "first", "last", "unique", "flatten"}
+# Builtins that reduce a stream to one value.
+_COLLAPSE = {"length", "keys", "first", "last"}
+_PATH_ARG = {"sort_by", "unique_by"}
+_COMPARE = {"==", "!=", "<", "<=", ">", ">="}
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<num>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+      | (?P<str>"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|<=|>=|\[\]|[<>|().\[\],])
+      | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+    )""",
+    re.VERBOSE,
+)
+
+
+# ----- parsing -----
+
+
+def parse_query(text: str) -> Tuple[Any, ...]:
+    """Parse a jq-style query into a tuple of pipeline nodes."""
+
+    parser = _Parser(text)
+    nodes = parser.pipeline()
+    if parser.peek() is not None:
+        raise ValueError(f"Unexpected {parser.peek()[1]!r} in query: {text}")
+    return nodes
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.toks: List[Tuple[str, str]] = []
+        pos = 0
+        while pos < len(text):
+            if text[pos:].strip() == "":
+                break
+            match = _TOKEN_RE.match(text, pos)
+            if not match:
+                raise ValueError(f"Invalid query syntax at: {text[pos:]!r}")
+            kind = match.lastgroup or ""
+            self.toks.append((kind, match.group(kind)))
+            pos = match.end()
+        self.i = 0
+
+    def peek(self, ahead: int = 0) -> Optional[Tuple[str, str]]:
+        j = self.i + ahead
+        return self.toks[j] if j < len(self.toks) else None
+
+    def take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        tok = self.peek()
+        if tok is None or (value is not None and tok[1] != value):
+            found = "end of query" if tok is None else repr(tok[1])
+            raise ValueError(f"Expected {value or 'token'!r}, found {found} in query: {self.text}")
+        self.i += 1
+        return tok
+
+    def at(self, value: str) -> bool:
+        tok = self.peek()
+        return tok is not None and tok[1] == value
+
+    def pipeline(self) -> Tuple[Any, ...]:
+        nodes = list(self.term())
+        while self.at("|"):
+            self.take("|")
+            nodes.extend(self.term())
+        return tuple(nodes)
+
+    def term(self) -> List[Any]:
+        tok = self.peek()
+        if tok is None:
+            raise ValueError(f"Empty term in query: {self.text}")
+        kind, value = tok
+        if kind == "ident" and value == "select":
+            self.take()
+            self.take("(")
+            cond = self.condition()
+            self.take(")")
+            return [Select(cond)]
+        if kind == "ident" and value == "map":
+            self.take()
+            self.take("(")
+            body = self.pipeline()
+            self.take(")")
+            return [MapNode(body)]
+        if kind == "ident" and value in _PATH_ARG:
+            self.take()
+            self.take("(")
+            arg = self.path()
+            self.take(")")
+            return [Builtin(value, arg)]
+        if kind == "ident" and value in _NULLARY:
+            self.take()
+            return [Builtin(value)]
+        return self.path_with_iteration()
+
+    def path_with_iteration(self) -> List[Any]:
+        """A path that may contain ``[]``; split into PathNode/Iterate nodes."""
+
+        nodes: List[Any] = []
+        tokens: List[Token] = []
+        for tok in self._path_tokens(allow_iterate=True):
+            if tok is _ITERATE:
+                if tokens:
+                    nodes.append(PathNode(tuple(tokens)))
+                    tokens = []
+                nodes.append(Iterate())
+            else:
+                tokens.append(tok)
+        if tokens or not nodes:
+            nodes.append(PathNode(tuple(tokens)))
+        return nodes
+
+    def path(self) -> PathNode:
+        return PathNode(tuple(self._path_tokens(allow_iterate=False)))
+
+    def _path_tokens(self, *, allow_iterate: bool) -> List[Any]:
+        out: List[Any] = []
+        tok = self.peek()
+        if tok is not None and tok[0] == "ident":
+            out.append(self.take()[1])
+        elif not self.at("."):
+            found = "end of query" if tok is None else repr(tok[1])
+            raise ValueError(f"Expected a path, found {found} in query: {self.text}")
+        while True:
+            if self.at("."):
+                self.take(".")
+                nxt = self.peek()
+                if nxt is not None and nxt[0] == "ident":
+                    out.append(self.take()[1])
+                elif nxt is not None and nxt[0] == "str":
+                    out.append(json.loads(self.take()[1]))
+                continue
+            if self.at("[]"):
+                if not allow_iterate:
+                    raise ValueError(f"'[]' is not allowed here in query: {self.text}")
+                self.take("[]")
+                out.append(_ITERATE)
+                continue
+            if self.at("["):
+                self.take("[")
+                kind, value = self.take()
+                if kind == "num" and re.fullmatch(r"-?\d+", value):
+                    out.append(int(value))
+                elif kind == "str":
+                    out.append(json.loads(value))
+                else:
+                    raise ValueError(f"Invalid index {value!r} in query: {self.text}")
+                self.take("]")
+                continue
+            return out
+
+    def condition(self) -> Any:
+        left = self.conjunction()
+        while self.at("or"):
+            self.take()
+            left = BoolOp("or", left, self.conjunction())
+        return left
+
+    def conjunction(self) -> Any:
+        left = self.negation()
+        while self.at("and"):
+            self.take()
+            left = BoolOp("and", left, self.negation())
+        return left
+
+    def negation(self) -> Any:
+        if self.at("not"):
+            self.take()
+            return Not(self.negation())
+        left = self.operand()
+        tok = self.peek()
+        if tok is not None and tok[1] in _COMPARE:
+            op = self.take()[1]
+            return Compare(op, left, self.operand())
+        return left
+
+    def operand(self) -> Any:
+        tok = self.peek()
+        if tok is None:
+            raise ValueError(f"Expected an operand in query: {self.text}")
+        kind, value = tok
+        if value == "(":
+            self.take()
+            inner = self.condition()
+            self.take(")")
+            return inner
+        if kind == "num":
+            self.take()
+            return Literal(json.loads(value))
+        if kind == "str":
+            self.take()
+            return Literal(json.loads(value))
+        if kind == "ident" and value in ("true", "false", "null"):
+            self.take()
+            return Literal({"true": True, "false": False, "null": None}[value])
+        return self.path()
+
+
+_ITERATE = object()
+
+
+# ----- optimization -----
+
+
+def optimize(nodes: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Rewrite a parsed pipeline into an equivalent, cheaper one.
+
+    - identity paths (``.``) are dropped and adjacent paths merged, so each
+      projection is one compiled accessor;
+    - adjacent ``select``s become one ``and`` predicate;
+    - ``select`` is pushed below ``sort_by`` so fewer items are sorted;
+    - ``map(p) | map(q)`` over plain paths becomes ``map(p.q)``.
+    """
+
+    out: List[Any] = []
+    for node in nodes:
+        if isinstance(node, MapNode):
+            node = MapNode(optimize(node.body))
+        if isinstance(node, PathNode) and not node.tokens:
+            continue
+        prev = out[-1] if out else None
+        if isinstance(node, PathNode) and isinstance(prev, PathNode):
+            out[-1] = PathNode(prev.tokens + node.tokens)
+            continue
+        if isinstance(node, Select) and isinstance(prev, Select):
+            out[-1] = Select(BoolOp("and", prev.cond, node.cond))
+            continue
+        if isinstance(node, Select) and isinstance(prev, Builtin) and prev.name == "sort_by":
+            out.pop()
+            out.extend(optimize((node, prev)))
+            continue
+        if isinstance(node, MapNode) and isinstance(prev, MapNode):
+            a, b = _simple_path(prev.body), _simple_path(node.body)
+            if a is not None and b is not None:
+                out[-1] = MapNode((PathNode(a + b),))
+                continue
+        out.append(node)
+    result = tuple(out)
+    # A pushdown can expose new merges; repeat until nothing changes.
+    return result if result == nodes else optimize(result)
+
+
+def _simple_path(body: Tuple[Any, ...]) -> Optional[Tuple[Token, ...]]:
+    if len(body) == 1 and isinstance(body[0], PathNode):
+        return body[0].tokens
+    return None
+
+
+# ----- compilation -----
+
+
+@lru_cache(maxsize=256)
+def compile_query(text: str) -> JsonOperator:
+    """Parse, optimize and compile ``text`` into a cached operator pipeline."""
+
+    return _compile(optimize(parse_query(text)))
+
+
+def _compile(nodes: Tuple[Any, ...]) -> JsonOperator:
+    ops: List[JsonOperator] = []
+    stages: List[Stage] = []
+    # After ``[]`` the value is a stream of items, and paths apply to each one.
+    streaming = False
+    for node in nodes:
+        stage = _as_stage(node, streaming)
+        if isinstance(node, Iterate):
+            streaming = True
+        elif isinstance(node, Builtin) and node.name in _COLLAPSE:
+            streaming = False
+        if stage is not None:
+            stages.extend(stage)
+            continue
+        if stages:
+            ops.append(_plan_operator(tuple(stages)))
+            stages = []
+        ops.append(_standalone(node))
+    if stages:
+        ops.append(_plan_operator(tuple(stages)))
+    if not ops:
+        return identity()
+    return ops[0] if len(ops) == 1 else pipe(*ops)
+
+
+def _as_stage(node: Any, streaming: bool) -> Optional[List[Stage]]:
+    """Stages for nodes that the fused plan executor can run, else None."""
+
+    if isinstance(node, PathNode):
+        if streaming:
+            return [Stage("get", node.tokens)]
+        return [Stage("pluck" if isinstance(t, str) else "index", t) for t in node.tokens]
+    if isinstance(node, Iterate):
+        # The first ``[]`` is standalone; later ones spread each item.
+        return [Stage("map", _elements), Stage("flat")] if streaming else None
+    if isinstance(node, Select):
+        pred = _predicate(node.cond)
+        # A bare path yields the raw value; filter on jq truthiness, not Python's.
+        return [Stage("filter", lambda item: _truthy(pred(item)))]
+    if isinstance(node, MapNode):
+        return [Stage("map", _item_fn(node.body))]
+    if isinstance(node, Builtin):
+        if node.name == "first":
+            return [Stage("index", 0)]
+        if node.name == "last":
+            return [Stage("index", -1)]
+        if node.name == "flatten":
+            return [Stage("flat")]
+        if node.name == "unique":
+            return [Stage("unique", _order), Stage("sort_by", _order)]
+        if node.name == "unique_by":
+            key = _order_by(node.arg)
+            return [Stage("unique", key), Stage("sort_by", key)]
+        if node.name == "sort_by":
+            return [Stage("sort_by", _sort_key(node.arg))]
+    return None
+
+
+def _plan_operator(stages: Tuple[Stage, ...]) -> JsonOperator:
+    def query_plan(value: JsonValue) -> JsonValue:
+        out, stream = execute(value, stages)
+        return out if stream is None else out.replace(value=list(stream))
+
+    return query_plan
+
+
+def _standalone(node: Any) -> JsonOperator:
+    if isinstance(node, Iterate):
+        return _iterate
+    if isinstance(node, Builtin) and node.name == "length":
+        return _length
+    if isinstance(node, Builtin) and node.name == "keys":
+        return _keys
+    raise ValueError(f"Cannot compile query node: {node!r}")  # pragma: no cover - parser guards
+
+
+def _iterate(value: JsonValue) -> JsonValue:
+    return value.replace(value=_elements(value.value))
+
+
+def _elements(v: Any) -> Any:
+    if isinstance(v, list):
+        return v
+    if isinstance(v, dict):
+        return list(v.values())
+    return MISSING
+
+
+def _length(value: JsonValue) -> JsonValue:
+    v = value.value
+    if is_missing(v) or v is None:
+        return value.replace(value=0)
+    if isinstance(v, (list, dict, str)):
+        return value.replace(value=len(v))
+    return value.replace(value=abs(v) if isinstance(v, (int, float)) else MISSING)
+
+
+def _keys(value: JsonValue) -> JsonValue:
+    v = value.value
+    if isinstance(v, dict):
+        return value.replace(value=sorted(v))
+    if isinstance(v, list):
+        return value.replace(value=list(range(len(v))))
+    return value.replace(value=MISSING)
+
+
+# ----- per-item evaluation (missing reads as null, like jq) -----
+
+
+def _accessor(node: PathNode) -> Callable[[Any], Any]:
+    if not node.tokens:
+        return lambda item: item
+    access = _compile_tokens(node.tokens)
+
+    def read(item: Any) -> Any:
+        out = access(item, MissingMode.KEEP)
+        return None if is_missing(out) else out
+
+    return read
+
+
+def _item_fn(body: Tuple[Any, ...]) -> Callable[[Any], Any]:
+    simple = _simple_path(body)
+    if simple is not None:
+        return _accessor(PathNode(simple))
+    op = _compile(body)
+
+    def run(item: Any) -> Any:
+        out = op(JsonValue(item, mode=MissingMode.KEEP)).value
+        return None if is_missing(out) else out
+
+    return run
+
+
+def _sort_key(node: PathNode) -> Callable[[Any], Any]:
+    read = _accessor(node)
+
+    def key(item: Any) -> Tuple[int, Any]:
+        value = read(item)
+        return (1, None) if value is None else (0, value)
+
+    return key
+
+
+def _order(value: Any) -> Tuple[Any, ...]:
+    """jq's total order: null < false < true < numbers < strings < arrays < objects."""
+
+    if value is None or is_missing(value):
+        return (0,)
+    if value.__class__ is bool:
+        return (2,) if value else (1,)
+    if isinstance(value, (int, float)):
+        return (3, value)
+    if isinstance(value, str):
+        return (4, value)
+    if isinstance(value, list):
+        return (5, tuple(_order(x) for x in value))
+    if isinstance(value, dict):
+        keys = sorted(value)
+        return (6, tuple(keys), tuple(_order(value[k]) for k in keys))
+    return (7, repr(value))
+
+
+def _order_by(node: PathNode) -> Callable[[Any], Tuple[Any, ...]]:
+    read = _accessor(node)
+
+    def key(item: Any) -> Tuple[Any, ...]:
+        return _order(read(item))
+
+    return key
+
+
+# Booleans and numbers never compare equal, as in jq (``true == 1`` is false).
+_CMP: dict = {
+    "==": _same,
+    "!=": lambda a, b: not _same(a, b),
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def _predicate(cond: Any) -> Callable[[Any], Any]:
+    if isinstance(cond, Literal):
+        return lambda item, v=cond.value: v
+    if isinstance(cond, PathNode):
+        return _accessor(cond)
+    if isinstance(cond, Not):
+        inner = _predicate(cond.operand)
+        return lambda item: not _truthy(inner(item))
+    if isinstance(cond, BoolOp):
+        left, right = _predicate(cond.left), _predicate(cond.right)
+        if cond.op == "and":
+            return lambda item: _truthy(left(item)) and _truthy(right(item))
+        return lambda item: _truthy(left(item)) or _truthy(right(item))
+    if isinstance(cond, Compare):
+        left, right, cmp = _predicate(cond.left), _predicate(cond.right), _CMP[cond.op]
+        if isinstance(cond.right, Literal):
+            value = cond.right.value
+            return lambda item: cmp(left(item), value)
+        return lambda item: cmp(left(item), right(item))
+    raise ValueError(f"Unsupported condition: {cond!r}")  # pragma: no cover - parser guards
+
+
+def _truthy(x: Any) -> bool:
+    # jq truthiness: only false and null are false.
+    return x is not None and x is not False
+
+
+def explain_query(text: str) -> str:
+    """Optimized pipeline for ``text``, one node per line (debugging aid)."""
+
+    return "\n".join(repr(node) for node in optimize(parse_query(text)))
+
+
+__all__ = ["compile_query", "explain_query", "optimize", "parse_query"]
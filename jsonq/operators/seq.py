@@ -1,22 +1,42 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
-
+from typing import Any, Callable, Mapping, Optional
+
+from ..core.access import compile_path
+from ..core.aggregate import aggregate as _aggregate
+from ..core.columnar import ColumnStore
+from ..core.groupby import AggSpec, GroupKey, group_aggregate
+from ..core.order import SortSpec
+from ..core.project import SHAPES
 from ..core.seqview import SeqView
 from ..core.value import JsonValue
 from .base import JsonOperator
 
 
-def map_items(fn: Callable[[Any], Any]) -> JsonOperator:
+def map_items(
+    fn: Callable[[Any], Any],
+    *,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> JsonOperator:
+    """Map ``fn`` over items; ``workers`` > 1 runs chunks on a thread/process pool."""
+
     def op(value: JsonValue) -> JsonValue:
-        return SeqView(value).map(fn).to_value()
+        return SeqView(value).map(fn, workers=workers, executor=executor).to_value()
 
     return op
 
 
-def filter_items(pred: Callable[[Any], bool]) -> JsonOperator:
+def filter_items(
+    pred: Callable[[Any], bool],
+    *,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> JsonOperator:
+    """Keep items matching ``pred``; ``workers`` > 1 runs chunks on a pool."""
+
     def op(value: JsonValue) -> JsonValue:
-        return SeqView(value).filter(pred).to_value()
+        return SeqView(value).filter(pred, workers=workers, executor=executor).to_value()
 
     return op
 
@@ -28,9 +48,30 @@ def reject_items(pred: Callable[[Any], bool]) -> JsonOperator:
     return op
 
 
-def sort_by(keyfn: Callable[[Any], Any]) -> JsonOperator:
+def filter_by(key: str, pred: Callable[[Any], bool]) -> JsonOperator:
+    def op(value: JsonValue) -> JsonValue:
+        return SeqView(value).filter_by(key, pred).to_value()
+
+    return op
+
+
+def sort_by(spec: SortSpec) -> JsonOperator:
     def op(value: JsonValue) -> JsonValue:
-        return SeqView(value).sort_by(keyfn).to_value()
+        return SeqView(value).sort_by(spec).to_value()
+
+    return op
+
+
+def top_k(n: int, spec: SortSpec) -> JsonOperator:
+    def op(value: JsonValue) -> JsonValue:
+        return SeqView(value).top_k(n, spec).to_value()
+
+    return op
+
+
+def bottom_k(n: int, spec: SortSpec) -> JsonOperator:
+    def op(value: JsonValue) -> JsonValue:
+        return SeqView(value).bottom_k(n, spec).to_value()
 
     return op
 
@@ -47,3 +88,56 @@ def flat() -> JsonOperator:
         return SeqView(value).flat().to_value()
 
     return op
+
+
+def project(fields: Mapping[str, str], shape: str = "dict") -> JsonOperator:
+    """Extract every ``name: path`` of ``fields`` from each record in one pass."""
+
+    if shape not in SHAPES:
+        raise ValueError(f"Unsupported projection shape: {shape!r}")
+
+    def op(value: JsonValue) -> JsonValue:
+        return SeqView(value).project(fields, shape).to_value()
+
+    return op
+
+
+def columnar() -> JsonOperator:
+    """Attach a ColumnStore to a list of records (no-op for other values)."""
+
+    def op(value: JsonValue) -> JsonValue:
+        if not isinstance(value.value, list) or value.columns is not None:
+            return value
+        return value.replace(columns=ColumnStore.build(value.value))
+
+    return op
+
+
+def aggregate(name: str, key: Optional[str] = None, **options: Any) -> JsonOperator:
+    """Reduce items (or the values at path ``key``) with a named aggregate.
+
+    ``name`` is one of count/sum/mean/min/max/percentile/histogram; options
+    such as ``q`` or ``bins`` are passed through.
+    """
+
+    access = compile_path(key) if key else None
+
+    def op(value: JsonValue) -> JsonValue:
+        xs: Any = None
+        if key and value.columns is not None:
+            xs = value.columns.numeric(key)
+        if xs is None:
+            target = value if access is None else value.replace(value=access(value.value, value.mode))
+            xs = target.as_list()
+        return value.replace(value=_aggregate(name, xs, value.mode, **options))
+
+    return op
+
+
+def group_by(key: GroupKey, **specs: AggSpec) -> JsonOperator:
+    """Hash-aggregate items by ``key`` (path or callable) into one row per group."""
+
+    def op(value: JsonValue) -> JsonValue:
+        return value.replace(value=group_aggregate(value.as_list(), key, specs, value.mode))
+
+    return op
@@ -0,0 +1,208 @@
+from __future__ import annotations
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from ..core.access import compile_path
+from ..core.aggregate import aggregate
+from ..core.groupby import finish_groups, group_partials, merge_partials
+from ..core.missing import MISSING, MissingMode, is_missing
+from ..core.order import select_k
+from ..core.parallel import EXECUTORS
+from ..core.plan import Stage, execute
+from ..core.predicate import Where, raw_test
+from ..core.value import JsonValue
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+Paths = Union[str, "os.PathLike[str]", Sequence[Union[str, "os.PathLike[str]"]]]
+# ("concat",) | ("count", key) | ("sum", key) | ("top_k", n, spec, largest) | ("group", key, specs)
+Reducer = Tuple[Any, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Shard:
+    """One unit of work: a whole JSON file, or the NDJSON lines starting in [start, end).
+
+    Only records passing every ``where`` predicate are read; NDJSON lines
+    that cannot pass are skipped before decoding.
+    """
+
+    path: str
+    start: int
+    end: int
+    ndjson: bool
+    where: Tuple[Where, ...] = ()
+
+
+def expand(paths: Paths) -> List[str]:
+    """Files matched by a glob pattern (``**`` recurses) or a list of patterns, sorted."""
+
+    patterns = [paths] if isinstance(paths, (str, os.PathLike)) else list(paths)
+    out: List[str] = []
+    for pattern in patterns:
+        out.extend(sorted(glob.glob(os.fspath(pattern), recursive=True)))
+    return out
+
+
+def plan_shards(files: Iterable[str], shard_bytes: int) -> List[Shard]:
+    """Split NDJSON files larger than ``shard_bytes`` into byte ranges; JSON files stay whole."""
+
+    if shard_bytes < 1:
+        raise ValueError("shard_bytes must be >= 1")
+    shards: List[Shard] = []
+    for path in files:
+        size = os.path.getsize(path)
+        if not path.endswith(NDJSON_SUFFIXES):
+            shards.append(Shard(path, 0, size, False))
+            continue
+        for start in range(0, max(size, 1), shard_bytes):
+            shards.append(Shard(path, start, min(start + shard_bytes, size), True))
+    return shards
+
+
+def iter_shard(shard: Shard) -> Iterator[Any]:
+    """Records of one shard: array elements (or the document) for JSON, lines for NDJSON."""
+
+    where = shard.where
+    if not shard.ndjson:
+        with open(shard.path, "rb") as fp:
+            doc = json.loads(fp.read())
+        for record in doc if isinstance(doc, list) else (doc,):
+            if all(pred(record) for pred in where):
+                yield record
+        return
+    prefilter = raw_test(where)
+    with open(shard.path, "rb") as fp:
+        pos = 0
+        if shard.start:
+            # The line straddling ``start`` belongs to the previous shard; a
+            # line starting exactly at ``start`` is preceded by its newline.
+            fp.seek(shard.start - 1)
+            pos = shard.start - 1 + len(fp.readline())
+        end = shard.end
+        loads = json.loads
+        for line in fp:
+            if pos >= end:
+                return
+            offset, pos = pos, pos + len(line)
+            if prefilter is not None and not prefilter(line):
+                continue
+            if not line.strip():
+                continue
+            try:
+                record = loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON in {shard.path} at byte {offset}: {exc.msg}") from exc
+            if all(pred(record) for pred in where):
+                yield record
+
+
+def run(
+    shards: Sequence[Shard],
+    stages: Tuple[Stage, ...],
+    v: JsonValue,
+    reducer: Reducer,
+    *,
+    workers: int,
+    executor: str = "process",
+) -> Any:
+    """Run ``stages`` over every shard and combine the per-shard partials of ``reducer``.
+
+    Partials are combined in shard order, so concatenation and tie-breaking
+    match a single pass over the files in sorted order. With
+    ``executor="process"`` stage callables must be picklable.
+    """
+
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    mode, strict = v.mode, v.strict
+    if workers == 1 or len(shards) <= 1:
+        parts = [run_shard(shard, stages, mode, strict, reducer) for shard in shards]
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers) if executor == "process" else ThreadPoolExecutor(workers)
+        chunksize = max(1, len(shards) // (workers * 4))
+        n = len(shards)
+        with pool:
+            parts = list(
+                pool.map(
+                    run_shard, shards, repeat(stages, n), repeat(mode, n), repeat(strict, n), repeat(reducer, n),
+                    chunksize=chunksize,
+                )
+            )
+    return _COMBINE[reducer[0]](reducer, parts)
+
+
+# Module-level so the process pool can pickle it.
+def run_shard(shard: Shard, stages: Tuple[Stage, ...], mode: MissingMode, strict: bool, reducer: Reducer) -> Any:
+    v, stream = execute(JsonValue([], mode=mode, strict=strict), stages, lambda: iter_shard(shard))
+    items: Iterator[Any] = stream if stream is not None else iter(v.as_list())
+    return _PARTIAL[reducer[0]](reducer, items, v.mode)
+
+
+# ----- reducers: per-shard partial, then an order-preserving combine -----
+
+
+def _concat_partial(reducer: Reducer, items: Iterator[Any], mode: MissingMode) -> List[Any]:
+    return list(items)
+
+
+def _concat(reducer: Reducer, parts: List[List[Any]]) -> List[Any]:
+    return list(chain.from_iterable(parts))
+
+
+def _agg_partial(reducer: Reducer, items: Iterator[Any], mode: MissingMode) -> Any:
+    name, key = reducer
+    target = JsonValue(list(items), mode=mode)
+    if key:
+        # Same reading of ``key`` as ``ops.seq.aggregate``.
+        target = target.replace(value=compile_path(key)(target.value, mode))
+    return aggregate(name, target.as_list(), mode)
+
+
+def _add(reducer: Reducer, parts: List[Any]) -> Any:
+    if any(is_missing(p) for p in parts):
+        return MISSING
+    return sum(parts)
+
+
+def _top_k_partial(reducer: Reducer, items: Iterator[Any], mode: MissingMode) -> List[Any]:
+    _, n, spec, largest = reducer
+    return select_k(items, n, spec, largest=largest)
+
+
+def _top_k(reducer: Reducer, parts: List[List[Any]]) -> List[Any]:
+    _, n, spec, largest = reducer
+    return select_k(chain.from_iterable(parts), n, spec, largest=largest)
+
+
+def _group_partial(reducer: Reducer, items: Iterator[Any], mode: MissingMode) -> Any:
+    _, key, specs = reducer
+    return group_partials(items, key, specs, mode)
+
+
+def _group(reducer: Reducer, parts: List[Any]) -> List[Dict[str, Any]]:
+    return finish_groups(merge_partials(parts), reducer[2])
+
+
+_PARTIAL: Dict[str, Callable[[Reducer, Iterator[Any], MissingMode], Any]] = {
+    "concat": _concat_partial,
+    "count": _agg_partial,
+    "sum": _agg_partial,
+    "top_k": _top_k_partial,
+    "group": _group_partial,
+}
+
+_COMBINE: Dict[str, Callable[[Reducer, List[Any]], Any]] = {
+    "concat": _concat,
+    "count": _add,
+    "sum": _add,
+    "top_k": _top_k,
+    "group": _group,
+}
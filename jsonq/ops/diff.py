@@ -1,46 +1,255 @@
 from __future__ import annotations
-from typing import Any, Dict, List
+from copy import deepcopy
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Tuple
 
 Op = Dict[str, Any]
 
 
 def diff(a: Any, b: Any) -> List[Op]:
-    """Shallow dict diff: add/remove/replace on top-level keys."""
+    """Nested RFC 6902 diff from ``a`` to ``b``.
+
+    Dict keys are compared recursively (removes, then adds, then changed keys,
+    each in sorted order); lists are aligned with ``difflib`` matching blocks
+    so inserted/removed elements do not turn into replaces of everything after
+    them. Identical (``is``) subtrees are skipped without being walked.
+    """
 
     ops: List[Op] = []
-    if isinstance(a, dict) and isinstance(b, dict):
-        ak, bk = set(a.keys()), set(b.keys())
-        for key in sorted(ak - bk):
-            ops.append({"op": "remove", "path": f"/{key}"})
-        for key in sorted(bk - ak):
-            ops.append({"op": "add", "path": f"/{key}", "value": b[key]})
-        for key in sorted(ak & bk):
-            if a[key] != b[key]:
-                ops.append({"op": "replace", "path": f"/{key}", "value": b[key]})
-        return ops
-    if a != b:
-        ops.append({"op": "replace", "path": "/", "value": b})
+    _diff_value(a, b, "", ops)
     return ops
 
 
 def patch(a: Any, ops: List[Op]) -> Any:
-    """Apply shallow ops to a copy; if non-dict and op targets root, replace."""
+    """Apply RFC 6902 ops without mutating ``a``.
 
-    import copy
+    Only the containers along modified paths are copied; untouched subtrees
+    are shared with the input. Raises ValueError for paths that do not
+    resolve and for failed ``test`` ops.
+    """
 
-    current = copy.deepcopy(a)
+    state = _PatchState(a)
     for op in ops:
-        path = op["path"].lstrip("/")
-        if path == "":
-            if op["op"] in ("add", "replace"):
-                current = op.get("value")
-            elif op["op"] == "remove":
-                current = None
+        state.apply(op)
+    return state.root
+
+
+# ----- diff -----
+
+
+def _diff_value(a: Any, b: Any, path: str, ops: List[Op]) -> None:
+    if a is b:
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        _diff_dict(a, b, path, ops)
+    elif isinstance(a, list) and isinstance(b, list):
+        _diff_list(a, b, path, ops)
+    elif type(a) is not type(b) or a != b:
+        ops.append({"op": "replace", "path": path, "value": b})
+
+
+def _diff_dict(a: Dict[str, Any], b: Dict[str, Any], path: str, ops: List[Op]) -> None:
+    ak, bk = a.keys(), b.keys()
+    for key in sorted(ak - bk):
+        ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key in sorted(bk - ak):
+        ops.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": b[key]})
+    for key in sorted(ak & bk):
+        av, bv = a[key], b[key]
+        if av is bv or (type(av) is type(bv) and av == bv):
             continue
-        if not isinstance(current, dict):
+        _diff_value(av, bv, f"{path}/{_escape(key)}", ops)
+
+
+def _diff_list(a: List[Any], b: List[Any], path: str, ops: List[Op]) -> None:
+    # Trim the common ends first; the matcher only sees the changed middle.
+    start = 0
+    limit = min(len(a), len(b))
+    while start < limit and _same(a[start], b[start]):
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and _same(a[end_a - 1], b[end_b - 1]):
+        end_a -= 1
+        end_b -= 1
+    mid_a, mid_b = a[start:end_a], b[start:end_b]
+    if not mid_a and not mid_b:
+        return
+    if not mid_a or not mid_b:
+        opcodes: List[Tuple[str, int, int, int, int]] = [("replace", 0, len(mid_a), 0, len(mid_b))]
+    else:
+        matcher = SequenceMatcher(None, [_freeze(x) for x in mid_a], [_freeze(x) for x in mid_b], autojunk=False)
+        opcodes = matcher.get_opcodes()
+    # Ops are emitted left to right, so the patched list already matches b
+    # up to j1 and every index below is a b-index.
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
             continue
-        if op["op"] == "remove":
-            current.pop(path, None)
-        elif op["op"] in ("add", "replace"):
-            current[path] = op.get("value")
-    return current
+        paired = min(i2 - i1, j2 - j1)
+        for k in range(paired):
+            _diff_value(mid_a[i1 + k], mid_b[j1 + k], f"{path}/{start + j1 + k}", ops)
+        at = start + j1 + paired
+        for _ in range(i2 - i1 - paired):
+            ops.append({"op": "remove", "path": f"{path}/{at}"})
+        for k in range(j2 - j1 - paired):
+            ops.append({"op": "add", "path": f"{path}/{at + k}", "value": mid_b[j1 + paired + k]})
+
+
+def _same(x: Any, y: Any) -> bool:
+    return x is y or (type(x) is type(y) and x == y)
+
+
+def _freeze(x: Any) -> Any:
+    """Hashable stand-in used to anchor list elements."""
+
+    if isinstance(x, dict):
+        return ("{", tuple(sorted((k, _freeze(v)) for k, v in x.items())))
+    if isinstance(x, list):
+        return ("[", tuple(_freeze(v) for v in x))
+    return (type(x).__name__, x)
+
+
+def _escape(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+# ----- patch -----
+
+
+class _PatchState:
+    """Copy-on-write document: each container is copied at most once per patch."""
+
+    def __init__(self, root: Any):
+        self.root = root
+        self._owned: Dict[int, Any] = {}
+
+    def _own(self, node: Any) -> Any:
+        if id(node) in self._owned:
+            return node
+        copy = dict(node) if isinstance(node, dict) else list(node)
+        self._owned[id(copy)] = copy
+        return copy
+
+    def _split(self, path: str) -> List[str]:
+        if path == "":
+            return []
+        # Legacy root pointer "/" from the shallow MVP diff, for non-dict roots.
+        if path == "/" and not isinstance(self.root, dict):
+            return []
+        if not path.startswith("/"):
+            raise ValueError(f"Invalid JSON Pointer: {path!r}")
+        return [_unescape(tok) for tok in path[1:].split("/")]
+
+    def _resolve(self, tokens: List[str]) -> Any:
+        node = self.root
+        for tok in tokens:
+            node = _child(node, tok)
+        return node
+
+    def _parent(self, tokens: List[str]) -> Any:
+        """Owned copy of the container holding ``tokens[-1]``, spine copied as needed."""
+
+        self.root = node = self._own(_container(self.root))
+        for tok in tokens[:-1]:
+            child = self._own(_container(_child(node, tok)))
+            _assign(node, tok, child)
+            node = child
+        return node
+
+    def apply(self, op: Op) -> None:
+        kind = op.get("op")
+        tokens = self._split(op["path"])
+        if kind == "test":
+            if not _same_json(self._resolve(tokens), op.get("value")):
+                raise ValueError(f"Test failed at {op['path']!r}")
+            return
+        if kind in ("move", "copy"):
+            value = self._resolve(self._split(op["from"]))
+            if kind == "move":
+                self._remove(self._split(op["from"]))
+            else:
+                # The copy must not alias its source, or later edits would show up in both.
+                value = deepcopy(value)
+            self._add(tokens, value)
+            return
+        if kind == "add":
+            self._add(tokens, op.get("value"))
+        elif kind == "remove":
+            self._remove(tokens)
+        elif kind == "replace":
+            self._replace(tokens, op.get("value"))
+        else:
+            raise ValueError(f"Unsupported op: {kind!r}")
+
+    def _add(self, tokens: List[str], value: Any) -> None:
+        if not tokens:
+            self.root = value
+            return
+        parent = self._parent(tokens)
+        tok = tokens[-1]
+        if isinstance(parent, dict):
+            parent[tok] = value
+        else:
+            index = len(parent) if tok == "-" else _index(tok, len(parent) + 1)
+            parent.insert(index, value)
+
+    def _replace(self, tokens: List[str], value: Any) -> None:
+        # In place, so a replaced dict key keeps its position.
+        if not tokens:
+            self.root = value
+            return
+        parent = self._parent(tokens)
+        _child(parent, tokens[-1])  # the target must exist
+        _assign(parent, tokens[-1], value)
+
+    def _remove(self, tokens: List[str]) -> None:
+        if not tokens:
+            self.root = None
+            return
+        parent = self._parent(tokens)
+        tok = tokens[-1]
+        if isinstance(parent, dict):
+            if tok not in parent:
+                raise ValueError(f"Path not found: /{'/'.join(tokens)}")
+            del parent[tok]
+        else:
+            del parent[_index(tok, len(parent))]
+
+
+def _container(node: Any) -> Any:
+    if not isinstance(node, (dict, list)):
+        raise ValueError(f"Cannot descend into {type(node).__name__}")
+    return node
+
+
+def _child(node: Any, tok: str) -> Any:
+    if isinstance(node, dict):
+        if tok not in node:
+            raise ValueError(f"Path not found at {tok!r}")
+        return node[tok]
+    if isinstance(node, list):
+        return node[_index(tok, len(node))]
+    raise ValueError(f"Cannot descend into {type(node).__name__}")
+
+
+def _assign(node: Any, tok: str, value: Any) -> None:
+    if isinstance(node, dict):
+        node[tok] = value
+    else:
+        node[_index(tok, len(node))] = value
+
+
+def _index(tok: str, size: int) -> int:
+    if not tok.isdigit() or (tok != "0" and tok.startswith("0")):
+        raise ValueError(f"Invalid array index: {tok!r}")
+    index = int(tok)
+    if index >= size:
+        raise ValueError(f"Array index out of range: {index}")
+    return index
+
+
+def _same_json(x: Any, y: Any) -> bool:
+    return _freeze(x) == _freeze(y)
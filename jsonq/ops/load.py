@@ -0,0 +1,162 @@
+from __future__ import annotations
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, Union
+
+from .stream import Source, _Reader
+
+DEDUPE = (None, "scalars", "subtrees")
+
+
+@dataclass
+class LoadStats:
+    """What ``Q.load`` shared while decoding; pass one in to have it filled."""
+
+    keys: int = 0  # key occurrences replaced by an interned copy
+    values: int = 0  # scalar occurrences replaced by an equal earlier one
+    subtrees: int = 0  # small containers replaced by an equal earlier one
+    bytes_saved: int = 0  # sys.getsizeof of every replaced object
+
+
+def load(
+    source: Source,
+    *,
+    intern_keys: bool = True,
+    dedupe_values: Optional[str] = None,
+    max_subtree: int = 16,
+    ndjson: bool = False,
+    chunk_size: int = 1 << 16,
+    stats: Optional[LoadStats] = None,
+) -> Any:
+    """Decode a JSON (or NDJSON) source, sharing repeated keys and values.
+
+    Keys go through ``sys.intern``. ``dedupe_values="scalars"`` makes equal
+    strings and numbers one object; ``"subtrees"`` also shares equal
+    containers of at most ``max_subtree`` members (same key order), so such
+    containers must be treated as read-only. A top-level array is decoded
+    one element at a time, so the raw text is never held whole.
+    """
+
+    if dedupe_values not in DEDUPE:
+        raise ValueError(f"dedupe_values must be one of {DEDUPE}, got {dedupe_values!r}")
+    canon = _Canon(intern_keys, dedupe_values, max_subtree, stats if stats is not None else LoadStats())
+    decoder = json.JSONDecoder(object_pairs_hook=canon.obj)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            return _load(fp, decoder, canon, ndjson, chunk_size)
+    return _load(source, decoder, canon, ndjson, chunk_size)
+
+
+def _load(
+    fp: Union[IO[str], IO[bytes]], decoder: json.JSONDecoder, canon: "_Canon", ndjson: bool, chunk_size: int
+) -> Any:
+    if ndjson:
+        out: List[Any] = []
+        for lineno, line in enumerate(fp, 1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if not line.strip():
+                continue
+            try:
+                out.append(canon.value(decoder.decode(line)))
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON on line {lineno}: {exc.msg}") from exc
+        return out
+    reader = _Reader(fp, chunk_size, decoder)
+    if reader.peek() == "[":
+        value: Any = [canon.value(item) for item in reader.iter_elements()]
+    else:
+        value = canon.value(reader.decode_value())
+    if reader.peek():
+        raise ValueError("Extra data after JSON document")
+    return value
+
+
+class _Canon:
+    """Interning/hash-consing state for one load."""
+
+    def __init__(self, intern_keys: bool, dedupe: Optional[str], max_subtree: int, stats: LoadStats):
+        self.intern_keys = intern_keys
+        self.scalars = dedupe is not None
+        self.subtrees = dedupe == "subtrees"
+        self.max_subtree = max_subtree
+        self.stats = stats
+        # One memo per type, so 1, 1.0 and True never merge.
+        self._str: Dict[str, str] = {}
+        self._int: Dict[int, int] = {}
+        self._float: Dict[float, float] = {}
+        self._trees: Dict[Tuple[Any, ...], Any] = {}
+        self._shared: Set[int] = set()  # ids of canonical containers (kept alive by _trees)
+
+    def obj(self, pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """``object_pairs_hook``: children are already canonical, as objects decode inside-out."""
+
+        stats = self.stats
+        if self.intern_keys:
+            intern = sys.intern
+            out: Dict[str, Any] = {}
+            for k, v in pairs:
+                ik = intern(k)
+                if ik is not k:
+                    stats.keys += 1
+                    stats.bytes_saved += sys.getsizeof(k)
+                out[ik] = self.value(v) if self.scalars else v
+        elif self.scalars:
+            out = {k: self.value(v) for k, v in pairs}
+        else:
+            out = dict(pairs)
+        return self._share(out, "o", out.items()) if self.subtrees else out
+
+    def value(self, v: Any) -> Any:
+        cls = v.__class__
+        if cls is str:
+            if not self.scalars:
+                return v
+            memo = self._str
+        elif cls is int:
+            if not self.scalars or -5 <= v <= 256:  # CPython already shares small ints
+                return v
+            memo = self._int
+        elif cls is float:
+            if not self.scalars or v == 0.0:  # keep -0.0 and 0.0 apart
+                return v
+            memo = self._float
+        elif cls is list:
+            # Arrays have no decoder hook: canonicalize their members here.
+            for i, item in enumerate(v):
+                if item.__class__ is not dict:
+                    v[i] = self.value(item)
+            return self._share(v, "a", ((None, item) for item in v)) if self.subtrees else v
+        else:
+            return v
+        out = memo.setdefault(v, v)
+        if out is not v:
+            self.stats.values += 1
+            self.stats.bytes_saved += sys.getsizeof(v)
+        return out
+
+    def _share(self, container: Any, tag: str, items: Any) -> Any:
+        if len(container) > self.max_subtree:
+            return container
+        parts: List[Any] = [tag]
+        shared = self._shared
+        for k, v in items:
+            cls = v.__class__
+            if cls is dict or cls is list:
+                if id(v) not in shared:
+                    return container  # a child that is not shared makes this one unique
+                parts.append((k, id(v)))
+            elif cls is float:
+                parts.append((k, float, repr(v)))
+            else:
+                parts.append((k, cls, v))
+        key = tuple(parts)
+        out = self._trees.setdefault(key, container)
+        if out is container:
+            shared.add(id(container))
+        else:
+            self.stats.subtrees += 1
+            self.stats.bytes_saved += sys.getsizeof(container)
+        return out
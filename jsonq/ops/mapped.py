@@ -0,0 +1,303 @@
+from __future__ import annotations
+import json
+import mmap as _mmap
+import os
+import re
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..core.missing import MISSING, MissingMode, is_missing
+
+_WS = re.compile(rb"[ \t\n\r]*")
+# Patterns are unrolled loops ("run (token run)*") whose pieces cannot match
+# the same text two ways, so a failed match backtracks in linear time. Where
+# possessive quantifiers exist (3.11+) they match the same text but skip
+# saving backtrack state, which is several times faster on large containers.
+_STAR = b"*+" if sys.version_info >= (3, 11) else b"*"
+_PLAIN = rb'[^"\[\]{}]' + _STAR
+_STR = rb'"[^"\\]' + _STAR + rb'(?:\\.[^"\\]' + _STAR + rb")" + _STAR + rb'"'
+_STRING = re.compile(_STR, re.S)
+# Everything up to the next bracket, consuming whole strings (so brackets
+# inside strings are ignored) in a single regex call.
+_RUN = re.compile(_PLAIN + rb"(?:" + _STR + _PLAIN + rb")" + _STAR, re.S)
+_SCALAR = re.compile(rb"[^,\]}\s]*")
+
+
+def _nested(depth: int) -> bytes:
+    """Pattern for a whole container nested at most ``depth`` levels."""
+
+    token = _STR
+    if depth > 1:
+        token = rb"(?:" + _STR + rb"|" + _nested(depth - 1) + rb")"
+    return rb"[\[{]" + _PLAIN + rb"(?:" + token + _PLAIN + rb")" + _STAR + rb"[\]}]"
+
+
+# Containers up to this depth are skipped by one regex call instead of a
+# Python step per bracket.
+_CONTAINER = re.compile(_nested(6), re.S)
+
+
+class MappedDocument:
+    """A JSON file opened for lazy, offset-based access.
+
+    Nothing is decoded up front: a container is indexed (key -> value offsets
+    for objects, element offsets for arrays) the first time it is entered,
+    and only the values that are finally read are turned into Python objects.
+    With ``use_mmap`` the file is memory-mapped, so untouched regions are
+    never paged in.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], *, use_mmap: bool = True):
+        self._fp = open(path, "rb")
+        self._nodes: Dict[int, Node] = {}
+        self._map: Optional[_mmap.mmap] = None
+        try:
+            if use_mmap and os.fstat(self._fp.fileno()).st_size:
+                self._map = _mmap.mmap(self._fp.fileno(), 0, access=_mmap.ACCESS_READ)
+                self.buf: Any = self._map
+            else:
+                self.buf = self._fp.read()
+            start = _WS.match(self.buf, 0).end()
+            if start == len(self.buf):
+                raise ValueError("Empty JSON document")
+            if self.buf[start:start + 3] == b"\xef\xbb\xbf":
+                start = _WS.match(self.buf, start + 3).end()
+            # The root runs to the last non-whitespace byte; skipping it to find
+            # its end would scan the whole file.
+            end = len(self.buf)
+            while self.buf[end - 1:end] in (b" ", b"\t", b"\n", b"\r"):
+                end -= 1
+            self.root = self.node(start, end)
+        except BaseException:
+            self.close()
+            raise
+
+    def node(self, start: int, end: int) -> Node:
+        """Node for the value at ``start``; containers are cached with their index."""
+
+        node = self._nodes.get(start)
+        if node is None:
+            node = Node(self, start, end)
+            if node.kind != "scalar":
+                self._nodes[start] = node
+        return node
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._fp.close()
+
+    def __enter__(self) -> MappedDocument:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class Node:
+    """One JSON value inside a :class:`MappedDocument`, indexed on first use."""
+
+    __slots__ = ("doc", "start", "end", "kind", "_keys", "_bounds")
+
+    def __init__(self, doc: MappedDocument, start: int, end: int):
+        self.doc = doc
+        self.start = start
+        self.end = end
+        head = doc.buf[start:start + 1]
+        # "object", "array" or "scalar"
+        self.kind = "object" if head == b"{" else "array" if head == b"[" else "scalar"
+        self._keys: Optional[Dict[str, Tuple[int, int]]] = None
+        self._bounds: Optional[array] = None
+
+    def load(self) -> Any:
+        """Decode this value (and everything below it)."""
+
+        return json.loads(self.doc.buf[self.start:self.end])
+
+    # ----- objects -----
+
+    def keys(self) -> List[str]:
+        return list(self._object_index())
+
+    def child(self, key: str) -> Any:
+        """Child node at ``key`` or MISSING (also for non-objects)."""
+
+        if self.kind != "object":
+            return MISSING
+        span = self._object_index().get(key)
+        return MISSING if span is None else self.doc.node(*span)
+
+    def _object_index(self) -> Dict[str, Tuple[int, int]]:
+        if self._keys is None:
+            buf = self.doc.buf
+            keys: Dict[str, Tuple[int, int]] = {}
+            pos = _WS.match(buf, self.start + 1).end()
+            if buf[pos:pos + 1] != b"}":
+                while True:
+                    m = _STRING.match(buf, pos)
+                    if m is None:
+                        raise ValueError(f"Expected object key at offset {pos}")
+                    raw = m.group()
+                    key = raw[1:-1].decode("utf-8") if b"\\" not in raw else json.loads(raw)
+                    pos = _WS.match(buf, m.end()).end()
+                    if buf[pos:pos + 1] != b":":
+                        raise ValueError(f"Expected ':' at offset {pos}")
+                    start = _WS.match(buf, pos + 1).end()
+                    end = _skip(buf, start)
+                    keys[key] = (start, end)
+                    pos = _WS.match(buf, end).end()
+                    sep = buf[pos:pos + 1]
+                    if sep == b"}":
+                        break
+                    if sep != b",":
+                        raise ValueError(f"Expected ',' or '}}' at offset {pos}")
+                    pos = _WS.match(buf, pos + 1).end()
+            self._keys = keys
+        return self._keys
+
+    # ----- arrays -----
+
+    def __len__(self) -> int:
+        if self.kind == "array":
+            return len(self._array_index()) // 2
+        if self.kind == "object":
+            return len(self._object_index())
+        raise TypeError("Scalar node has no length")
+
+    def element(self, index: int) -> Any:
+        """Element node at ``index`` (negative counts from the end) or MISSING."""
+
+        if self.kind != "array":
+            return MISSING
+        bounds = self._array_index()
+        size = len(bounds) // 2
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            return MISSING
+        return self.doc.node(bounds[2 * index], bounds[2 * index + 1])
+
+    def elements(self) -> Iterator[Node]:
+        bounds = self._array_index()
+        for i in range(0, len(bounds), 2):
+            yield self.doc.node(bounds[i], bounds[i + 1])
+
+    def _array_index(self) -> array:
+        if self._bounds is None:
+            buf = self.doc.buf
+            bounds = array("q")
+            pos = _WS.match(buf, self.start + 1).end()
+            if buf[pos:pos + 1] != b"]":
+                while True:
+                    end = _skip(buf, pos)
+                    bounds.append(pos)
+                    bounds.append(end)
+                    pos = _WS.match(buf, end).end()
+                    sep = buf[pos:pos + 1]
+                    if sep == b"]":
+                        break
+                    if sep != b",":
+                        raise ValueError(f"Expected ',' or ']' at offset {pos}")
+                    pos = _WS.match(buf, pos + 1).end()
+            self._bounds = bounds
+        return self._bounds
+
+
+def _skip(buf: Any, pos: int) -> int:
+    """Offset just past the JSON value starting at ``pos``."""
+
+    head = buf[pos:pos + 1]
+    if head == b'"':
+        m = _STRING.match(buf, pos)
+        if m is None:
+            raise ValueError(f"Unterminated string at offset {pos}")
+        return m.end()
+    if head not in (b"{", b"["):
+        end = _SCALAR.match(buf, pos).end()
+        if end == pos:
+            raise ValueError(f"Expected a JSON value at offset {pos}")
+        return end
+    depth = 0
+    size = len(buf)
+    while pos < size:
+        ch = buf[pos:pos + 1]
+        if ch in (b"{", b"["):
+            m = _CONTAINER.match(buf, pos)
+            if m is not None:
+                if depth == 0:
+                    return m.end()
+                pos = _RUN.match(buf, m.end()).end()
+                continue
+            depth += 1
+        elif ch in (b"}", b"]"):
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos = _RUN.match(buf, pos + 1).end()
+    raise ValueError("Unexpected end of JSON document")
+
+
+# ----- vectorized access over nodes (mirrors core.access.get_raw) -----
+
+Selection = Any  # Node | MISSING | list of Node/MISSING (a fan-out)
+
+
+def select(sel: Selection, key: Union[str, int, slice], mode: MissingMode) -> Selection:
+    if isinstance(sel, list):
+        if isinstance(key, (int, slice)):
+            try:
+                return sel[key]
+            except IndexError:
+                return _missing(mode, IndexError("list index out of range"))
+        out: List[Any] = []
+        for node in sel:
+            child = node.child(key) if isinstance(node, Node) else MISSING
+            if is_missing(child):
+                if mode is MissingMode.RAISE:
+                    raise KeyError(key)
+                if mode is MissingMode.KEEP:
+                    out.append(MISSING)
+            elif child.kind == "array":
+                out.extend(child.elements())
+            else:
+                out.append(child)
+        return out
+    if not isinstance(sel, Node):
+        return _missing(mode, KeyError("missing"))
+    kind = sel.kind
+    if kind == "array":
+        if isinstance(key, slice):
+            return list(sel.elements())[key]
+        if isinstance(key, int):
+            node = sel.element(key)
+            return _missing(mode, IndexError("list index out of range")) if is_missing(node) else node
+        return select(list(sel.elements()), key, mode)
+    if kind == "object" and isinstance(key, str):
+        node = sel.child(key)
+        return _missing(mode, KeyError(key)) if is_missing(node) else node
+    return _missing(mode, KeyError("missing"))
+
+
+def materialize(sel: Selection) -> Any:
+    if isinstance(sel, list):
+        return [node.load() if isinstance(node, Node) else node for node in sel]
+    return sel.load() if isinstance(sel, Node) else sel
+
+
+def iter_materialized(sel: Selection) -> Iterator[Any]:
+    """Decode the items of a selection one at a time (an array node yields its elements)."""
+
+    if isinstance(sel, Node) and sel.kind == "array":
+        sel = sel.elements()
+    elif not isinstance(sel, list):
+        sel = [] if is_missing(sel) else [sel]
+    for node in sel:
+        yield node.load() if isinstance(node, Node) else node
+
+
+def _missing(mode: MissingMode, exc: Exception) -> Any:
+    if mode is MissingMode.RAISE:
+        raise exc
+    return MISSING
@@ -1,24 +1,106 @@
 from __future__ import annotations
 import json
-from typing import Any, Optional
+from functools import lru_cache
+from typing import IO, Any, Iterable, Iterator, List, Optional
 
 from ..core.missing import is_missing
 
+_MISSING_MSG = "Missing values present; fill or drop before serialization"
+
 
 def ensure_serializable(x: Any) -> None:
     if _contains_missing(x):
-        raise ValueError("Missing values present; fill or drop before serialization")
+        raise ValueError(_MISSING_MSG)
 
 
 def to_json(x: Any, *, indent: Optional[int] = None) -> str:
-    ensure_serializable(x)
-    return json.dumps(x, ensure_ascii=False, indent=indent)
+    # MISSING is detected by the encoder's ``default`` hook, so the tree is
+    # walked once instead of being pre-scanned.
+    return _encoder(indent).encode(x)
 
 
 def pretty(x: Any, *, indent: int = 2) -> None:
     print(to_json(x, indent=indent))
 
 
+def iter_json(x: Any, *, indent: Optional[int] = None, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Yield ``to_json(x)`` in pieces of roughly ``chunk_size`` characters.
+
+    Top-level lists and dicts are encoded one member at a time, so peak memory
+    is bounded by the largest member rather than the whole document.
+    """
+
+    if isinstance(x, list):
+        return iter_json_array(x, indent=indent, chunk_size=chunk_size)
+    if isinstance(x, dict) and all(isinstance(k, str) for k in x):
+        return _buffered(_object_parts(x, indent), chunk_size)
+    return iter([to_json(x, indent=indent)])
+
+
+def iter_json_array(items: Iterable[Any], *, indent: Optional[int] = None, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Like :func:`iter_json` for a list whose items come from any iterable."""
+
+    return _buffered(_array_parts(items, indent), chunk_size)
+
+
+def dump(x: Any, fp: IO[str], *, indent: Optional[int] = None, chunk_size: int = 1 << 16) -> None:
+    for chunk in iter_json(x, indent=indent, chunk_size=chunk_size):
+        fp.write(chunk)
+
+
+@lru_cache(maxsize=8)
+def _encoder(indent: Optional[int]) -> json.JSONEncoder:
+    return json.JSONEncoder(ensure_ascii=False, indent=indent, default=_default)
+
+
+def _default(o: Any) -> Any:
+    if is_missing(o):
+        raise ValueError(_MISSING_MSG)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _member(x: Any, indent: Optional[int]) -> str:
+    text = to_json(x, indent=indent)
+    return text.replace("\n", "\n" + " " * indent) if indent is not None else text
+
+
+def _array_parts(items: Iterable[Any], indent: Optional[int]) -> Iterator[str]:
+    sep, pad, close = _layout(indent)
+    first = True
+    for item in items:
+        yield ("[" if first else sep) + pad + _member(item, indent)
+        first = False
+    yield "[]" if first else close + "]"
+
+
+def _object_parts(x: dict, indent: Optional[int]) -> Iterator[str]:
+    sep, pad, close = _layout(indent)
+    first = True
+    for key, value in x.items():
+        yield ("{" if first else sep) + pad + to_json(key) + ": " + _member(value, indent)
+        first = False
+    yield "{}" if first else close + "}"
+
+
+def _layout(indent: Optional[int]):
+    if indent is None:
+        return ", ", "", ""
+    return ",", "\n" + " " * indent, "\n"
+
+
+def _buffered(parts: Iterable[str], chunk_size: int) -> Iterator[str]:
+    buf: List[str] = []
+    size = 0
+    for part in parts:
+        buf.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buf)
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf)
+
+
 def _contains_missing(x: Any) -> bool:
     if is_missing(x):
         return True
@@ -0,0 +1,303 @@
+from __future__ import annotations
+import codecs
+import json
+import os
+import re
+from typing import IO, Any, Iterator, Optional, Sequence, Tuple, Union
+
+from ..core.missing import MISSING, MissingMode
+from ..core.plan import pluck_items
+from ..core.predicate import Where, raw_test
+
+Source = Union[str, "os.PathLike[str]", IO[str], IO[bytes]]
+
+
+def iter_loads(source: Source, where: Sequence[Where] = ()) -> Iterator[Any]:
+    """Yield one decoded record per non-blank line of an NDJSON source.
+
+    Paths are opened (and closed) by the generator; file objects are read
+    incrementally and left open for the caller. Only records passing every
+    ``where`` predicate are yielded, and lines that cannot match are skipped
+    on their raw text without being decoded (or validated).
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            yield from _iter_lines(fp, where)
+    else:
+        yield from _iter_lines(source, where)
+
+
+def _iter_lines(fp: Union[IO[str], IO[bytes]], where: Sequence[Where] = ()) -> Iterator[Any]:
+    prefilter = raw_test(where)
+    for lineno, line in enumerate(fp, 1):
+        if prefilter is not None and not prefilter(line):
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON on line {lineno}: {exc.msg}") from exc
+        if all(pred(record) for pred in where):
+            yield record
+
+
+class LineStream:
+    """Item source over an NDJSON source, with pushed-down ``where`` predicates.
+
+    A path is re-opened on every run. A file object is read from where it
+    stands and never rewound, so it is single-pass: a second run yields nothing.
+    """
+
+    def __init__(self, source: Source, where: Tuple[Where, ...] = ()):
+        self.source = source
+        self.where = where
+
+    def filtered(self, pred: Where) -> LineStream:
+        return LineStream(self.source, self.where + (pred,))
+
+    def __call__(self) -> Iterator[Any]:
+        return iter_loads(self.source, self.where)
+
+
+class ArrayStream:
+    """Item source over the array at ``keys`` inside one JSON document.
+
+    Object keys along ``keys`` are located by skipping sibling values without
+    decoding them; once an array is reached its elements are decoded one at a
+    time from ``chunk_size`` reads. The target must be an array. As with
+    ``LineStream``, only path sources can be run more than once.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        keys: Tuple[str, ...] = (),
+        *,
+        mode: MissingMode = MissingMode.DROP,
+        chunk_size: int = 1 << 16,
+    ):
+        self.source = source
+        self.keys = keys
+        self.mode = mode
+        self.chunk_size = chunk_size
+
+    def descend(self, key: str) -> ArrayStream:
+        return ArrayStream(self.source, self.keys + (key,), mode=self.mode, chunk_size=self.chunk_size)
+
+    def __call__(self) -> Iterator[Any]:
+        if isinstance(self.source, (str, os.PathLike)):
+            return self._iter_path(self.source)
+        return iter_array(self.source, self.keys, mode=self.mode, chunk_size=self.chunk_size)
+
+    def _iter_path(self, path: Any) -> Iterator[Any]:
+        with open(path, "rb") as fp:
+            yield from iter_array(fp, self.keys, mode=self.mode, chunk_size=self.chunk_size)
+
+
+def iter_array(
+    fp: Union[IO[str], IO[bytes]],
+    keys: Sequence[str] = (),
+    *,
+    mode: MissingMode = MissingMode.DROP,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """Yield the elements of the array found at ``keys`` in a JSON document.
+
+    Keys are followed through objects only. If an array is reached before the
+    keys run out, its elements are streamed and the remaining keys are
+    plucked from each of them, matching ``Q.path`` vectorization. A missing
+    key yields nothing (DROP), one MISSING (KEEP) or raises KeyError (RAISE);
+    a target that is not an array raises TypeError.
+    """
+
+    reader = _Reader(fp, chunk_size)
+    for i, key in enumerate(keys):
+        ch = reader.peek()
+        if ch == "[":
+            yield from pluck_items(reader.iter_elements(), keys[i:], mode)
+            return
+        if ch != "{" or not reader.find_key(key):
+            if mode is MissingMode.RAISE:
+                raise KeyError(key)
+            if mode is MissingMode.KEEP:
+                yield MISSING
+            return
+    if reader.peek() != "[":
+        where = ".".join(keys) or "the document root"
+        raise TypeError(f"JSON stream target at {where} is not an array; load the document with Q(...) instead")
+    yield from reader.iter_elements()
+
+
+_WS = " \t\n\r"
+_STRUCT_RE = re.compile(r'["\[\]{}]')
+_STRING_END_RE = re.compile(r'["\\]')
+_SCALAR_END_RE = re.compile(r"[,\]}\s]")
+# Number characters running up to the end of the buffer.
+_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*\Z")
+
+
+class _Reader:
+    """Chunked cursor over a JSON text with just enough parsing to navigate it."""
+
+    def __init__(
+        self, fp: Union[IO[str], IO[bytes]], chunk_size: int, decoder: Optional[json.JSONDecoder] = None
+    ):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = decoder or json.JSONDecoder()
+        self._text_decoder: Optional[codecs.IncrementalDecoder] = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    # ----- buffer management -----
+    def _fill(self, size: Optional[int] = None) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+        if isinstance(chunk, bytes):
+            if self._text_decoder is None:
+                self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self._text_decoder.decode(chunk, final=self._eof)
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return not self._eof
+
+    def _grow(self) -> bool:
+        # Read at least as much as is already buffered so retries on a large
+        # value stay linear overall.
+        return self._fill(max(self._chunk_size, len(self._buf) - self._pos))
+
+    def _error(self, msg: str) -> ValueError:
+        return ValueError(f"{msg} in JSON stream")
+
+    def peek(self) -> str:
+        while True:
+            buf, n, pos = self._buf, len(self._buf), self._pos
+            while pos < n and buf[pos] in _WS:
+                pos += 1
+            self._pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise self._error(f"Expected '{ch}'")
+        self._pos += 1
+
+    # ----- values -----
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._grow():
+                    continue
+                raise self._error(f"Invalid JSON ({exc.msg})") from exc
+            if value.__class__ in (int, float) and _NUMBER_TAIL_RE.match(self._buf, end) and self._grow():
+                continue  # the number may continue in the next chunk, e.g. after "1." or "2e"
+            self._pos = end
+            return value
+
+    def _read_string(self) -> str:
+        self._expect('"')
+        while True:
+            try:
+                value, end = json.decoder.scanstring(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._grow():
+                    continue
+                raise self._error(f"Invalid string ({exc.msg})") from exc
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Advance past one value without building Python objects for it."""
+
+        ch = self.peek()
+        if ch == '"':
+            self._skip_string()
+            return
+        if ch not in "[{":
+            while True:
+                match = _SCALAR_END_RE.search(self._buf, self._pos)
+                if match:
+                    self._pos = match.start()
+                    return
+                if not self._grow():
+                    self._pos = len(self._buf)
+                    return
+        depth = 0
+        while True:
+            match = _STRUCT_RE.search(self._buf, self._pos)
+            if not match:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise self._error("Unexpected end")
+                continue
+            tok = match.group()
+            self._pos = match.start()
+            if tok == '"':
+                self._skip_string()
+                continue
+            self._pos += 1
+            depth += 1 if tok in "[{" else -1
+            if depth == 0:
+                return
+
+    def _skip_string(self) -> None:
+        self._pos += 1  # opening quote
+        while True:
+            match = _STRING_END_RE.search(self._buf, self._pos)
+            if not match:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise self._error("Unterminated string")
+                continue
+            if match.group() == '"':
+                self._pos = match.end()
+                return
+            if match.end() >= len(self._buf):
+                self._pos = match.start()
+                if not self._grow():
+                    raise self._error("Unterminated string")
+                continue
+            self._pos = match.end() + 1  # skip the escaped character
+
+    # ----- containers -----
+    def find_key(self, key: str) -> bool:
+        """Inside ``{``, move to the value of ``key``; False if it is absent."""
+
+        self._expect("{")
+        if self.peek() == "}":
+            return False
+        while True:
+            name = self._read_string()
+            self._expect(":")
+            if name == key:
+                return True
+            self.skip_value()
+            ch = self.peek()
+            if ch == "}":
+                return False
+            self._expect(",")
+
+    def iter_elements(self) -> Iterator[Any]:
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            ch = self.peek()
+            if ch == "]":
+                self._pos += 1
+                return
+            self._expect(",")
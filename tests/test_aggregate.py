@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+from jsonq.api import Q
+from jsonq.core import aggregate
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.operators import seq
+
+
+class AggregateTests(unittest.TestCase):
+    ROWS = [{"ms": 10}, {"ms": 20.0}, {"ms": 40}, {"other": 1}]
+
+    def _both_engines(self, fn):
+        results = [fn()]
+        with mock.patch.object(aggregate, "np", None):
+            results.append(fn())
+        return results
+
+    def test_basic_aggregates_on_path(self) -> None:
+        q = Q(self.ROWS)
+        for out in self._both_engines(lambda: (q.count("ms"), q.sum("ms"), q.mean("ms"), q.min("ms"), q.max("ms"))):
+            self.assertEqual(out, (3, 70.0, 70 / 3, 10, 40))
+
+    def test_percentile_and_histogram(self) -> None:
+        q = Q(list(range(1, 11)))
+        for p50, p90, hist in self._both_engines(lambda: (q.percentile(50), q.percentile([90]), q.histogram(3))):
+            self.assertAlmostEqual(p50, 5.5)
+            self.assertAlmostEqual(p90[0], 9.1)
+            self.assertEqual(hist["counts"], [3, 3, 4])
+            self.assertEqual(hist["edges"], [1.0, 4.0, 7.0, 10.0])
+
+    def test_missing_policy(self) -> None:
+        data = [1, MISSING, 3]
+
+        self.assertEqual(Q(data).sum(), 4)
+        self.assertIs(Q(data, mode=MissingMode.KEEP).sum(), MISSING)
+        with self.assertRaises(ValueError):
+            Q(data, mode=MissingMode.RAISE).mean()
+
+    def test_operator_and_columnar_input(self) -> None:
+        rows = [{"v": i} for i in range(5)]
+
+        self.assertEqual(Q(rows).apply(seq.aggregate("max", "v")).get(), 4)
+        self.assertEqual(Q(rows).columnar().sum("v"), 10)
+        self.assertIsNone(Q([]).mean())
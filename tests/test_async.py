@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class AsyncTests(unittest.TestCase):
+    def test_amap_bounded_and_ordered(self) -> None:
+        active = []
+        peak = []
+
+        async def lookup(x):
+            active.append(x)
+            peak.append(len(active))
+            await asyncio.sleep(0.001 * (5 - x % 5))
+            active.remove(x)
+            if x == 3:
+                raise RuntimeError("boom")
+            return x * 10
+
+        q = asyncio.run(Q(list(range(10))).amap(lookup, concurrency=3))
+
+        self.assertEqual(q.list(), [0, 10, 20, MISSING, 40, 50, 60, 70, 80, 90])
+        self.assertLessEqual(max(peak), 3)
+
+    def test_unordered_and_afilter(self) -> None:
+        async def slow_double(x):
+            await asyncio.sleep(0.001 * (3 - x))
+            return x * 2
+
+        async def is_even(x):
+            return x % 2 == 0
+
+        out = asyncio.run(Q([0, 1, 2]).amap(slow_double, concurrency=3, ordered=False)).list()
+        self.assertEqual(sorted(out), [0, 2, 4])
+        self.assertEqual(out[0], 4)
+        self.assertEqual(asyncio.run(Q(list(range(6))).afilter(is_even)).list(), [0, 2, 4])
+
+    def test_async_source_chain(self) -> None:
+        async def source():
+            for i in range(20):
+                await asyncio.sleep(0)
+                yield {"id": i, "tags": [i, -i]}
+
+        async def enrich(x):
+            await asyncio.sleep(0)
+            return x + 1000
+
+        async def run():
+            q = Q.from_async_iter(source()).filter(lambda r: r["id"] % 5 == 0).pluck("tags").amap(enrich, concurrency=4)
+            items = [x async for x in q]
+            first = await Q.from_async_iter(source()).afilter(lambda r: asyncio.sleep(0, r["id"] > 7)).first()
+            return items, first
+
+        items, first = asyncio.run(run())
+        self.assertEqual(items, [1000, 1000, 1005, 995, 1010, 990, 1015, 985])
+        self.assertEqual(first["id"], 8)
+
+
+    def test_chain_missing_policy(self) -> None:
+        async def bad(x):
+            if x == 2:
+                raise ValueError(x)
+            return x * 10
+
+        async def run(q):
+            return await q.list()
+
+        plain = asyncio.run(run(Q.from_async_iter([1, 2, 3]).amap(bad)))
+        mapped = asyncio.run(run(Q.from_async_iter([1, 2, 3]).amap(bad).map(lambda x: x)))
+        self.assertEqual(plain, [10, 30])
+        self.assertEqual(plain, mapped)
+        kept = Q.from_async_iter([1, 2, 3], mode=MissingMode.KEEP).amap(bad)
+        self.assertEqual(asyncio.run(run(kept)), [10, MISSING, 30])
+
+    def test_first_over_plain_async_iterator(self) -> None:
+        class Countdown:
+            def __init__(self):
+                self.n = 3
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if self.n == 0:
+                    raise StopAsyncIteration
+                self.n -= 1
+                return self.n
+
+        self.assertEqual(asyncio.run(Q.from_async_iter(Countdown()).first()), 2)
+        self.assertEqual(asyncio.run(Q.from_async_iter(Countdown()).pluck("x").first("none")), "none")
@@ -0,0 +1,33 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import access_overhead, generators, run
+
+
+class BenchmarkSuiteSmokeTests(unittest.TestCase):
+    def test_generators_are_deterministic(self) -> None:
+        self.assertEqual(generators.records(5), generators.records(5))
+        self.assertEqual(len(generators.sparse_records(50)), 50)
+
+    def test_save_and_compare_baseline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(run.main(["--sizes", "50", "--repeat", "1", "--only", "pluck,diff", "--save", path]), 0)
+            with open(path) as fp:
+                baseline = json.load(fp)
+            self.assertIn("pluck/records/50", baseline)
+
+            slower = {name: {"seconds": m["seconds"] * 10, "peak_bytes": m["peak_bytes"]} for name, m in baseline.items()}
+            self.assertEqual(run.compare(baseline, slower, 0.25), [])
+            self.assertTrue(run.compare(slower, baseline, 0.25))
+
+    def test_access_overhead_runs(self) -> None:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(access_overhead.main(["10"]), 0)
+        self.assertIn("path 4 keys", out.getvalue())
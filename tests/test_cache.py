@@ -0,0 +1,74 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.cache import ResultCache
+
+
+class ResultCacheTests(unittest.TestCase):
+    DOC = {"data": {"users": [{"name": "a", "age": 30}, {"name": "b", "age": 20}]}}
+
+    def test_shared_prefix_computed_once(self) -> None:
+        cache = ResultCache()
+        calls = []
+
+        def adult(u):
+            calls.append(u["name"])
+            return u["age"] >= 21
+
+        first = Q.cached(self.DOC, cache).path("data.users").filter(adult).pluck("name").list()
+        second = Q.cached(self.DOC, cache).path("data.users").filter(adult).list()
+        other = Q.cached(self.DOC, cache).path("data.users").sort_by("age").pluck("name").list()
+
+        self.assertEqual(first, ["a"])
+        self.assertEqual(second, [{"name": "a", "age": 30}])
+        self.assertEqual(other, ["b", "a"])
+        self.assertEqual(calls, ["a", "b"])
+        self.assertEqual(cache.stats()["hits"], 3)
+
+    def test_versions_and_invalidation(self) -> None:
+        cache = ResultCache()
+        doc = {"n": [1, 2]}
+
+        self.assertEqual(Q.cached(doc, cache).path("n").list(), [1, 2])
+        doc["n"] = [3]
+        self.assertEqual(Q.cached(doc, cache).path("n").list(), [1, 2])
+        self.assertEqual(Q.cached(doc, cache, version=2).path("n").list(), [3])
+        cache.invalidate(doc)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(Q.cached(doc, cache).path("n").list(), [3])
+
+    def test_lru_budget(self) -> None:
+        cache = ResultCache(max_entries=2, max_weight=10)
+        doc = {"a": list(range(20)), "b": [1], "c": [2], "d": [3]}
+
+        Q.cached(doc, cache).path("a")
+        self.assertEqual(len(cache), 0)
+        for key in ("b", "c", "d"):
+            Q.cached(doc, cache).path(key)
+        self.assertEqual(len(cache), 2)
+        Q.cached(doc, cache).path("b")
+        self.assertEqual(cache.stats()["hits"], 0)
+        cache.invalidate()
+        self.assertEqual(cache.stats()["weight"], 0)
+
+    def test_equal_but_distinct_arguments_do_not_share_entries(self) -> None:
+        cache = ResultCache()
+        doc = {"x": 1}
+        results = [Q.cached(doc, cache).path("y").fill_missing(v).get() for v in (0, False, 0.0, [1], (1,))]
+        self.assertEqual([type(r) for r in results], [int, bool, float, list, tuple])
+        self.assertEqual(cache.stats()["hits"], 4)  # only the shared path("y") prefix
+
+    def test_weight_counts_nested_values(self) -> None:
+        cache = ResultCache(max_weight=10)
+        doc = {"one": [list(range(50))], "flat": [1, 2]}
+        Q.cached(doc, cache).path("one")
+        self.assertEqual(len(cache), 0)
+        Q.cached(doc, cache).path("flat")
+        self.assertEqual(cache.stats()["weight"], 5)
+
+    def test_unhashable_step_is_not_cached(self) -> None:
+        cache = ResultCache()
+        out = Q.cached({"x": None}, cache).path("x").fill_missing({"tags": {1}}).path("y")
+        self.assertEqual(out.get(), None)
+        self.assertIsNone(out._ctx)
+
@@ -0,0 +1,43 @@
+import unittest
+from array import array
+
+from jsonq.api import Q
+from jsonq.core.columnar import ColumnStore
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class ColumnStoreTests(unittest.TestCase):
+    ROWS = [
+        {"id": 3, "score": 1.5, "tags": ["a", "b"], "name": "c"},
+        {"id": 1, "tags": "x", "name": "a"},
+        MISSING,
+        {"id": 2, "score": 0.5, "name": "b"},
+    ]
+
+    def test_numeric_columns_use_arrays(self) -> None:
+        store = ColumnStore.build(self.ROWS)
+
+        self.assertIsInstance(store.columns["id"].values, array)
+        self.assertEqual(store.columns["score"].values.typecode, "d")
+        self.assertIsInstance(store.columns["name"].values, list)
+
+    def test_pluck_matches_row_access(self) -> None:
+        for mode in (MissingMode.DROP, MissingMode.KEEP):
+            rows = Q(self.ROWS, mode=mode)
+            cols = rows.columnar()
+            for key in ("id", "score", "tags", "nope"):
+                self.assertEqual(cols.pluck(key).list(), rows.pluck(key).list(), (mode, key))
+
+    def test_filter_and_sort_keep_columns(self) -> None:
+        q = Q(self.ROWS).columnar().filter_by("id", lambda v: v > 1).sort_by("id")
+
+        self.assertIsNotNone(q._v.columns)
+        self.assertEqual(q.pluck("name").list(), ["b", "c"])
+        self.assertEqual(q.list(), Q(self.ROWS).filter_by("id", lambda v: v > 1).sort_by("id").list())
+
+    def test_sort_by_field_puts_absent_last(self) -> None:
+        expected = [0.5, 1.5]
+        for q in (Q(self.ROWS), Q(self.ROWS).columnar()):
+            out = q.sort_by("score").list()
+            self.assertEqual([r["score"] for r in out[:2]], expected)
+            self.assertEqual(out[2]["id"], 1)
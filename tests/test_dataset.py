@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.ops.dataset import iter_shard, plan_shards
+
+
+def _is_error(r):
+    return r["level"] == "error"
+
+
+class DatasetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.records = [
+            {"id": i, "level": "error" if i % 3 == 0 else "info", "ms": i % 7} for i in range(60)
+        ]
+        for day in range(3):
+            rows = self.records[day * 20 : (day + 1) * 20]
+            with open(os.path.join(self.tmp.name, f"day{day}.ndjson"), "w") as fp:
+                fp.write("".join(json.dumps(r) + "\n" for r in rows))
+        with open(os.path.join(self.tmp.name, "extra.json"), "w") as fp:
+            json.dump([{"id": 60, "level": "error", "ms": 1}], fp)
+        self.all = self.records + [{"id": 60, "level": "error", "ms": 1}]
+        self.pattern = os.path.join(self.tmp.name, "*")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_byte_ranges_cover_every_line_once(self) -> None:
+        path = os.path.join(self.tmp.name, "day0.ndjson")
+        for size in (1, 7, 40, 10_000):
+            shards = plan_shards([path], size)
+            ids = [r["id"] for shard in shards for r in iter_shard(shard)]
+            self.assertEqual(ids, list(range(20)))
+
+    def test_reducers_match_single_pass(self) -> None:
+        ds = Q.scan(self.pattern, workers=2, shard_bytes=200).filter(_is_error)
+        expected = Q(self.all).filter(_is_error)
+
+        self.assertGreater(len(ds.shards), 4)
+        self.assertEqual(ds.pluck("id").list(), expected.pluck("id").list())
+        self.assertEqual(ds.count(), expected.count())
+        self.assertEqual(ds.sum("ms"), expected.sum("ms"))
+        self.assertEqual(ds.top_k(3, "ms").list(), expected.top_k(3, "ms").list())
+        self.assertEqual(ds.bottom_k(2, ["ms", "-id"]).list(), expected.bottom_k(2, ["ms", "-id"]).list())
+
+    def test_group_by_merges_partials(self) -> None:
+        specs = {"n": "count", "total": ("ms", "sum"), "avg": ("ms", "mean"), "top": ("ms", "max")}
+        ds = Q.scan(self.pattern, workers=2, executor="thread", shard_bytes=150)
+
+        rows = ds.group_by("level").agg(**specs).list()
+
+        self.assertEqual(
+            sorted(rows, key=lambda r: r["key"]),
+            sorted(Q(self.all).group_by("level").agg(**specs).list(), key=lambda r: r["key"]),
+        )
+
+    def test_missing_values_and_single_worker(self) -> None:
+        ds = Q.scan(self.pattern, workers=1, mode=MissingMode.KEEP).pluck("nope")
+
+        self.assertIs(ds.sum(), MISSING)
+        self.assertEqual(ds.drop_missing().count(), 0)
+        self.assertEqual(Q.scan(os.path.join(self.tmp.name, "none*")).count(), 0)
+
+    def test_invalid_line_reports_file_and_offset(self) -> None:
+        with open(os.path.join(self.tmp.name, "bad.ndjson"), "w") as fp:
+            fp.write('{"id": 1}\n{oops\n')
+        with self.assertRaisesRegex(ValueError, r"bad\.ndjson at byte 10"):
+            Q.scan(os.path.join(self.tmp.name, "bad.ndjson")).list()
+
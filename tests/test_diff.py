@@ -0,0 +1,69 @@
+import copy
+import unittest
+
+from jsonq.api import Q
+
+
+class NestedDiffPatchTests(unittest.TestCase):
+    def test_top_level_ops_unchanged(self) -> None:
+        ops = Q.diff({"a": 1, "c": 0}, {"a": 2, "b": 3})
+
+        self.assertEqual(
+            ops,
+            [
+                {"op": "remove", "path": "/c"},
+                {"op": "add", "path": "/b", "value": 3},
+                {"op": "replace", "path": "/a", "value": 2},
+            ],
+        )
+
+    def test_nested_paths_and_list_alignment(self) -> None:
+        a = {"svc": {"ports": [80, 443, 8080], "env": {"a/b": 1}}}
+        b = {"svc": {"ports": [22, 80, 443], "env": {"a/b": 2}}}
+
+        ops = Q.diff(a, b)
+
+        self.assertEqual(
+            ops,
+            [
+                {"op": "replace", "path": "/svc/env/a~1b", "value": 2},
+                {"op": "add", "path": "/svc/ports/0", "value": 22},
+                {"op": "remove", "path": "/svc/ports/3"},
+            ],
+        )
+        self.assertEqual(Q.patch(a, ops), b)
+
+    def test_patch_shares_untouched_subtrees(self) -> None:
+        a = {"big": {"x": list(range(10))}, "small": {"n": 1}}
+        before = copy.deepcopy(a)
+
+        out = Q.patch(a, [{"op": "replace", "path": "/small/n", "value": 2}])
+
+        self.assertEqual(a, before)
+        self.assertIs(out["big"], a["big"])
+        self.assertEqual(out["small"], {"n": 2})
+
+    def test_move_copy_test_ops(self) -> None:
+        doc = {"a": [1, 2], "b": {}}
+        ops = [
+            {"op": "test", "path": "/a/1", "value": 2},
+            {"op": "copy", "from": "/a", "path": "/b/a"},
+            {"op": "move", "from": "/a/0", "path": "/a/-"},
+        ]
+
+        self.assertEqual(Q.patch(doc, ops), {"a": [2, 1], "b": {"a": [1, 2]}})
+        with self.assertRaises(ValueError):
+            Q.patch(doc, [{"op": "test", "path": "/a/0", "value": 9}])
+
+    def test_copy_is_independent_and_replace_keeps_order(self) -> None:
+        out = Q.patch({"a": {"x": 1}}, [{"op": "copy", "from": "/a", "path": "/z"}])
+        out["z"]["x"] = 99
+        self.assertEqual(out["a"], {"x": 1})
+
+        out = Q.patch({"a": 1, "b": 2, "c": 3}, [{"op": "replace", "path": "/a", "value": 9}])
+        self.assertEqual(list(out), ["a", "b", "c"])
+        self.assertEqual(Q.patch([1, 2], [{"op": "replace", "path": "/0", "value": 5}]), [5, 2])
+        with self.assertRaises(ValueError):
+            Q.patch({"a": 1}, [{"op": "replace", "path": "/b", "value": 2}])
+        with self.assertRaises(ValueError):
+            Q.patch([1], [{"op": "replace", "path": "/1", "value": 2}])
@@ -0,0 +1,50 @@
+import io
+import json
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.operators import seq
+
+
+class GroupByTests(unittest.TestCase):
+    ITEMS = [
+        {"user": "a", "amount": 5},
+        {"user": "b", "amount": 2},
+        {"user": "a", "amount": 7},
+        {"user": "b"},
+        {"amount": 100},
+    ]
+
+    def test_agg_single_pass(self) -> None:
+        out = Q(self.ITEMS).group_by("user").agg(
+            n="count", total=("amount", "sum"), top=("amount", "max"), avg=("amount", "mean")
+        )
+
+        self.assertEqual(
+            out.list(),
+            [
+                {"key": "a", "n": 2, "total": 12, "top": 7, "avg": 6.0},
+                {"key": "b", "n": 2, "total": 2, "top": 2, "avg": 2.0},
+            ],
+        )
+
+    def test_keep_mode_propagates_missing(self) -> None:
+        out = Q(self.ITEMS, mode=MissingMode.KEEP).group_by("user").agg(total=("amount", "sum")).list()
+
+        self.assertEqual([row["key"] for row in out], ["a", "b", MISSING])
+        self.assertIs(out[1]["total"], MISSING)
+
+    def test_streaming_source_and_callable_key(self) -> None:
+        lines = io.StringIO("\n".join(json.dumps(item) for item in self.ITEMS))
+
+        out = Q.from_ndjson(lines).group_by(lambda r: r["amount"] > 4).count().list()
+
+        self.assertEqual(out, [{"key": True, "count": 3}, {"key": False, "count": 1}])
+
+    def test_groups_and_operator(self) -> None:
+        groups = Q(self.ITEMS).group_by("user").groups().list()
+        p50 = Q(self.ITEMS).apply(seq.group_by("user", p50=("amount", "percentile", {"q": 50}))).list()
+
+        self.assertEqual(groups[0]["items"], [self.ITEMS[0], self.ITEMS[2]])
+        self.assertEqual([row["p50"] for row in p50], [6.0, 2.0])
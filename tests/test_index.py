@@ -0,0 +1,40 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class IndexTests(unittest.TestCase):
+    USERS = [
+        {"id": 1, "age": 30, "tags": ["a", "b"], "profile": {"email": "x@e"}},
+        {"id": 2, "age": 20, "tags": ["b"]},
+        {"id": 3, "age": 25, "profile": {"email": "z@e"}},
+        {"id": 1, "age": 41},
+    ]
+
+    def test_lookup_and_where(self) -> None:
+        idx = Q(self.USERS).index_by("id")
+
+        self.assertEqual([u["age"] for u in idx.lookup(1).list()], [30, 41])
+        self.assertEqual(idx.lookup(9).list(), [])
+        self.assertEqual(idx.one(3)["age"], 25)
+        self.assertIsNone(idx.one(9))
+        self.assertIn(2, idx)
+        self.assertEqual(idx.where("profile.email", "z@e").list(), [self.USERS[2]])
+        self.assertEqual([u["id"] for u in idx.where("tags", "b").list()], [1, 2])
+        self.assertIs(idx.index("tags"), idx.index("tags"))
+
+    def test_between_uses_sorted_index(self) -> None:
+        idx = Q(self.USERS).index_by("age", ordered=True)
+
+        self.assertTrue(idx.index("age").ordered)
+        self.assertEqual([u["age"] for u in idx.between("age", 21, 40).list()], [25, 30])
+        self.assertEqual([u["age"] for u in idx.between("age", None, 25).list()], [20, 25])
+
+    def test_missing_keys_follow_mode(self) -> None:
+        self.assertNotIn(MISSING, Q(self.USERS).index_by("profile.email"))
+        kept = Q(self.USERS, mode=MissingMode.KEEP).index_by("profile.email")
+        self.assertEqual(len(kept.lookup(MISSING).list()), 2)
+        with self.assertRaises(KeyError):
+            Q(self.USERS, mode=MissingMode.RAISE).index_by("profile.email")
+
@@ -0,0 +1,56 @@
+import io
+import json
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class JoinTests(unittest.TestCase):
+    ORDERS = [
+        {"id": 10, "user_id": 1, "total": 5},
+        {"id": 11, "user_id": 2, "total": 7},
+        {"id": 12, "user_id": 3, "total": 1},
+        {"id": 13, "total": 2},
+        {"id": 14, "user_id": 1, "total": 9},
+    ]
+    USERS = [{"user_id": 1, "name": "a"}, {"user_id": 2, "name": "b"}]
+
+    def test_inner_and_left(self) -> None:
+        inner = Q(self.ORDERS).join(self.USERS, on="user_id").list()
+        self.assertEqual([(r["id"], r["name"]) for r in inner], [(10, "a"), (11, "b"), (14, "a")])
+
+        left = Q(self.ORDERS).join(Q(self.USERS), on="user_id", how="left").list()
+        self.assertEqual([r["id"] for r in left], [10, 11, 12, 14])
+        self.assertNotIn("name", left[2])
+
+    def test_missing_keys_follow_mode(self) -> None:
+        left = Q(self.ORDERS, mode=MissingMode.KEEP).join(self.USERS, on="user_id", how="left").list()
+        self.assertEqual([r["id"] for r in left], [10, 11, 12, 13, 14])
+        with self.assertRaises(KeyError):
+            Q(self.ORDERS, mode=MissingMode.RAISE).join(self.USERS, on="user_id")
+
+    def test_multi_key_paths(self) -> None:
+        left = [{"k": {"a": 1, "b": "x"}, "v": 1}, {"k": {"a": 1, "b": "y"}, "v": 2}]
+        right = [{"a": 1, "b": "y", "w": 3}]
+
+        rows = Q(left).join(right, on=["k.a", "k.b"], right_on=["a", "b"]).list()
+        self.assertEqual([(r["v"], r["w"]) for r in rows], [(2, 3)])
+        with self.assertRaises(ValueError):
+            Q(left).join(right, on=["k.a"], right_on=["a", "b"])
+        with self.assertRaises(ValueError):
+            Q(left).join(right, on="k", how="outer")
+
+    def test_lazy_probe_streams(self) -> None:
+        src = io.StringIO("\n".join(json.dumps(r) for r in self.ORDERS))
+        rows = Q.from_ndjson(src).join(self.USERS, on="user_id").filter(lambda r: r["total"] > 5)
+
+        self.assertEqual(rows.first()["id"], 11)
+
+
+    def test_lazy_join_keeps_chain_mode(self) -> None:
+        left = [{"id": 1, "n": "a"}, {"id": 2}]
+        right = [{"id": 1}, {"id": 2}]
+        lazy = Q(left).lazy().keep_missing().join(right, on="id").pluck("n")
+        self.assertEqual(lazy.list(), ["a", MISSING])
+        self.assertEqual(lazy.list(), Q(left, mode=MissingMode.KEEP).join(right, on="id").pluck("n").list())
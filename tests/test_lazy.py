@@ -0,0 +1,40 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class LazyQTests(unittest.TestCase):
+    def test_lazy_chain_matches_eager(self) -> None:
+        data = [{"a": [1, 2], "ok": True}, {"b": 1, "ok": True}, {"a": 3, "ok": False}]
+
+        def chain(q):
+            return q.filter(lambda r: r["ok"]).pluck("a").map(lambda x: x * 10)
+
+        for mode in (MissingMode.DROP, MissingMode.KEEP):
+            eager = chain(Q(data, mode=mode)).list()
+            lazy = chain(Q(data, mode=mode).lazy()).list()
+            self.assertEqual(lazy, eager)
+
+    def test_first_short_circuits(self) -> None:
+        seen = []
+
+        def track(x):
+            seen.append(x)
+            return x
+
+        result = Q(list(range(100))).lazy().map(track).filter(lambda x: x > 2).first()
+
+        self.assertEqual(result, 3)
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+    def test_path_and_index_on_lazy(self) -> None:
+        data = {"users": [{"name": "a"}, {"name": "b"}]}
+
+        self.assertEqual(Q(data).lazy().path("users[1].name").get(), "b")
+        self.assertIs(Q(data, mode=MissingMode.KEEP).lazy().path("users[5]").get(MISSING), MISSING)
+
+    def test_explain_groups_fused_stages(self) -> None:
+        plan = Q([]).lazy().filter(bool).map(str).sort_by(len).pluck("x").explain()
+
+        self.assertEqual(plan, "fused[filter -> map] => sort_by => fused[pluck('x')]")
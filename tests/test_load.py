@@ -0,0 +1,84 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from jsonq import LoadStats
+from jsonq.api import Q
+
+
+def _ndjson(records):
+    return io.StringIO("".join(json.dumps(r) + "\n" for r in records))
+
+
+class LoadTests(unittest.TestCase):
+    def test_keys_interned_across_lines(self) -> None:
+        rows = Q.load(_ndjson([{"service_name": i} for i in range(3)]), ndjson=True).list()
+        self.assertEqual(rows, [{"service_name": i} for i in range(3)])
+        keys = [next(iter(r)) for r in rows]
+        self.assertIs(keys[0], keys[1])
+        self.assertIs(keys[1], keys[2])
+
+    def test_top_level_array_from_file(self) -> None:
+        records = [{"rec-no": i, "rec-tags": {"rec-env": "prod"}} for i in range(50)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.json")
+            with open(path, "w") as fp:
+                json.dump(records, fp)
+            stats = LoadStats()
+            q = Q.load(path, stats=stats)
+        self.assertEqual(q.list(), records)
+        self.assertEqual(q.path("[3]['rec-tags']['rec-env']").get(), "prod")
+        # Non-identifier keys are not interned up front, so only repeats count.
+        self.assertEqual(stats.keys, 3 * 49)
+        self.assertEqual(stats.values, 0)
+
+    def test_scalar_dedupe(self) -> None:
+        stats = LoadStats()
+        records = [{"host": "host-" + "a" * 20, "n": 10**6, "x": 2.5} for _ in range(4)]
+        rows = Q.load(_ndjson(records), ndjson=True, dedupe_values="scalars", stats=stats).list()
+        self.assertEqual(rows, records)
+        for key in ("host", "n", "x"):
+            self.assertIs(rows[0][key], rows[3][key])
+        self.assertEqual(stats.values, 3 * 3)
+        self.assertIsNot(rows[0], rows[1])
+
+    def test_types_kept_apart(self) -> None:
+        rows = Q.load(io.StringIO("[1, 1.0, true, 0.0, -0.0, 1000, 1000.0]"), dedupe_values="subtrees").list()
+        self.assertEqual([type(v) for v in rows], [int, float, bool, float, float, int, float])
+        self.assertEqual(str(rows[4]), "-0.0")
+        self.assertEqual(
+            Q.load(io.StringIO('[{"a": 1}, {"a": 1.0}, {"a": true}]'), dedupe_values="subtrees").list(),
+            [{"a": 1}, {"a": 1.0}, {"a": True}],
+        )
+        rows = Q.load(io.StringIO('[{"a": 1}, {"a": 1.0}]'), dedupe_values="subtrees").list()
+        self.assertIsNot(rows[0], rows[1])
+        self.assertIs(type(rows[1]["a"]), float)
+
+    def test_subtree_sharing(self) -> None:
+        stats = LoadStats()
+        records = [{"id": i, "tags": {"env": "prod", "zones": ["a", "b"]}} for i in range(5)]
+        records.append({"id": 5, "tags": {"zones": ["a", "b"], "env": "prod"}})
+        rows = Q.load(_ndjson(records), ndjson=True, dedupe_values="subtrees", stats=stats).list()
+        self.assertEqual(rows, records)
+        self.assertIs(rows[0]["tags"], rows[4]["tags"])
+        # Key order is part of a container's identity.
+        self.assertIsNot(rows[0]["tags"], rows[5]["tags"])
+        self.assertIs(rows[0]["tags"]["zones"], rows[5]["tags"]["zones"])
+        self.assertEqual(stats.subtrees, 4 + 5)
+        self.assertGreater(stats.bytes_saved, 0)
+        # Containers above max_subtree stay unique.
+        rows = Q.load(_ndjson(records), ndjson=True, dedupe_values="subtrees", max_subtree=1).list()
+        self.assertIsNot(rows[0]["tags"], rows[1]["tags"])
+        self.assertIs(rows[0]["tags"]["env"], rows[1]["tags"]["env"])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            Q.load(io.StringIO("[]"), dedupe_values="all")
+        with self.assertRaises(ValueError):
+            Q.load(io.StringIO('{"a": 1} 2'))
+        with self.assertRaises(ValueError):
+            Q.load(io.StringIO('{"a": 1}\n{oops\n'), ndjson=True)
+        self.assertEqual(Q.load(io.StringIO(' {"a": [1, 2]} ')).get(), {"a": [1, 2]})
+
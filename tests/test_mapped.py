@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class MappedTests(unittest.TestCase):
+    DOC = {
+        "meta": {"note": 'brackets ] } in "strings"\\', "n": 2},
+        "users": [
+            {"name": "a", "tags": ["x", "y"], "profile": {"email": "a@e"}},
+            {"name": "b", "tags": []},
+            {"name": "c\u00e9", "profile": {"email": "c@e"}, "score": -1.5e3},
+        ],
+        "empty": {},
+    }
+
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(self.DOC, fp, indent=2)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_matches_eager_access(self) -> None:
+        exprs = ["meta.note", "users[2].score", "users.name", "users.tags", "users.profile.email", "users[-1]", "empty", "users[9]", "nope"]
+        for use_mmap in (True, False):
+            for mode in (MissingMode.DROP, MissingMode.KEEP):
+                with Q.open(self.path, mmap=use_mmap, mode=mode) as doc:
+                    for expr in exprs:
+                        eager = Q(self.DOC, mode=mode).path(expr).get(MISSING)
+                        self.assertEqual(doc.path(expr).get(MISSING), eager, (expr, mode))
+
+    def test_only_touched_nodes_are_indexed(self) -> None:
+        with Q.open(self.path) as doc:
+            self.assertEqual(doc["meta"]["n"].get(), 2)
+            self.assertEqual(sorted(doc.keys()), ["empty", "meta", "users"])
+            indexed = set(doc._doc._nodes)
+            users = doc._doc.root.child("users")
+            self.assertIsNone(users._bounds)
+            self.assertEqual(doc["users"].lazy().pluck("name").first(), "a")
+            self.assertIn(users.start, doc._doc._nodes)
+            self.assertGreater(len(doc._doc._nodes), len(indexed))
+
+    def test_raise_mode_and_collect(self) -> None:
+        with Q.open(self.path, mode=MissingMode.RAISE) as doc:
+            with self.assertRaises(KeyError):
+                doc.path("users.profile")
+            self.assertEqual(doc.path("users").collect().count(), 3)
+
+
+    def test_failed_open_closes_the_file(self) -> None:
+        with open(self.path, "w") as fp:
+            fp.write(" \n")
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            fp = open(*args, **kwargs)
+            opened.append(fp)
+            return fp
+
+        for use_mmap in (True, False):
+            with mock.patch("jsonq.ops.mapped.open", tracking_open, create=True):
+                with self.assertRaisesRegex(ValueError, "Empty JSON document"):
+                    Q.open(self.path, mmap=use_mmap)
+            self.assertTrue(opened[-1].closed)
@@ -0,0 +1,45 @@
+import io
+import json
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.order import select_k, sort_items
+
+
+class OrderTests(unittest.TestCase):
+    ROWS = [
+        {"name": "a", "score": 3, "team": "x"},
+        {"name": "b", "score": 9, "team": "y"},
+        {"name": "c", "team": "x"},
+        {"name": "d", "score": 9, "team": "x"},
+        {"name": "e", "score": 1, "team": "y"},
+    ]
+
+    def names(self, rows):
+        return [r["name"] for r in rows]
+
+    def test_sort_specs(self) -> None:
+        self.assertEqual(self.names(Q(self.ROWS).sort_by("-score").list()), ["b", "d", "a", "e", "c"])
+        self.assertEqual(self.names(Q(self.ROWS).sort_by(["team", "-score"]).list()), ["d", "a", "c", "b", "e"])
+        nested = [{"s": {"v": 2}}, {"s": {"v": 1}}]
+        self.assertEqual(Q(nested).sort_by("s.v").list(), [{"s": {"v": 1}}, {"s": {"v": 2}}])
+
+    def test_top_and_bottom_k_match_full_sort(self) -> None:
+        for spec in ("score", "-score", ["team", "score"], lambda r: r["name"]):
+            full = sort_items(self.ROWS, spec)
+            for k in range(len(self.ROWS) + 1):
+                self.assertEqual(select_k(iter(self.ROWS), k, spec), full[:k])
+
+        self.assertEqual(self.names(Q(self.ROWS).top_k(2, "score").list()), ["b", "d"])
+        self.assertEqual(self.names(Q(self.ROWS).bottom_k(2, "score").list()), ["e", "a"])
+
+    def test_lazy_top_k_and_first(self) -> None:
+        src = io.StringIO("\n".join(json.dumps(r) for r in self.ROWS))
+        top = Q.from_ndjson(src).filter(lambda r: r["team"] == "x").top_k(1, "score").list()
+        self.assertEqual(self.names(top), ["d"])
+
+        lazy = Q(self.ROWS).lazy().sort_by("-score")
+        self.assertEqual(lazy.first()["name"], "b")
+        self.assertEqual(lazy[1].get()["name"], "d")
+        self.assertIsNone(Q([]).lazy().sort_by("score").first())
+
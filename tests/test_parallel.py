@@ -0,0 +1,57 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.operators import seq
+
+
+def _inverse(x):
+    return 1 / x
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+class ParallelSeqTests(unittest.TestCase):
+    DATA = [3, 0, 2, MISSING, 5, 4, "x"]
+
+    def test_thread_map_matches_serial(self) -> None:
+        serial = Q(self.DATA).map(_inverse).list()
+        threaded = Q(self.DATA).map(_inverse, workers=3).list()
+
+        self.assertEqual(threaded, serial)
+        self.assertIs(threaded[1], MISSING)
+
+    def test_process_filter_preserves_order(self) -> None:
+        data = list(range(50)) + ["bad"]
+
+        out = Q(data).filter(_is_even, workers=2, executor="process").list()
+
+        self.assertEqual(out, list(range(0, 50, 2)))
+
+    def test_process_map_returns_missing_singleton(self) -> None:
+        serial = Q(self.DATA, mode=MissingMode.KEEP).map(_inverse).list()
+        pooled = Q(self.DATA, mode=MissingMode.KEEP).map(_inverse, workers=2, executor="process").list()
+
+        self.assertEqual(len(pooled), len(serial))
+        self.assertEqual([x is MISSING for x in pooled], [x is MISSING for x in serial])
+        dropped = Q(self.DATA).map(_inverse, workers=2, executor="process").list()
+        self.assertEqual(dropped, Q(self.DATA).map(_inverse).list())
+        self.assertIs(dropped[1], MISSING)
+
+    def test_operator_options_and_keep_mode(self) -> None:
+        op = seq.map_items(_inverse, workers=2)
+        value = Q(self.DATA, mode=MissingMode.KEEP).apply(op).list()
+
+        self.assertEqual(len(value), len(self.DATA))
+
+    def test_unknown_executor_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            Q([1, 2]).map(_inverse, workers=2, executor="gpu")
+
+    def test_zero_workers_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            Q([1, 2]).map(_inverse, workers=0)
+        with self.assertRaises(ValueError):
+            Q([1, 2]).filter(bool, workers=0)
@@ -0,0 +1,114 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.access import apply_path, compile_path, get_raw
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.core.path import parse_path, tokenize_path
+from jsonq.core.value import JsonValue
+
+
+def _fold(val, mode, expr):
+    """Reference: one ``get_raw`` call per path token."""
+
+    for token in parse_path(expr):
+        val = get_raw(val, token, mode)
+    return val
+
+
+def _outcome(fn, *args):
+    try:
+        return fn(*args)
+    except (KeyError, IndexError) as exc:
+        return type(exc)
+
+
+class CompiledPathTests(unittest.TestCase):
+    DOC = {"users": [{"profile": {"email": "a@x"}}, {"profile": {}}, {"tags": [1, 2]}]}
+
+    def test_compiled_matches_token_by_token_access(self) -> None:
+        exprs = (
+            "users",
+            "users[0].profile.email",
+            "users.profile.email",
+            "users.tags",
+            "users[-1].tags[1]",
+            "users[-3].profile",
+            "users[5].profile",
+            "nope.x",
+        )
+        for expr in exprs:
+            for mode in MissingMode:
+                expected = _outcome(_fold, self.DOC, mode, expr)
+                self.assertEqual(_outcome(compile_path(expr), self.DOC, mode), expected, (expr, mode))
+                interpreted = _outcome(apply_path, JsonValue(self.DOC, mode=mode), tokenize_path(expr))
+                self.assertEqual(interpreted, expected, (expr, mode))
+
+    def test_compiled_accessor_is_cached(self) -> None:
+        self.assertIs(compile_path("users[0].profile"), compile_path("users[0].profile"))
+        self.assertEqual(parse_path("a.b[2]"), ("a", "b", 2))
+
+    def test_raise_mode_still_raises(self) -> None:
+        with self.assertRaises(KeyError):
+            compile_path("users[0].missing")(self.DOC, MissingMode.RAISE)
+
+    def test_q_helpers_use_compiled_paths(self) -> None:
+        q = Q(self.DOC)
+
+        self.assertTrue(q.exists("users[0].profile.email"))
+        self.assertFalse(q.exists("users[1].profile.email"))
+        self.assertEqual(q.coalesce("users[1].profile.email", "users[0].profile.email"), "a@x")
+        self.assertIs(q.path("").get(MISSING), self.DOC)
+
+
+class _Boom(dict):
+    def get(self, *args):
+        raise AssertionError("traversal went past the first match")
+
+
+class ExtendedPathTests(unittest.TestCase):
+    DOC = {
+        "users": [{"name": "a", "tags": ["x", "y"], "email": "a@x"}, {"name": "b", "tags": []}, {"tags": ["z"]}],
+        "headers": {"content-type": "json", "a.b": 1},
+        "items": list(range(30)),
+    }
+
+    def test_tokens(self) -> None:
+        self.assertEqual(parse_path('a["content-type"][\'x.y\']'), ("a", "content-type", "x.y"))
+        self.assertEqual(parse_path("items[10:20]")[1], slice(10, 20))
+        self.assertEqual(parse_path("items[::-2]")[1], slice(None, None, -2))
+        self.assertEqual(repr(parse_path("users[*]..email")), "('users', *, ..'email')")
+        for bad in ("a[1:2:3:4]", "a[x]", "..", "a[\"k\" x]", "a[::0]"):
+            with self.assertRaises(ValueError, msg=bad):
+                tokenize_path(bad)
+
+    def test_wildcard_slice_and_quoted_keys(self) -> None:
+        q = Q(self.DOC)
+
+        self.assertEqual(q.path("users[*].tags[-1]").list(), ["y", "z"])
+        self.assertEqual(q.path("items[10:13]").list(), [10, 11, 12])
+        self.assertEqual(q.path("users[0:2].name").list(), ["a", "b"])
+        self.assertEqual(q.path('headers["content-type"]').get(), "json")
+        self.assertEqual(q.path("headers.*").list(), ["json", 1])
+        self.assertEqual(Q(self.DOC, mode=MissingMode.KEEP).path("users[*].email").list(), ["a@x", MISSING, MISSING])
+        with self.assertRaises(KeyError):
+            Q(self.DOC, mode=MissingMode.RAISE).path("users[*].email")
+
+    def test_recursive_descent(self) -> None:
+        doc = {"a": {"email": "1", "b": [{"email": "2"}, {"c": {"email": {"email": "3"}}}]}}
+
+        self.assertEqual(Q(doc).path("..email").list(), ["1", "2", {"email": "3"}, "3"])
+        self.assertEqual(Q(doc).path("a.b..email").list(), ["2", {"email": "3"}, "3"])
+        self.assertEqual(Q([1, [2, {"k": 3}]]).path("..*").list(), [1, [2, {"k": 3}], 2, {"k": 3}, 3])
+
+    def test_exists_and_first_stop_at_first_match(self) -> None:
+        doc = {"a": {"email": "first"}, "z": _Boom(email="later")}
+
+        self.assertTrue(Q(doc).exists("..email"))
+        self.assertFalse(Q({"a": [1, {"b": 2}]}).exists("..email"))
+        self.assertEqual(Q(doc).lazy().path("..email").first(), "first")
+
+    def test_lazy_streams_match_eager(self) -> None:
+        lazy = Q(self.DOC["users"]).lazy().path("[*].tags[*]").map(str.upper)
+
+        self.assertEqual(lazy.list(), ["X", "Y", "Z"])
+        self.assertEqual(Q(self.DOC["users"]).lazy().path("..email").list(), ["a@x"])
@@ -0,0 +1,72 @@
+import threading
+import unittest
+
+from jsonq.api import Q
+from jsonq.operators import Profiler, access, pipe, profile, seq
+
+
+class ProfilerTests(unittest.TestCase):
+    DATA = {"users": [{"name": "a", "active": True}, {"name": "b", "active": False}]}
+
+    def test_pipe_stages_recorded(self) -> None:
+        op = pipe(
+            access.path("users"),
+            seq.filter_items(lambda u: u["active"]),
+            seq.map_items(lambda u: u["name"]),
+        )
+
+        with Q.profile() as prof:
+            self.assertEqual(Q(self.DATA).apply(op).list(), ["a"])
+
+        stats = prof.as_dict()
+        self.assertEqual(stats["pipe[1]:filter_items"]["items_in"], 2)
+        self.assertEqual(stats["pipe[1]:filter_items"]["items_out"], 1)
+        self.assertEqual(stats["pipe"]["calls"], 1)
+        self.assertIn("pipe[2]:map_items", prof.table())
+
+    def test_q_methods_and_memory(self) -> None:
+        with Profiler(memory=True) as prof:
+            Q(list(range(1000))).map(lambda x: [x]).flat().list()
+
+        stats = prof.as_dict()
+        self.assertEqual(stats["map_items"]["items_out"], 1000)
+        self.assertGreater(stats["map_items"]["alloc_bytes"], 0)
+        self.assertIn("alloc KB", str(prof))
+
+    def test_inactive_outside_context(self) -> None:
+        with Q.profile():
+            pass
+        self.assertIsNone(profile.ACTIVE.get())
+
+    def test_nested_stage_peak_counts_toward_outer(self) -> None:
+        op = pipe(seq.map_items(lambda x: [x] * 10), seq.map_items(len))
+
+        with Profiler(memory=True) as prof:
+            Q(list(range(2000))).apply(op)
+
+        stats = prof.as_dict()
+        inner = stats["pipe[0]:map_items"]["alloc_bytes"]
+        self.assertGreater(inner, 0)
+        self.assertGreaterEqual(stats["pipe"]["alloc_bytes"], inner)
+
+    def test_threads_record_separately(self) -> None:
+        started, release = threading.Event(), threading.Event()
+        seen = {}
+
+        def other() -> None:
+            with Q.profile() as prof:
+                started.set()
+                release.wait(5)
+                Q([1, 2]).map(str).list()
+            seen["other"] = prof.as_dict()
+
+        worker = threading.Thread(target=other)
+        with Q.profile() as mine:
+            worker.start()
+            started.wait(5)
+            Q([1, 2, 3]).filter(bool).list()
+            release.set()
+            worker.join()
+
+        self.assertEqual(set(mine.as_dict()), {"filter_items"})
+        self.assertEqual(set(seen["other"]), {"map_items"})
@@ -0,0 +1,46 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+
+
+class ProjectTests(unittest.TestCase):
+    ROWS = [
+        {"id": 1, "name": "a", "profile": {"email": "a@e"}},
+        {"id": 2, "name": "b"},
+    ]
+
+    def test_select_shapes(self) -> None:
+        q = Q(self.ROWS)
+
+        self.assertEqual(
+            q.select("id", "profile.email").list(),
+            [{"id": 1, "profile.email": "a@e"}, {"id": 2}],
+        )
+        self.assertEqual(q.select("id", "profile.email", shape="tuple").list(), [(1, "a@e"), (2, None)])
+        self.assertEqual(
+            q.select("id", "name", shape="columns").get(),
+            {"id": [1, 2], "name": ["a", "b"]},
+        )
+        self.assertEqual(q.project({"email": "profile.email"}).list(), [{"email": "a@e"}, {}])
+
+    def test_missing_modes(self) -> None:
+        kept = Q(self.ROWS, mode=MissingMode.KEEP).project({"e": "profile.email"}, shape="tuple").list()
+        self.assertEqual(kept, [("a@e",), (MISSING,)])
+        with self.assertRaises(KeyError):
+            Q(self.ROWS, mode=MissingMode.RAISE).select("profile.email")
+        with self.assertRaises(ValueError):
+            Q(self.ROWS).select("id", shape="frame")
+
+    def test_lazy_matches_eager(self) -> None:
+        for shape in ("dict", "tuple", "columns"):
+            eager = Q(self.ROWS).select("id", "profile.email", shape=shape).get()
+            lazy = Q(self.ROWS).lazy().select("id", "profile.email", shape=shape).get()
+            self.assertEqual(lazy, eager)
+        with self.assertRaises(KeyError):
+            Q(self.ROWS, mode=MissingMode.RAISE).lazy().select("profile.email").list()
+
+    def test_pluck_without_nested_lists_reuses_result(self) -> None:
+        self.assertEqual(Q(self.ROWS).pluck("id").list(), [1, 2])
+        self.assertEqual(Q([{"t": [1, 2]}, {"t": 3}, {}]).pluck("t").list(), [1, 2, 3])
+
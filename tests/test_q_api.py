@@ -1,7 +1,9 @@
 import unittest
+from collections import Counter
 
 from jsonq.api import Q
 from jsonq.core.missing import MISSING, MissingMode
+from jsonq.core.value import JsonValue
 
 
 class QOperatorTests(unittest.TestCase):
@@ -20,3 +22,25 @@ class QOperatorTests(unittest.TestCase):
 
         self.assertEqual(keep, [1, MISSING])
         self.assertEqual(drop, [1])
+
+    def test_direct_access_matches_operator_semantics(self) -> None:
+        doc = {"a": {"b": {"c": [1, 2]}}, "counts": Counter(x=1), "rows": [{"k": 1}, {"k": [2, 3]}]}
+
+        self.assertEqual(Q(doc).path("a.b.c[1]").get(), 2)
+        self.assertEqual(Q(doc)["a"]["b"]["c"][-1].get(), 2)
+        self.assertEqual(Q(doc).path("rows.k").list(), [1, 2, 3])
+        self.assertEqual(Q(doc).path("counts.y").get("d"), "d")
+        self.assertIs(Q(doc, mode=MissingMode.KEEP).path("a.x.c").get(MISSING), MISSING)
+        with self.assertRaises(KeyError):
+            Q(doc, mode=MissingMode.RAISE).path("a.b.x")
+        with self.assertRaises(KeyError):
+            Q(doc, mode=MissingMode.RAISE)["nope"]
+
+    def test_direct_access_keeps_policy_without_parent_value(self) -> None:
+        parent = Q(JsonValue({"a": {"b": 1}}, mode=MissingMode.KEEP))
+        child = parent.path("a")
+
+        self.assertIs(child._base.value, MISSING)
+        self.assertIs(child._v.mode, MissingMode.KEEP)
+        self.assertEqual(child["b"].get(), 1)
+        self.assertEqual(child.map(lambda x: x).list(), [{"b": 1}])
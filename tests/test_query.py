@@ -0,0 +1,74 @@
+import unittest
+
+from jsonq.api import Q
+from jsonq.operators.query import compile_query, explain_query, parse_query
+
+
+class QueryTests(unittest.TestCase):
+    DATA = {
+        "users": [
+            {"name": "a", "active": True, "age": 30, "tags": ["x", "y"]},
+            {"name": "b", "active": False, "age": 20},
+            {"name": "c", "active": True, "age": 25},
+        ]
+    }
+
+    def test_select_and_project(self) -> None:
+        self.assertEqual(Q(self.DATA).query("users[] | select(.active) | .name").list(), ["a", "c"])
+        self.assertEqual(
+            Q(self.DATA).query('.users[] | select(.age >= 25 and .name != "a") | .name').list(),
+            ["c"],
+        )
+        self.assertEqual(Q(self.DATA).query("users[] | select(not .active) | .age").list(), [20])
+
+    def test_select_uses_jq_truthiness(self) -> None:
+        rows = [{"x": 0}, {"x": ""}, {"x": []}, {"x": None}, {"x": False}, {}]
+        self.assertEqual(Q(rows).query(".[] | select(.x)").list(), [{"x": 0}, {"x": ""}, {"x": []}])
+        bare = Q(rows).query(".[] | select(.x) | .x").list()
+        self.assertEqual(bare, Q(rows).query(".[] | select(.x and true) | .x").list())
+
+    def test_builtins(self) -> None:
+        q = Q(self.DATA)
+        self.assertEqual(q.query(".users | sort_by(.age) | map(.name)").get(), ["b", "c", "a"])
+        self.assertEqual(q.query(".users | length").get(), 3)
+        self.assertEqual(q.query(".users[-1] | keys").get(), ["active", "age", "name"])
+        self.assertEqual(q.query("users[].tags[] | first").get(), "x")
+        self.assertEqual(q.query(".users | map(.missing)").get(), [None, None, None])
+
+    def test_jq_semantics(self) -> None:
+        doc = {"users": [{"tags": ["x", "y"]}, {"tags": ["z"]}, {"name": "n"}]}
+        # Paths after [] apply to each item: arrays stay whole.
+        self.assertEqual(Q(doc).query("users[] | .tags").list(), [["x", "y"], ["z"]])
+        self.assertEqual(Q(doc).query("users[].tags[]").list(), ["x", "y", "z"])
+        self.assertEqual(Q(doc).query("users[].tags[0]").list(), ["x", "z"])
+        self.assertEqual(Q(doc).query("users | .tags").list(), ["x", "y", "z"])
+        # unique sorts, in jq's order across types.
+        values = [3, "b", 1, None, True, "a", 1.0, [1], False, {"a": 1}, 3, True]
+        self.assertEqual(Q(values).query("unique").list(), [None, False, True, 1, 3, "a", "b", [1], {"a": 1}])
+        rows = [{"k": 2, "i": 0}, {"k": 1, "i": 1}, {"k": 2, "i": 2}]
+        self.assertEqual(Q(rows).query("unique_by(.k) | map(.i)").get(), [1, 0])
+        # Booleans are not numbers.
+        flags = [{"n": 1}, {"n": True}, {"n": 1.0}, {"n": False}, {"n": 0}]
+        self.assertEqual(Q(flags).query(".[] | select(.n == 1) | .n").list(), [1, 1.0])
+        self.assertEqual(Q(flags).query(".[] | select(.n != 0) | .n").list(), [1, True, 1.0, False])
+
+    def test_optimizer_merges_and_pushes_down(self) -> None:
+        plan = explain_query(".users | . | sort_by(.age) | select(.active) | select(.age > 1) | map(.a) | map(.b)")
+        lines = plan.splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith("Select(cond=BoolOp(op='and'"))
+        self.assertTrue(lines[2].startswith("Builtin(name='sort_by'"))
+        self.assertIn("('a', 'b')", lines[3])
+
+    def test_compiled_once_and_errors(self) -> None:
+        self.assertIs(compile_query("users[] | .name"), compile_query("users[] | .name"))
+        with self.assertRaises(ValueError):
+            parse_query("users[] | select(.a")
+        with self.assertRaises(ValueError):
+            parse_query("users | sort_by(.a[])")
+
+    def test_lazy_query(self) -> None:
+        q = Q(self.DATA).lazy().path("users").query("select(.active) | .name")
+        self.assertEqual(q.list(), ["a", "c"])
+
@@ -0,0 +1,43 @@
+import io
+import json
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.ops.serialize import iter_json, to_json
+
+
+class SerializeTests(unittest.TestCase):
+    DOCS = [
+        [],
+        {},
+        [1, "é", {"a": [1, {"b": None}]}],
+        {"k": {"n": [True, 2.5]}, "s": "x"},
+        "scalar",
+    ]
+
+    def test_chunks_match_one_shot_encoding(self) -> None:
+        for doc in self.DOCS:
+            for indent in (None, 0, 2):
+                expected = json.dumps(doc, ensure_ascii=False, indent=indent)
+                self.assertEqual("".join(iter_json(doc, indent=indent, chunk_size=4)), expected)
+
+    def test_missing_detected_during_encoding(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Missing values present"):
+            to_json({"a": [1, MISSING]})
+        with self.assertRaises(TypeError):
+            to_json({"a": object()})
+
+    def test_q_dump_and_lazy_stream(self) -> None:
+        buf = io.StringIO()
+        Q({"a": [1, 2]}).dump(buf, indent=2)
+        self.assertEqual(buf.getvalue(), json.dumps({"a": [1, 2]}, indent=2))
+
+        lines = io.StringIO('{"id": 1}\n{"id": 2}\n')
+        streamed = "".join(Q.from_ndjson(lines).pluck("id").map(lambda x: x * 10).iter_json())
+        self.assertEqual(streamed, "[10, 20]")
+
+    def test_keep_mode_missing_raises_on_dump(self) -> None:
+        q = Q([{"a": 1}, {}], mode=MissingMode.KEEP).pluck("a")
+        with self.assertRaises(ValueError):
+            q.dump(io.StringIO())
@@ -0,0 +1,90 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.missing import MISSING, MissingMode
+from jsonq.ops.stream import iter_array, iter_loads
+
+
+class NdjsonSourceTests(unittest.TestCase):
+    LINES = '{"id": 1, "level": "info"}\n\n{"id": 2, "level": "error"}\n{"id": 3, "level": "error"}\n'
+
+    def test_pipeline_over_file_object(self) -> None:
+        q = Q.from_ndjson(io.StringIO(self.LINES))
+
+        ids = q.filter(lambda r: r["level"] == "error").pluck("id").list()
+
+        self.assertEqual(ids, [2, 3])
+
+    def test_path_source_is_reiterable(self) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False) as fp:
+            fp.write(self.LINES)
+        try:
+            q = Q.from_ndjson(fp.name).pluck("level").unique()
+            self.assertEqual(q.list(), ["info", "error"])
+            self.assertEqual(q.list(), ["info", "error"])
+        finally:
+            os.unlink(fp.name)
+
+    def test_first_stops_reading(self) -> None:
+        consumed = []
+
+        def lines():
+            for line in self.LINES.splitlines(True):
+                consumed.append(line)
+                yield line
+
+        first = Q.from_ndjson(lines()).pluck("id").first()
+
+        self.assertEqual(first, 1)
+        self.assertEqual(len(consumed), 1)
+
+    def test_invalid_line_reports_line_number(self) -> None:
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(iter_loads(io.StringIO('{"a": 1}\n{oops}\n')))
+
+
+class JsonArrayStreamTests(unittest.TestCase):
+    DOC = {
+        "meta": {"note": "skip ]} \" me", "nested": [[{"x": 1}]]},
+        "data": {"items": [{"id": i, "name": f"n{i}", "tags": ["t"]} for i in range(20)]},
+    }
+
+    def test_path_pushdown_matches_loaded_document(self) -> None:
+        text = json.dumps(self.DOC)
+        for chunk_size in (1, 7, 4096):
+            streamed = Q.from_json_stream(io.StringIO(text), chunk_size=chunk_size).path("data.items")
+            self.assertEqual(streamed.list(), self.DOC["data"]["items"])
+
+    def test_numbers_split_at_every_offset(self) -> None:
+        numbers = [1.5, -0.25, 2e-07, 31e10, -4.5e+20, 12345, 6.0]
+        text = json.dumps(numbers).replace("e-07", "E-07")
+        for chunk_size in range(1, len(text) + 1):
+            self.assertEqual(Q.from_json_stream(io.StringIO(text), chunk_size=chunk_size).list(), numbers, chunk_size)
+
+    def test_filter_over_binary_stream(self) -> None:
+        raw = io.BytesIO(json.dumps(self.DOC).encode())
+
+        q = Q.from_json_stream(raw, chunk_size=16).path("data.items").filter(lambda r: r["id"] > 17)
+
+        self.assertEqual(q.pluck("id").list(), [18, 19])
+
+    def test_top_level_array_vectorizes_remaining_keys(self) -> None:
+        records = self.DOC["data"]["items"]
+        text = json.dumps(records)
+
+        self.assertEqual(Q.from_json_stream(io.StringIO(text)).pluck("tags").list(), Q(records).pluck("tags").list())
+
+    def test_iter_array_missing_key_follows_mode(self) -> None:
+        text = json.dumps(self.DOC)
+        self.assertEqual(list(iter_array(io.StringIO(text), ("data", "nope"))), [])
+        self.assertEqual(list(iter_array(io.StringIO(text), ("data", "nope"), mode=MissingMode.KEEP)), [MISSING])
+        with self.assertRaises(KeyError):
+            list(iter_array(io.StringIO(text), ("meta", "note", "x"), mode=MissingMode.RAISE))
+
+    def test_non_array_target_is_rejected(self) -> None:
+        with self.assertRaisesRegex(TypeError, "meta is not an array"):
+            Q.from_json_stream(io.StringIO(json.dumps(self.DOC))).path("meta").get()
@@ -0,0 +1,122 @@
+import io
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from jsonq.api import Q
+from jsonq.core.predicate import Where, raw_test
+
+LINES = [
+    '{"status": "error", "ms": 900, "svc": "a"}',
+    '{"status":"info","ms":12,"svc":"b"}',
+    '{"status" :  "error" , "ms": 5e2, "svc": "c"}',
+    '{"status": "\\u0065rror", "ms": 501.5, "svc": "d"}',
+    '{"msg": "status: error, ms: 900", "svc": "e"}',
+    '{"status": "warn", "ms": true, "meta": {"ms": 1000}, "svc": "f"}',
+    '{"status": "ok", "ms": -3, "svc": "g"}',
+    "",
+    '{"status": ["error"], "ms": "900", "svc": "h"}',
+]
+RECORDS = [json.loads(line) for line in LINES if line]
+
+
+def _svc(rows):
+    return [r["svc"] for r in rows]
+
+
+class WhereTests(unittest.TestCase):
+    def test_semantics(self) -> None:
+        q = Q(RECORDS)
+        self.assertEqual(_svc(q.where("status", "==", "error").list()), ["a", "c", "d"])
+        # A missing path never matches, not even "!=".
+        self.assertEqual(_svc(q.where("status", "!=", "error").list()), ["b", "f", "g", "h"])
+        self.assertEqual(_svc(q.where("ms", ">", 500).list()), ["a", "d"])
+        self.assertEqual(_svc(q.where("ms", "<=", 12).list()), ["b", "g"])
+        # Booleans are not numbers, and strings only order against strings.
+        self.assertEqual(_svc(q.where("ms", "==", 1).list()), [])
+        self.assertEqual(_svc(q.where("svc", ">=", "g").list()), ["g", "h"])
+        self.assertEqual(_svc(q.where("meta.ms", ">", 999).list()), ["f"])
+        self.assertEqual(_svc(q.where("status", "in", ["ok", "info"]).list()), ["b", "g"])
+        self.assertEqual(Q({"status": "ok"}).where("status", "==", "ok").list(), [{"status": "ok"}])
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            Where("status", "~", "x")
+        with self.assertRaises(ValueError):
+            Where("items[*].status", "==", "x")
+        with self.assertRaises(TypeError):
+            Where("ms", ">", None)
+        with self.assertRaises(TypeError):
+            Where("status", "in", "error")
+
+    def test_pushdown_matches_filter(self) -> None:
+        text = "\n".join(LINES) + "\n"
+        cases = [
+            ("status", "==", "error"),
+            ("status", "in", ["error", "ok"]),
+            ("ms", ">", 500),
+            ("ms", "==", 500),
+            ("ms", "<", 0),
+            ("meta.ms", ">=", 1000),
+            ("status", "!=", "info"),
+            ("svc", ">", "c"),
+            ("ms", "==", True),
+        ]
+        for path, op, value in cases:
+            pred = Where(path, op, value)
+            expected = [r for r in RECORDS if pred(r)]
+            for data in (text, text.encode()):
+                fp = io.StringIO(data) if isinstance(data, str) else io.BytesIO(data)
+                lazy = Q.from_ndjson(fp).where(path, op, value)
+                self.assertEqual(lazy.list(), expected, (path, op, value))
+
+    def test_index_terminated_paths(self) -> None:
+        rows = [{"tags": ["x", "y"], "n": [600]}, {"tags": ["y"], "n": [10]}, {"n": 700}]
+        text = "".join(json.dumps(r) + "\n" for r in rows)
+        cases = [("tags[0]", "==", "x"), ("n[0]", ">", 500), ("tags[-1]", "in", ["y", "z"]), ("n[0]", "<", 20)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rows.ndjson")
+            with open(path, "w") as fp:
+                fp.write(text)
+            for case in cases:
+                expected = Q(rows).where(*case).list()
+                self.assertTrue(expected, case)
+                self.assertEqual(Q.from_ndjson(io.StringIO(text)).where(*case).list(), expected, case)
+                self.assertEqual(Q.scan(path, workers=1).where(*case).list(), expected, case)
+
+    def test_raw_test_skips_without_decoding(self) -> None:
+        test = raw_test([Where("status", "==", "error"), Where("ms", ">", 500)])
+        self.assertTrue(test(LINES[0].encode()))
+        self.assertFalse(test(LINES[1]))
+        self.assertFalse(test(LINES[4]))
+        self.assertTrue(test(LINES[3]))  # \u escapes are left to the decoder
+        self.assertIsNone(raw_test([Where("status", "!=", "error")]))
+        # Lines that cannot match are never decoded, so bad JSON there is not reported.
+        fp = io.StringIO('{"status": "info", oops\n{"status": "error"}\n')
+        self.assertEqual(Q.from_ndjson(fp).where("status", "==", "error").list(), [{"status": "error"}])
+        with self.assertRaises(ValueError):
+            Q.from_ndjson(io.StringIO('{"status": "error", oops\n')).where("status", "==", "error").list()
+
+    def test_pushdown_only_at_chain_head(self) -> None:
+        text = "\n".join(LINES)
+        pushed = Q.from_ndjson(io.StringIO(text)).where("ms", ">", 500)
+        self.assertEqual(pushed.explain(), "source")
+        later = Q.from_ndjson(io.StringIO(text)).pluck("meta").where("ms", ">", 500)
+        self.assertEqual(later.explain(), "fused[pluck('meta') -> filter]")
+        self.assertEqual(later.list(), [{"ms": 1000}])
+
+    def test_dataset_and_pickle(self) -> None:
+        pred = pickle.loads(pickle.dumps(Where("ms", ">", 500)))
+        self.assertTrue(pred({"ms": 501}))
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "a.ndjson"), "w") as fp:
+                fp.write("\n".join(LINES) + "\n")
+            with open(os.path.join(tmp, "b.json"), "w") as fp:
+                json.dump([{"status": "error", "ms": 700, "svc": "z"}, {"status": "ok", "svc": "y"}], fp)
+            ds = Q.scan(os.path.join(tmp, "*"), workers=1, shard_bytes=64).where("status", "==", "error")
+            self.assertGreater(len(ds.shards), 2)
+            self.assertEqual(_svc(ds.list()), ["a", "c", "d", "z"])
+            self.assertEqual(ds.where("ms", ">", 600).count(), 2)
+